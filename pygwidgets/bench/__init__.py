@@ -0,0 +1,538 @@
+"""
+pygwidgets.bench - headless benchmarks of the pygwidgets widget classes
+
+Times the hot paths of pygwidgets at a range of scales (by default 10, 100, 1,000, and 10,000 widgets):
+    - construction of every widget class
+    - handleEvent and draw of every widget class
+    - DisplayText.setValue
+    - InputText typing
+    - Image rotate, scale, and flip
+    - update of playing Animations, one at a time and through an AnimationScheduler
+
+Every call is timed on its own, and the results are reported as latency percentiles
+(in microseconds per call).  Results can be written to a JSON file, and compared against a
+JSON file saved by an earlier run, so that a slower hot path shows up as a regression.
+
+Typical use (from the command line, no window is shown):
+
+    | python -m pygwidgets.bench
+    | python -m pygwidgets.bench --scales 10,100 --json baseline.json
+    | python -m pygwidgets.bench --scales 10,100 --baseline baseline.json
+
+    Use --help to see all options.  When a baseline is given, the exit status is 1 if any
+    operation got slower than the threshold.  Times of calls that take only a few microseconds
+    vary a lot on a busy or shared machine, so there you may need a larger --threshold.
+
+The functions runBenchmarks, compareResults, saveResults, loadResults, and printResults
+can also be called from your own code.
+
+"""
+
+import os
+import sys
+import json
+import time
+import math
+import shutil
+import argparse
+import platform
+import tempfile
+
+import pygame
+from pygame.locals import *
+import pygwidgets
+
+DEFAULT_SCALES = (10, 100, 1000, 10000)
+DEFAULT_CALL_BUDGET = 20000  # number of timed calls per operation and scale (sets the number of passes)
+MAX_PASSES = 100
+DEFAULT_THRESHOLD = .25  # an operation whose median is more than 25% slower than the baseline is a regression
+PERCENTILES = (50, 90, 99)
+WINDOW_WIDTH = 640
+WINDOW_HEIGHT = 640
+
+
+def computePercentile(sortedTimesList, percent):
+    """Returns a percentile of a sorted list of times (linear interpolation between the closest ranks)
+
+    Parameters:
+        | sortedTimesList - a sorted list of numbers
+        | percent - the percentile to compute (0 to 100)
+
+    """
+    if len(sortedTimesList) == 1:
+        return sortedTimesList[0]
+    rank = (len(sortedTimesList) - 1) * (percent / 100)
+    lowIndex = math.floor(rank)
+    highIndex = min(lowIndex + 1, len(sortedTimesList) - 1)
+    fraction = rank - lowIndex
+    return sortedTimesList[lowIndex] + ((sortedTimesList[highIndex] - sortedTimesList[lowIndex]) * fraction)
+
+
+def summarizeTimes(timesNsList, nWidgets, nPasses):
+    """Builds a dictionary of statistics (in microseconds) from a list of call times in nanoseconds"""
+    sortedTimesList = sorted(timesNsList)
+    summaryDict = {'nWidgets': nWidgets, 'nPasses': nPasses, 'nCalls': len(sortedTimesList)}
+    for percent in PERCENTILES:
+        summaryDict['p' + str(percent)] = computePercentile(sortedTimesList, percent) / 1000
+    summaryDict['max'] = sortedTimesList[-1] / 1000
+    summaryDict['mean'] = (sum(sortedTimesList) / len(sortedTimesList)) / 1000
+    return summaryDict
+
+
+#
+#
+# ASSETS AND WIDGET BUILDERS
+#
+#
+
+def _makeAssets(folder):
+    # Internal function, saves small images to a temporary folder, so no asset files are needed
+    # Returns a dictionary of names to full paths
+    def saveImage(name, size, color):
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        pygame.draw.rect(surface, (0, 0, 0), surface.get_rect(), 1)
+        path = os.path.join(folder, name + '.png')
+        pygame.image.save(surface, path)
+        return path
+
+    assetsDict = {
+        'up': saveImage('up', (80, 30), (170, 170, 170)),
+        'down': saveImage('down', (80, 30), (140, 140, 140)),
+        'over': saveImage('over', (80, 30), (210, 210, 210)),
+        'disabled': saveImage('disabled', (80, 30), (220, 220, 220)),
+        'on': saveImage('on', (16, 16), (0, 160, 0)),
+        'off': saveImage('off', (16, 16), (160, 0, 0)),
+        'sheet': saveImage('sheet', (128, 32), (0, 0, 160)),
+    }
+    for frameNumber in range(4):
+        name = 'frame' + str(frameNumber)
+        assetsDict[name] = saveImage(name, (32, 32), (60 * frameNumber, 0, 200))
+    return assetsDict
+
+
+def _getLoc(widgetNumber):
+    # Internal function, spreads widgets across the window
+    return ((widgetNumber * 37) % (WINDOW_WIDTH - 100), (widgetNumber * 53) % (WINDOW_HEIGHT - 40))
+
+
+def _buildWidgetBuilders(window, assetsDict):
+    # Internal function, returns a dictionary of class name -> function(widgetNumber) that builds one widget
+    framesList = [(assetsDict['frame' + str(frameNumber)], .1) for frameNumber in range(4)]
+    imagesDict = {'up': assetsDict['up'], 'down': assetsDict['down'], 'over': assetsDict['over']}
+    return {
+        'TextButton': lambda n: pygwidgets.TextButton(window, _getLoc(n), 'Button ' + str(n)),
+        'CustomButton': lambda n: pygwidgets.CustomButton(window, _getLoc(n), assetsDict['up'],
+                                        down=assetsDict['down'], over=assetsDict['over'],
+                                        disabled=assetsDict['disabled']),
+        'TextCheckBox': lambda n: pygwidgets.TextCheckBox(window, _getLoc(n), 'Check ' + str(n)),
+        'CustomCheckBox': lambda n: pygwidgets.CustomCheckBox(window, _getLoc(n),
+                                        on=assetsDict['on'], off=assetsDict['off']),
+        'TextRadioButton': lambda n: pygwidgets.TextRadioButton(window, _getLoc(n),
+                                        'Bench Text Group ' + str(n // 10), 'Radio ' + str(n)),
+        'CustomRadioButton': lambda n: pygwidgets.CustomRadioButton(window, _getLoc(n),
+                                        'Bench Custom Group ' + str(n // 10),
+                                        on=assetsDict['on'], off=assetsDict['off']),
+        'DisplayText': lambda n: pygwidgets.DisplayText(window, _getLoc(n), 'Text ' + str(n)),
+        'InputText': lambda n: pygwidgets.InputText(window, _getLoc(n), 'Input ' + str(n), width=120),
+        'Dragger': lambda n: pygwidgets.Dragger(window, _getLoc(n), assetsDict['up'],
+                                        down=assetsDict['down'], over=assetsDict['over']),
+        'Image': lambda n: pygwidgets.Image(window, _getLoc(n), assetsDict['frame0']),
+        'ImageCollection': lambda n: pygwidgets.ImageCollection(window, _getLoc(n), imagesDict, 'up'),
+        'Animation': lambda n: pygwidgets.Animation(window, _getLoc(n), framesList, loop=True),
+        'SpriteSheetAnimation': lambda n: pygwidgets.SpriteSheetAnimation(window, _getLoc(n),
+                                        assetsDict['sheet'], 4, 32, 32, .1, loop=True),
+    }
+
+
+def _buildMouseEvents(oWidget):
+    # Internal function, builds a cycle of mouse events over (and then off of) a widget:
+    # move over, press, release, move away
+    center = oWidget.getRect().center
+    return [pygame.event.Event(MOUSEMOTION, pos=center, rel=(1, 1), buttons=(0, 0, 0)),
+            pygame.event.Event(MOUSEBUTTONDOWN, pos=center, button=1),
+            pygame.event.Event(MOUSEBUTTONUP, pos=center, button=1),
+            pygame.event.Event(MOUSEMOTION, pos=(WINDOW_WIDTH - 1, WINDOW_HEIGHT - 1), rel=(1, 1), buttons=(0, 0, 0))]
+
+
+#
+#
+# OPERATIONS
+#
+#
+# Each operation is a function(context, nWidgets, nPasses) that returns a list of call times in nanoseconds.
+# The context dictionary holds the window, the widget builders, and the asset paths.
+
+def _timeConstruction(className):
+    def timeOperation(context, nWidgets, nPasses):
+        builder = context['builders'][className]
+        timesList = []
+        for passNumber in range(nPasses):
+            widgetsList = []
+            for widgetNumber in range(nWidgets):
+                startNs = time.perf_counter_ns()
+                oWidget = builder(widgetNumber)
+                timesList.append(time.perf_counter_ns() - startNs)
+                widgetsList.append(oWidget)
+            del widgetsList
+        return timesList
+    return timeOperation
+
+
+def _timeHandleEvent(className):
+    def timeOperation(context, nWidgets, nPasses):
+        builder = context['builders'][className]
+        widgetsList = [builder(widgetNumber) for widgetNumber in range(nWidgets)]
+        eventsListsList = [_buildMouseEvents(oWidget) for oWidget in widgetsList]
+        timesList = []
+        for passNumber in range(nPasses):
+            eventIndex = passNumber % 4
+            for oWidget, eventsList in zip(widgetsList, eventsListsList):
+                event = eventsList[eventIndex]
+                startNs = time.perf_counter_ns()
+                oWidget.handleEvent(event)
+                timesList.append(time.perf_counter_ns() - startNs)
+        return timesList
+    return timeOperation
+
+
+def _timeDraw(className):
+    def timeOperation(context, nWidgets, nPasses):
+        builder = context['builders'][className]
+        window = context['window']
+        widgetsList = [builder(widgetNumber) for widgetNumber in range(nWidgets)]
+        timesList = []
+        for passNumber in range(nPasses):
+            window.fill((0, 0, 0))
+            for oWidget in widgetsList:
+                startNs = time.perf_counter_ns()
+                oWidget.draw()
+                timesList.append(time.perf_counter_ns() - startNs)
+        return timesList
+    return timeOperation
+
+
+def _timeDisplayTextSetValue(context, nWidgets, nPasses):
+    builder = context['builders']['DisplayText']
+    widgetsList = [builder(widgetNumber) for widgetNumber in range(nWidgets)]
+    timesList = []
+    for passNumber in range(nPasses):
+        for widgetNumber, oWidget in enumerate(widgetsList):
+            newText = 'Score: ' + str((passNumber * nWidgets) + widgetNumber)  # a new value every call
+            startNs = time.perf_counter_ns()
+            oWidget.setValue(newText)
+            timesList.append(time.perf_counter_ns() - startNs)
+    return timesList
+
+
+def _timeInputTextTyping(context, nWidgets, nPasses):
+    builder = context['builders']['InputText']
+    widgetsList = [builder(widgetNumber) for widgetNumber in range(nWidgets)]
+    for oWidget in widgetsList:
+        oWidget.focus = True  # every field gets keys (giveFocus would also change the key repeat)
+    keysList = [pygame.event.Event(KEYDOWN, key=K_a + (letterNumber % 26), mod=0, scancode=0,
+                                   unicode=chr(ord('a') + (letterNumber % 26)))
+                                   for letterNumber in range(9)]
+    keysList.append(pygame.event.Event(KEYDOWN, key=K_BACKSPACE, mod=0, scancode=0, unicode='\b'))
+    timesList = []
+    for passNumber in range(nPasses):
+        event = keysList[passNumber % len(keysList)]
+        for oWidget in widgetsList:
+            startNs = time.perf_counter_ns()
+            oWidget.handleEvent(event)
+            timesList.append(time.perf_counter_ns() - startNs)
+    return timesList
+
+
+def _timeImageTransform(transformName):
+    def timeOperation(context, nWidgets, nPasses):
+        builder = context['builders']['Image']
+        widgetsList = [builder(widgetNumber) for widgetNumber in range(nWidgets)]
+        timesList = []
+        for passNumber in range(nPasses):
+            if transformName == 'rotate':
+                transform = lambda oWidget: oWidget.rotate(5)
+            elif transformName == 'scale':
+                percent = 90 if (passNumber % 2) == 0 else 110
+                transform = lambda oWidget: oWidget.scale(percent)
+            else:
+                transform = lambda oWidget: oWidget.flipHorizontal()
+            for oWidget in widgetsList:
+                startNs = time.perf_counter_ns()
+                transform(oWidget)
+                timesList.append(time.perf_counter_ns() - startNs)
+        return timesList
+    return timeOperation
+
+
+def _timeAnimationUpdate(context, nWidgets, nPasses):
+    builder = context['builders']['Animation']
+    animationsList = [builder(widgetNumber) for widgetNumber in range(nWidgets)]
+    for oAnimation in animationsList:
+        oAnimation.start()
+    timesList = []
+    for passNumber in range(nPasses):
+        for oAnimation in animationsList:
+            startNs = time.perf_counter_ns()
+            oAnimation.update()
+            timesList.append(time.perf_counter_ns() - startNs)
+    return timesList
+
+
+def _timeSchedulerUpdate(context, nWidgets, nPasses):
+    # One call updates all of the animations, so there is one time per pass
+    builder = context['builders']['Animation']
+    oScheduler = pygwidgets.AnimationScheduler()
+    for widgetNumber in range(nWidgets):
+        oAnimation = builder(widgetNumber)
+        oScheduler.add(oAnimation)
+        oAnimation.start()
+    timesList = []
+    for passNumber in range(max(nPasses, 20)):
+        startNs = time.perf_counter_ns()
+        oScheduler.update()
+        timesList.append(time.perf_counter_ns() - startNs)
+    return timesList
+
+
+def getOperations():
+    """Returns a dictionary of operation names to functions that time them"""
+    operationsDict = {}
+    classNamesList = ['TextButton', 'CustomButton', 'TextCheckBox', 'CustomCheckBox', 'TextRadioButton',
+                      'CustomRadioButton', 'DisplayText', 'InputText', 'Dragger', 'Image',
+                      'ImageCollection', 'Animation', 'SpriteSheetAnimation']
+    for className in classNamesList:
+        operationsDict['construct.' + className] = _timeConstruction(className)
+    for className in classNamesList:
+        if className not in ('DisplayText', 'ImageCollection', 'SpriteSheetAnimation'):
+            operationsDict['handleEvent.' + className] = _timeHandleEvent(className)
+    for className in classNamesList:
+        operationsDict['draw.' + className] = _timeDraw(className)
+    operationsDict['DisplayText.setValue'] = _timeDisplayTextSetValue
+    operationsDict['InputText.typing'] = _timeInputTextTyping
+    operationsDict['Image.rotate'] = _timeImageTransform('rotate')
+    operationsDict['Image.scale'] = _timeImageTransform('scale')
+    operationsDict['Image.flipHorizontal'] = _timeImageTransform('flipHorizontal')
+    operationsDict['Animation.update'] = _timeAnimationUpdate
+    operationsDict['AnimationScheduler.update'] = _timeSchedulerUpdate
+    return operationsDict
+
+
+#
+#
+# RUNNING, SAVING, AND COMPARING
+#
+#
+
+def measureCalibration(window, nRuns=15):
+    """Times a fixed piece of work (Python code and small blits), to measure the speed of this machine right now.
+
+    Comparisons against a baseline divide by the change in this time, so a machine that is busier (or
+    slower) than when the baseline was saved does not show up as a regression in every operation.
+
+    Returns:
+        | the median time of the work in microseconds
+
+    """
+    surface = pygame.Surface((32, 32))
+    timesList = []
+    for runNumber in range(nRuns):
+        startNs = time.perf_counter_ns()
+        total = 0
+        for number in range(2000):
+            total = total + len(str(number))
+        for number in range(200):
+            window.blit(surface, (number, number))
+        timesList.append(time.perf_counter_ns() - startNs)
+    return computePercentile(sorted(timesList), 50) / 1000
+
+
+def runBenchmarks(scalesList=DEFAULT_SCALES, operationNamesList=None, callBudget=DEFAULT_CALL_BUDGET,
+                  verbose=True):
+    """Runs the benchmarks and returns a results dictionary (that can be saved with saveResults)
+
+    Optional keyword parameters:
+        | scalesList - a list of numbers of widgets to run each operation with (default 10, 100, 1000, 10000)
+        | operationNamesList - a list of operation names to run (default None, meaning all operations)
+        |     Names can end with '*' to pick all operations that start with the same text (e.g. 'draw.*')
+        | callBudget - about how many calls to time for each operation at each scale (default 20000)
+        | verbose - print each result as it is measured (default True)
+
+    Returns:
+        | a dictionary with information about the run, and a 'results' dictionary whose
+        |     keys look like 'draw.TextButton@1000'
+
+    """
+    operationsDict = getOperations()
+    if operationNamesList is not None:
+        operationsDict = {name: function for name, function in operationsDict.items()
+                          if _matchesName(name, operationNamesList)}
+
+    pygame.init()
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    assetsFolder = tempfile.mkdtemp(prefix='pygwidgets_bench_')
+    try:
+        assetsDict = _makeAssets(assetsFolder)
+        context = {'window': window, 'assets': assetsDict,
+                   'builders': _buildWidgetBuilders(window, assetsDict)}
+        resultsDict = {}
+        calibrationsList = []
+        if verbose:
+            _printHeader()
+        for operationName, timeOperation in operationsDict.items():
+            timeOperation(context, min(scalesList), 1)  # warm up caches and code paths, not timed
+            calibrationUs = measureCalibration(window)  # speed of the machine while this operation runs
+            calibrationsList.append(calibrationUs)
+            for nWidgets in scalesList:
+                nPasses = max(1, min(MAX_PASSES, callBudget // nWidgets))
+                timesList = timeOperation(context, nWidgets, nPasses)
+                summaryDict = summarizeTimes(timesList, nWidgets, nPasses)
+                summaryDict['operation'] = operationName
+                summaryDict['calibrationUs'] = calibrationUs
+                key = operationName + '@' + str(nWidgets)
+                resultsDict[key] = summaryDict
+                if verbose:
+                    _printRow(key, summaryDict)
+    finally:
+        shutil.rmtree(assetsFolder, ignore_errors=True)
+
+    return {'pygwidgetsVersion': pygwidgets.getPygwidgetsVersion(),
+            'pygameVersion': pygame.version.ver,
+            'pythonVersion': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'scales': list(scalesList),
+            'calibrationUs': computePercentile(sorted(calibrationsList), 50),
+            'results': resultsDict}
+
+
+def _matchesName(operationName, operationNamesList):
+    # Internal function, checks an operation name against a list of names (that may end with '*')
+    for name in operationNamesList:
+        if name.endswith('*'):
+            if operationName.startswith(name[:-1]):
+                return True
+        elif operationName == name:
+            return True
+    return False
+
+
+def saveResults(resultsDict, path):
+    """Writes a results dictionary (from runBenchmarks) to a JSON file"""
+    with open(path, 'w') as resultsFile:
+        json.dump(resultsDict, resultsFile, indent=2, sort_keys=True)
+
+
+def loadResults(path):
+    """Reads a results dictionary from a JSON file written by saveResults"""
+    with open(path) as resultsFile:
+        return json.load(resultsFile)
+
+
+def compareResults(resultsDict, baselineDict, threshold=DEFAULT_THRESHOLD, statName='p50', normalize=True):
+    """Compares results against a baseline
+
+    Parameters:
+        | resultsDict - results from runBenchmarks (or loadResults)
+        | baselineDict - earlier results to compare against
+
+    Optional keyword parameters:
+        | threshold - how much slower (as a fraction) an operation can get before it is a regression (default .25)
+        | statName - which statistic to compare: 'p50', 'p90', 'p99', 'mean', or 'max' (default 'p50')
+        | normalize - divide each ratio by the change in the calibration time (see measureCalibration),
+        |     to allow for a machine that is busier or slower than when the baseline was saved (default True)
+
+    Returns:
+        | a list of (key, baselineValue, newValue, ratio, isRegression) tuples, for keys found in both
+
+    """
+    comparisonsList = []
+    baselineResultsDict = baselineDict['results']
+    for key, summaryDict in resultsDict['results'].items():
+        if key not in baselineResultsDict:
+            continue
+        baselineValue = baselineResultsDict[key][statName]
+        newValue = summaryDict[statName]
+        machineRatio = 1.0
+        if normalize and ('calibrationUs' in summaryDict) and ('calibrationUs' in baselineResultsDict[key]):
+            machineRatio = summaryDict['calibrationUs'] / baselineResultsDict[key]['calibrationUs']
+        ratio = ((newValue / baselineValue) / machineRatio) if baselineValue > 0 else 1.0
+        comparisonsList.append((key, baselineValue, newValue, ratio, ratio > (1 + threshold)))
+    return comparisonsList
+
+
+def _printHeader():
+    print('%-40s %7s %8s %10s %10s %10s %10s' % ('operation@nWidgets', 'passes', 'calls',
+                                                 'p50 us', 'p90 us', 'p99 us', 'max us'))
+
+
+def _printRow(key, summaryDict):
+    print('%-40s %7d %8d %10.2f %10.2f %10.2f %10.2f' % (key, summaryDict['nPasses'], summaryDict['nCalls'],
+                                                         summaryDict['p50'], summaryDict['p90'],
+                                                         summaryDict['p99'], summaryDict['max']))
+    sys.stdout.flush()
+
+
+def printResults(resultsDict):
+    """Prints a table of results (from runBenchmarks or loadResults)"""
+    _printHeader()
+    for key, summaryDict in resultsDict['results'].items():
+        _printRow(key, summaryDict)
+
+
+def printComparison(comparisonsList, statName='p50'):
+    """Prints a table of comparisons (from compareResults), and returns the number of regressions"""
+    print()
+    print('%-40s %12s %12s %8s' % ('operation@nWidgets', 'base ' + statName, 'new ' + statName, 'ratio'))
+    nRegressions = 0
+    for key, baselineValue, newValue, ratio, isRegression in comparisonsList:
+        if isRegression:
+            nRegressions = nRegressions + 1
+        print('%-40s %12.2f %12.2f %7.2fx%s' % (key, baselineValue, newValue, ratio,
+                                                '  REGRESSION' if isRegression else ''))
+    print()
+    print(nRegressions, 'regression(s) in', len(comparisonsList), 'comparisons')
+    return nRegressions
+
+
+def main(argsList=None):
+    """Runs the benchmarks from the command line (python -m pygwidgets.bench).  Returns an exit status."""
+    parser = argparse.ArgumentParser(prog='python -m pygwidgets.bench',
+                                     description='Headless benchmarks of the pygwidgets widget classes.')
+    parser.add_argument('--scales', default=','.join(str(nWidgets) for nWidgets in DEFAULT_SCALES),
+                        help='comma separated numbers of widgets (default %(default)s)')
+    parser.add_argument('--only', default=None,
+                        help="comma separated operation names, names can end with '*' (e.g. 'draw.*,Image.*')")
+    parser.add_argument('--budget', type=int, default=DEFAULT_CALL_BUDGET,
+                        help='about how many calls to time per operation and scale (default %(default)s)')
+    parser.add_argument('--json', default=None, help='write the results to this JSON file')
+    parser.add_argument('--baseline', default=None, help='compare the results against this JSON file')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='fraction slower that counts as a regression (default %(default)s)')
+    parser.add_argument('--stat', default='p50', choices=['p50', 'p90', 'p99', 'mean', 'max'],
+                        help='statistic to compare against the baseline (default %(default)s)')
+    parser.add_argument('--no-normalize', action='store_true',
+                        help='compare raw times, without allowing for a busier or slower machine')
+    parser.add_argument('--list', action='store_true', help='list the operation names and exit')
+    args = parser.parse_args(argsList)
+
+    if args.list:
+        for operationName in getOperations():
+            print(operationName)
+        return 0
+
+    scalesList = [int(nWidgets) for nWidgets in args.scales.split(',')]
+    operationNamesList = None if args.only is None else args.only.split(',')
+    resultsDict = runBenchmarks(scalesList, operationNamesList, args.budget)
+
+    if args.json is not None:
+        saveResults(resultsDict, args.json)
+        print('Results written to', args.json)
+
+    if args.baseline is not None:
+        comparisonsList = compareResults(resultsDict, loadResults(args.baseline), args.threshold, args.stat,
+                                         not args.no_normalize)
+        nRegressions = printComparison(comparisonsList, args.stat)
+        if nRegressions > 0:
+            return 1
+    return 0
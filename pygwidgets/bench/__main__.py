@@ -0,0 +1,11 @@
+#  Runs the pygwidgets benchmarks:   python -m pygwidgets.bench --help
+#  Runs without opening a visible window.
+
+import os
+import sys
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from pygwidgets.bench import main
+
+sys.exit(main())
@@ -52,6 +52,7 @@ pygwidgets contains the following classes:
 
 - TextRadioButton - a radio button built on the fly from a programmer-supplied text.
 - CustomRadioButton - a radio button where you use your images
+- RadioGroup - a group of radio buttons, only one of which can be selected
 
 - DisplayText - a text field used just for output (display)
 
@@ -72,10 +73,29 @@ pygwidgets contains the following classes:
 
 - SpriteSheetAnimationCollection - similar to AnimationCollections but starts with sprite sheets
 
+- AnimationClip - the images and timings of an animation, shared by any number of animations
+
+- AnimationPlayer - a lightweight animation that plays an AnimationClip (for thousands of animations)
+
+- AnimationScheduler - updates many animations together, reading the clock only once per frame
+
 - SoundEffect - used for playing short sound files (typically .wav file)
 
+- SoundManager - plays sound effects on a limited pool of channels, with priorities
+
 - BackgroundSound - used for playing longer background music (typically .mp3 files)
 
+- BackgroundPlaylist - plays a list of background music files one after another, with no gaps
+
+- EventRouter - sends events only to the widgets that could be interested in them
+  (useful when there are a large number of widgets)
+
+- WidgetGroup - draws a group of widgets, redrawing only the parts of the window that changed
+
+- WidgetProfiler - finds out which widgets take the most time to draw and handle events
+
+- FrameTracer - records what happens in each frame, for viewing in a trace viewer
+
 
 Many widgets also allow the use of a callBack (a function or method to be called when an action happens)
     Any widget that uses a callBack can be set up like this: 
@@ -277,13 +297,19 @@ or implied, of Al Sweigart.
 
 __all__ = [
     'Animation',
+    'AnimationClip',
     'AnimationCollection',
+    'AnimationPlayer',
+    'AnimationScheduler',
+    'BackgroundPlaylist',
     'BackgroundSound',
     'CustomButton',
     'CustomCheckBox',
     'CustomRadioButton',
     'DisplayText',
     'Dragger',
+    'EventRouter',
+    'FrameTracer',
     'Image',
     'ImageCollection',
     'InputText',
@@ -296,24 +322,43 @@ __all__ = [
     'PYGWIDGETS_DISABLED_GRAY',
     'PYGWIDGETS_DOWN_GRAY',
     'PYGWIDGETS_GRAY',
+    'PYGWIDGETS_MUSIC_END_EVENT',
     'PYGWIDGETS_NORMAL_GRAY',
     'PYGWIDGETS_OVER_GRAY',
     'PYGWIDGETS_WHITE',
     'PygAnimation',
+    'PygAnimationPlayback',
     'PygWidget',
     'PygWidgetsButton',
     'PygWidgetsCheckBox',
     'PygWidgetsRadioButton',
     'PygwidgetsFontManager',
+    'PygwidgetsImageCache',
+    'PygwidgetsSkinCache',
+    'PygwidgetsSoundCache',
+    'PygwidgetsTransformCache',
+    'PygwidgetsTextCache',
+    'RadioGroup',
     'SpriteSheetAnimation',
     'SpriteSheetAnimationCollection',
     'SoundEffect',
+    'SoundManager',
     'TextButton',
     'TextCheckBox',
     'TextRadioButton',
+    'WidgetGroup',
+    'WidgetProfiler',
     'getPygwidgetsVersion',
+    'getSkinCache',
+    'getSoundCache',
+    'getSoundManager',
+    'getFontManager',
+    'getImageCache',
+    'getTextCache',
     'buildPathFromRelativePath',
+    'buildTextButtons',
     'loadImage',
+    'setSoundManager',
 ]
 
 import pygame
@@ -322,6 +367,14 @@ from pygame.locals import *
 from abc import ABC, abstractmethod
 import os
 import sys
+import io
+import json
+import threading
+import warnings
+import weakref
+from collections import OrderedDict, deque
+from itertools import accumulate
+from bisect import bisect_left, bisect_right
 
 
 __version = "1.2"
@@ -339,8 +392,10 @@ PYGWIDGETS_ANIMATION_PAUSED = 'paused'
 PYGWIDGETS_ANIMATION_STOPPED = 'stopped'
 if pygame.version.vernum == 1:    # gives a tuple like (2, 0, 1), check for version 1
     PYGWIDGETS_CUSTOM_EVENT = pygame.USEREVENT  # older approach
+    PYGWIDGETS_MUSIC_END_EVENT = pygame.USEREVENT + 1
 else:  # pygame version 2 and later
     PYGWIDGETS_CUSTOM_EVENT = pygame.event.custom_type() # new in pygame 2.0
+    PYGWIDGETS_MUSIC_END_EVENT = pygame.event.custom_type()  # posted when a BackgroundPlaylist track ends
 PYGWIDGETS_MOUSE_EVENTS_DICT = (MOUSEMOTION, MOUSEBUTTONUP, MOUSEBUTTONDOWN)
 
 
@@ -359,6 +414,9 @@ def loadImage(relativePath):
     This is typically used to load an image so you can then get its rect -
     with a call to theImage.get_rect(), then extract the width and height
 
+    Images are kept in a cache shared with all widgets (see getImageCache), so loading
+    the same file again is fast.  The image returned is your own copy, so you can draw into it.
+
     Parameter:
         |    relativePath - relative path to the image file
 
@@ -366,7 +424,7 @@ def loadImage(relativePath):
         |     an image
 
     """
-    return _loadImageAndConvert(relativePath)
+    return _loadImageAndConvert(relativePath).copy()  # the cached image is shared, so it must not change
 
 def buildPathFromRelativePath(relativePath):
     """This function is needed because of the way that PyInstaller works.
@@ -389,18 +447,23 @@ def buildPathFromRelativePath(relativePath):
     #print('absolutePath is', absolutePath)
     return absolutePath
 
-def _loadImageAndConvert(path):
-    # This call allows for running inside a development environment
-    # and also works when running as an application built using PyInstaller.
-    path = buildPathFromRelativePath(path)
-        
+def _loadImageAndConvert(path, convertMode='auto'):
     # Internal function to load an image and convert for putting on screen
+    # Images are shared through the image cache, so the image must not be drawn into
+    return _PYGWIDGETS_IMAGE_CACHE.loadImage(path, convertMode)
+
+def _loadImageFromFile(path, convertMode):
+    # Internal function, called by the image cache to really load an image file
     try:        
         image = pygame.image.load(path)
     except:
         raise FileNotFoundError('Cannot load file: ' + path)
 
-    if image.get_alpha() is None:
+    if convertMode == 'alpha':
+        image = image.convert_alpha()
+    elif convertMode == 'opaque':
+        image = image.convert()
+    elif image.get_alpha() is None:  # 'auto'
         image = image.convert()
         #print('Calling convert for:', path)
     else:
@@ -408,41 +471,878 @@ def _loadImageAndConvert(path):
         #print('Calling convert_alpha for:', path)
     return image
 
+
+class _PygwidgetsLRU():
+    """
+    This is an internal class, the least recently used store that the caches of pygwidgets are built on.
+    Values are kept by key, up to maxEntries values and/or maxBytes bytes (None for no limit).
+    When a limit is passed, the least recently used values are discarded.
+    Keeps counts of hits, misses, and evictions for getStats.
+    It does no locking, caches that are used from more than one thread lock around it.
+    """
+
+    def __init__(self, maxEntries=None, maxBytes=None):
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.entriesDict = OrderedDict()  # key -> (value, nBytes), least recently used first
+        self.nBytes = 0
+        self.nHits = 0
+        self.nMisses = 0
+        self.nEvictions = 0
+
+    def get(self, key):
+        """Returns the value for a key (now the most recently used), or None if it is not in the cache."""
+        entry = self.entriesDict.get(key)
+        if entry is None:
+            self.nMisses = self.nMisses + 1
+            return None
+        self.nHits = self.nHits + 1
+        self.entriesDict.move_to_end(key)  # now the most recently used
+        return entry[0]
+
+    def peek(self, key):
+        """Returns the value for a key, or None if it is not in the cache (does not count as a hit or miss)."""
+        entry = self.entriesDict.get(key)
+        if entry is None:
+            return None
+        return entry[0]
+
+    def add(self, key, value, nBytes=0):
+        """Adds a value to the cache, then discards least recently used values if needed.
+        The value just added is never discarded, even if it is bigger than the whole cache.
+
+        Returns:
+            |     a list of (key, value) tuples of the values discarded
+
+        """
+        if key in self.entriesDict:
+            self.remove(key)
+        self.entriesDict[key] = (value, nBytes)
+        self.nBytes = self.nBytes + nBytes
+        return self.evict(key)
+
+    def remove(self, key):
+        """Removes the value for a key from the cache, and returns it."""
+        value, nBytes = self.entriesDict.pop(key)
+        self.nBytes = self.nBytes - nBytes
+        return value
+
+    def evict(self, keepKey=None):
+        """Discards least recently used values until the cache fits in its limits.
+        If keepKey is given, it must be the most recently used key, and it is never discarded.
+
+        Returns:
+            |     a list of (key, value) tuples of the values discarded
+
+        """
+        evictedList = []
+        entriesDict = self.entriesDict
+        maxEntries = self.maxEntries
+        maxBytes = self.maxBytes
+        while len(entriesDict) > 0:
+            if ((maxEntries is None) or (len(entriesDict) <= maxEntries)) and \
+                                            ((maxBytes is None) or (self.nBytes <= maxBytes)):
+                break
+            key, (value, nBytes) = entriesDict.popitem(last=False)
+            if key == keepKey:  # only the value just added is left, put it back
+                entriesDict[key] = (value, nBytes)
+                break
+            self.nBytes = self.nBytes - nBytes
+            self.nEvictions = self.nEvictions + 1
+            evictedList.append((key, value))
+        return evictedList
+
+    def clear(self):
+        """Discards all cached values.  (Counts of hits, misses, and evictions are kept.)"""
+        self.entriesDict.clear()
+        self.nBytes = 0
+
+    def getStats(self):
+        """Returns a dictionary of statistics: hits, misses, evictions, and entries."""
+        return {'hits': self.nHits, 'misses': self.nMisses, 'evictions': self.nEvictions,
+                'entries': len(self.entriesDict)}
+
+    def __contains__(self, key):
+        return key in self.entriesDict
+
+    def __len__(self):
+        return len(self.entriesDict)
+
+
+class PygwidgetsImageCache(_PygwidgetsLRU):
+    """
+    This is an internal cache of images loaded from files, shared by all widgets that
+    load images (e.g., CustomButton, Image, Animation, ...), and by loadImage.
+    Many widgets using the same image file share a single image, which is loaded
+    (decoded and converted) only once.
+
+    Images are kept by their full path and conversion mode.  The cache is limited to a
+    maximum number of bytes, and discards the least recently used images when it is full.
+    (Widgets that already use a discarded image keep it.)
+
+    Images can also be released by scene.  Call setCurrentScene before creating the widgets
+    of a scene, then releaseScene when the scene is no longer needed:
+
+        | oImageCache = pygwidgets.getImageCache()
+        | oImageCache.setCurrentScene('level1')
+        | # ... create the widgets of level 1 ...
+        | oImageCache.setCurrentScene(None)
+        | # ... later, when level 1 is finished:
+        | oImageCache.releaseScene('level1')
+
+    The cache also keeps the list of frames cut from each sprite sheet, so many
+    SpriteSheetAnimation objects using the same sheet share the same frame images.
+    """
+    DEFAULT_MAX_BYTES = 128 * 1024 * 1024  # 128 MB
+
+    def __init__(self, maxBytes=DEFAULT_MAX_BYTES):
+        super().__init__(maxBytes=maxBytes)  # (path, convertMode) -> image, least recently used first
+        self.scenesDict = {}  # (path, convertMode) -> set of names of scenes that loaded the image
+        self.framesDict = {}  # (path, convertMode) -> dict of (width, height, nImages) -> tuple of frames
+        self.currentScene = None
+        self._lock = threading.RLock()  # images may be loaded from a background thread
+
+    def loadImage(self, path, convertMode='auto'):
+        """Returns the image from a file, loading it only if it is not already in the cache.
+
+        The image returned is shared by everything that loads the same file, so it must be
+        treated as read-only.  If you want to draw into it, draw into a copy (or use
+        pygwidgets.loadImage, which returns a copy).
+
+        Parameters:
+            | path - path to the image file (relative to your main program, or absolute)
+
+        Optional keyword parameters:
+            | convertMode - 'auto' (convert_alpha if the image has transparency, otherwise convert),
+            |     'alpha' (always convert_alpha), or 'opaque' (always convert).  (defaults to 'auto')
+
+        """
+        # This call allows for running inside a development environment
+        # and also works when running as an application built using PyInstaller.
+        path = buildPathFromRelativePath(path)
+        key = (path, convertMode)
+        with self._lock:
+            image = self.get(key)
+            if image is None:
+                image = _loadImageFromFile(path, convertMode)
+                nBytes = image.get_pitch() * image.get_height()
+                # never discards the image just loaded, even if it is bigger than the whole cache
+                self._forget(self.add(key, image, nBytes))
+            if self.currentScene is not None:
+                self.scenesDict.setdefault(key, set()).add(self.currentScene)
+        return image
+
+    def getSpriteSheetFrames(self, path, width, height, nImages, convertMode='auto'):
+        """Returns a tuple of the images cut from a sprite sheet, cutting them only if not already in the cache.
+
+        Frames are taken left to right, then top to bottom.  They are subsurfaces of the
+        sprite sheet, so they take no extra memory, but they must not be drawn into.
+
+        Parameters:
+            | path - path to the sprite sheet file (relative to your main program, or absolute)
+            | width - width of each frame
+            | height - height of each frame
+            | nImages - number of frames
+
+        Optional keyword parameters:
+            | convertMode - how to convert the sprite sheet, see loadImage (defaults to 'auto')
+
+        """
+        path = buildPathFromRelativePath(path)
+        key = (path, convertMode)
+        framesKey = (width, height, nImages)
+        with self._lock:
+            spriteSheetImage = self.loadImage(path, convertMode)  # also marks the sheet as recently used
+            framesForSheetDict = self.framesDict.setdefault(key, {})
+            framesTuple = framesForSheetDict.get(framesKey)
+            if framesTuple is None:
+                nCols = spriteSheetImage.get_width() // width
+                framesList = []
+                for imageNumber in range(nImages):
+                    row, col = divmod(imageNumber, nCols)
+                    framesList.append(spriteSheetImage.subsurface((col * width, row * height, width, height)))
+                framesTuple = tuple(framesList)
+                framesForSheetDict[framesKey] = framesTuple
+        return framesTuple
+
+    def setCurrentScene(self, sceneName):
+        """Sets the name of the scene that images loaded from now on belong to (None for no scene)."""
+        with self._lock:
+            self.currentScene = sceneName
+
+    def releaseScene(self, sceneName):
+        """Removes all images loaded for a scene from the cache, unless another scene also uses them.
+
+        Returns:
+            |     the number of images removed
+
+        """
+        nReleased = 0
+        with self._lock:
+            for key, scenesSet in list(self.scenesDict.items()):
+                scenesSet.discard(sceneName)
+                if len(scenesSet) == 0:
+                    del self.scenesDict[key]
+                    if key in self:
+                        self.remove(key)
+                        self.framesDict.pop(key, None)
+                        nReleased = nReleased + 1
+            if self.currentScene == sceneName:
+                self.currentScene = None
+        return nReleased
+
+    def setMaxBytes(self, maxBytes):
+        """Sets the maximum number of bytes of images to keep (discards images if needed)."""
+        with self._lock:
+            self.maxBytes = maxBytes
+            self._forget(self.evict())
+
+    def clear(self):
+        """Discards all cached images."""
+        with self._lock:
+            super().clear()
+            self.scenesDict.clear()
+            self.framesDict.clear()
+
+    def getStats(self):
+        """Returns a dictionary of statistics: hits, misses, evictions, entries, frameLists, bytes, and maxBytes."""
+        with self._lock:
+            statsDict = super().getStats()
+            statsDict['frameLists'] = sum(len(framesForSheetDict) for framesForSheetDict in self.framesDict.values())
+            statsDict['bytes'] = self.nBytes
+            statsDict['maxBytes'] = self.maxBytes
+            return statsDict
+
+    def _forget(self, evictedList):
+        # Internal method, forgets the scenes and frames of images that were discarded
+        for key, image in evictedList:
+            self.scenesDict.pop(key, None)
+            self.framesDict.pop(key, None)
+
+# create one instance of the image cache
+_PYGWIDGETS_IMAGE_CACHE = PygwidgetsImageCache()
+
+class PygwidgetsTransformCache(_PygwidgetsLRU):
+    """
+    A cache of rotated, scaled, and flipped images, used by Image and ImageCollection objects.
+    Images are kept by (original image, angle, percent, flipH, flipV), and the least recently
+    used images are discarded when the cache has more than maxEntries images.
+
+    Each Image has its own cache by default.  To share one cache between many Image objects,
+    (for example, many copies of the same spinning sprite), create one and pass it in:
+
+        | oTransformCache = pygwidgets.PygwidgetsTransformCache(360)
+        | oImage1 = pygwidgets.Image(window, (100, 100), 'images/arrow.png', oTransformCache=oTransformCache)
+        | oImage2 = pygwidgets.Image(window, (300, 100), 'images/arrow.png', oTransformCache=oTransformCache)
+
+    Parameters:
+        | maxEntries - the maximum number of transformed images to keep
+
+    """
+    def __init__(self, maxEntries):
+        super().__init__(maxEntries=maxEntries)  # key -> transformed image, least recently used first
+
+    def setMaxEntries(self, maxEntries):
+        """Sets the maximum number of transformed images to keep (discards images if needed)."""
+        self.maxEntries = maxEntries
+        self.evict()
+
+    def getStats(self):
+        """Returns a dictionary of statistics: hits, misses, evictions, entries, and maxEntries."""
+        statsDict = super().getStats()
+        statsDict['maxEntries'] = self.maxEntries
+        return statsDict
+
+def getImageCache():
+    """Returns the cache of images shared by all widgets that load images.
+    You can use this to release the images of a scene (setCurrentScene, releaseScene),
+    change the size of the cache (setMaxBytes), or get statistics (getStats).
+
+    Returns:
+        |     the PygwidgetsImageCache object
+
+    """
+    return _PYGWIDGETS_IMAGE_CACHE
+
+def _initMixer():
+    # Internal function, initializes pygame's mixer the first time a sound is needed
+    if pygame.mixer.get_init() is None:
+        pygame.mixer.init()
+
+class PygwidgetsSoundCache(_PygwidgetsLRU):
+    """
+    This is an internal cache of sounds loaded from files, shared by SoundEffect objects and by all
+    widgets that play a sound when clicked (soundOnClick).  Many widgets using the same sound file
+    share a single pygame.mixer.Sound, which is loaded (decoded) only once.
+    Because a Sound is shared, changing its volume changes it for everyone using it.
+
+    The mixer is initialized the first time a sound is loaded (if it was not initialized already).
+
+    Sounds can be loaded before they are needed by giving a list of paths, or the path of a JSON
+    manifest file that contains a list of paths:
+
+        | oSoundCache = pygwidgets.getSoundCache()
+        | oSoundCache.preload('sounds/manifest.json')
+    """
+
+    def __init__(self):
+        super().__init__()  # full path -> pygame.mixer.Sound (no limit, sounds are kept until cleared)
+        self._lock = threading.RLock()  # sounds may be preloaded from a background thread
+
+    def loadSound(self, path):
+        """Returns the sound from a file, loading it only if it is not already in the cache.
+
+        Parameters:
+            | path - path to the sound file (relative to your main program, or absolute)
+
+        Raises:
+            | FileNotFoundError if a file at the given path cannot be found
+
+        """
+        # This call allows for running inside a development environment
+        # and also works when running as an application built using PyInstaller.
+        fullPath = os.path.normpath(buildPathFromRelativePath(path))
+        with self._lock:
+            oSound = self.get(fullPath)
+            if oSound is not None:
+                return oSound
+            _initMixer()
+            oSound = pygame.mixer.Sound(fullPath)
+            self.add(fullPath, oSound)
+        return oSound
+
+    def preload(self, pathsListOrManifest, background=False):
+        """Loads sounds before they are needed, so the first screen does not wait for sounds.
+
+        Parameters:
+            | pathsListOrManifest - a list of paths of sound files, or the path of a JSON file
+            |     that contains a list of paths of sound files
+
+        Optional keyword parameters:
+            | background - if True, load the sounds on a background thread and return right away (defaults to False)
+
+        Returns:
+            |     the background thread (call its join method to wait for it), or None if background is False
+
+        Raises:
+            | FileNotFoundError if the manifest file, or a sound file, cannot be found
+
+        """
+        if isinstance(pathsListOrManifest, str):  # path of a manifest file
+            with open(buildPathFromRelativePath(pathsListOrManifest)) as manifestFile:
+                pathsList = json.load(manifestFile)
+        else:
+            pathsList = pathsListOrManifest
+
+        if background:
+            _initMixer()  # on the main thread
+            oThread = threading.Thread(target=self._preloadSounds, args=(pathsList,),
+                                       name='pygwidgets sound preload', daemon=True)
+            oThread.start()
+            return oThread
+
+        self._preloadSounds(pathsList)
+        return None
+
+    def _preloadSounds(self, pathsList):
+        # Internal method, loads a list of sounds (may run on a background thread)
+        for path in pathsList:
+            self.loadSound(path)
+
+    def clear(self):
+        """Discards all cached sounds.  (Widgets that already use a sound keep it.)"""
+        with self._lock:
+            super().clear()
+
+    def getStats(self):
+        """Returns a dictionary of statistics: hits, misses, and entries."""
+        with self._lock:
+            return {'hits': self.nHits, 'misses': self.nMisses, 'entries': len(self)}
+
+# create one instance of the sound cache
+_PYGWIDGETS_SOUND_CACHE = PygwidgetsSoundCache()
+
+def getSoundCache():
+    """Returns the cache of sounds shared by SoundEffect objects and widgets that play a sound when clicked.
+    You can use this to preload sounds (preload), or get statistics (getStats).
+
+    Returns:
+        |     the PygwidgetsSoundCache object
+
+    """
+    return _PYGWIDGETS_SOUND_CACHE
+
+# The SoundManager that plays all sounds of SoundEffects and widgets (None means sounds play directly)
+_PYGWIDGETS_SOUND_MANAGER = None
+
+def setSoundManager(oSoundManager):
+    """Sets the SoundManager used to play all sound effects and click sounds of widgets.
+
+    Parameter:
+        | oSoundManager - a SoundManager object, or None to play sounds directly (the default)
+
+    """
+    global _PYGWIDGETS_SOUND_MANAGER
+    _PYGWIDGETS_SOUND_MANAGER = oSoundManager
+
+def getSoundManager():
+    """Returns the SoundManager used to play all sound effects and click sounds of widgets (or None)."""
+    return _PYGWIDGETS_SOUND_MANAGER
+
+def _playSound(oSound, priority=0, maxInstances=None, minInterval=None):
+    # Internal function, plays a sound through the SoundManager (if there is one)
+    if _PYGWIDGETS_SOUND_MANAGER is None:
+        return oSound.play()
+    return _PYGWIDGETS_SOUND_MANAGER.play(oSound, priority, maxInstances=maxInstances, minInterval=minInterval)
+
+def _makeFontKey(fontName, fontSize):
+    # Internal function, builds the key that the font manager keeps a loaded font by
+    if fontName is None:   # Request to use system font
+        return 'None_' + str(fontSize)
+    return fontName.lower() + '_' + str(fontSize)
+
 class PygwidgetsFontManager():
     """
     This is an internal font manager that loads fonts for any classes that
     render text (e.g., TextButton, TextRadioButton, TextCheckBox, InputText, DisplayText)
     It keeps a cache of loaded fonts as an optimization.
+    The cache holds up to maxFonts fonts, and discards the least recently used font when full.
+
+    System fonts are found by name with pygame.font.match_font, which does the same search as
+    pygame.font.SysFont.  The name can be a comma-separated list of fonts to try in order,
+    e.g., 'helvetica,arial'.  Only the path of the font file is kept, and the font is loaded
+    with pygame.font.Font.  (Because fonts are loaded without bold or italic, this gives the
+    same font as pygame.font.SysFont.)  The first time a system font is looked for,
+    pygame scans all system font directories, which can take a long time.  To avoid this:
+        - call preload with the fonts your program uses, optionally on a background thread
+        - call setSysFontCacheFile, so that the paths of system fonts are saved in a file,
+          and later runs of the program do not need to scan for fonts at all
+
+    Use getFontManager() to get the single instance:
+
+        | oFontManager = pygwidgets.getFontManager()
+        | oFontManager.setSysFontCacheFile('fontCache.json')
+        | oFontManager.preload([('arial', 24), ('couriernew', 18)], background=True)
     """
-    def __init__(self):
+    DEFAULT_MAX_FONTS = 64
+    DEFAULT_MAX_GLYPH_ATLASES = 16
+
+    def __init__(self, maxFonts=DEFAULT_MAX_FONTS, maxGlyphAtlases=DEFAULT_MAX_GLYPH_ATLASES):
         pygame.font.init()   # Initialize pygame's font system
-        self._fontsLoaded = {}  # dictionary of fonts loaded for current program
+        self._fontsLRU = _PygwidgetsLRU(maxEntries=maxFonts)  # fontKey -> font, least recently used first
+        # (fontKey, color, antialias) -> PygwidgetsGlyphAtlas, least recently used first
+        self._glyphAtlasesLRU = _PygwidgetsLRU(maxEntries=maxGlyphAtlases)
+        self._lock = threading.RLock()  # fonts may be loaded or preloaded from more than one thread
+        self._sysFontLock = threading.Lock()  # only one thread should look for system fonts at a time
+        self._sysFontPathsDict = {}  # system font name -> path of font file (or None for the default font)
+        self._sysFontCacheFile = None
+        self._loadTimesDict = {}  # fontKey -> seconds it took to load the font
+        self._fontKeysDict = {}  # id of font -> (weak reference to font, fontKey), for every font loaded
+
+    # Counts kept by the LRU of loaded fonts
+    @property
+    def nHits(self):
+        return self._fontsLRU.nHits
+
+    @property
+    def nMisses(self):
+        return self._fontsLRU.nMisses
+
+    @property
+    def nEvictions(self):
+        return self._fontsLRU.nEvictions
+
+    @property
+    def maxFonts(self):
+        return self._fontsLRU.maxEntries
 
     def loadFont(self, fontName, fontSize):
-        if fontName is None:   # Request to use system font
-            fontKey = 'None_' + str(fontSize)
-        else:
-            fontKey = fontName.lower() + '_' + str(fontSize)
-            
-        if fontKey in self._fontsLoaded:  # if already loaded
-            oFont = self._fontsLoaded[fontKey]
-        else:  # not loaded yet
-            # If this font is None (for default system font)
-            # or has a period (implies a file name) of a True-Type Font file:  xxx.ttf or .otf
-            if fontName is None:  # font file
-                oFont = pygame.font.Font(fontName, fontSize)
-            elif '.' in fontName:  # file name with extension
-                fontName = buildPathFromRelativePath(fontName)
-                oFont = pygame.font.Font(fontName, fontSize)
-            else: # use system font
-                oFont = pygame.font.SysFont(fontName, fontSize)
-            self._fontsLoaded[fontKey] = oFont
+        fontKey = _makeFontKey(fontName, fontSize)
+        with self._lock:
+            oFont = self._fontsLRU.get(fontKey)
+        if oFont is not None:  # if already loaded
+            return oFont
+
+        # not loaded yet
+        # If this font is None (for default system font)
+        # or has a period (implies a file name) of a True-Type Font file:  xxx.ttf or .otf
+        # Otherwise, find the file of the system font.  This is done without holding the lock,
+        # because it may have to wait for a search for system fonts on another thread.
+        startTime = time.perf_counter()
+        if fontName is None:  # font file
+            fontPath = None
+        elif '.' in fontName:  # file name with extension
+            fontPath = buildPathFromRelativePath(fontName)
+        else: # use system font
+            fontPath = self._getSysFontPath(fontName)
+
+        with self._lock:
+            oFont = self._fontsLRU.peek(fontKey)
+            if oFont is not None:  # loaded by another thread in the meantime
+                return oFont
+            oFont = pygame.font.Font(fontPath, fontSize)
+            self._loadTimesDict[fontKey] = time.perf_counter() - startTime
+            self._fontKeysDict[id(oFont)] = (weakref.ref(oFont, self._forgetFontKey), fontKey)
+            self._fontsLRU.add(fontKey, oFont)  # widgets using a discarded font keep their own reference
 
         return oFont
 
+    def preload(self, fontsList, background=False):
+        """Loads fonts before they are needed, so the first screen does not wait for fonts.
+
+        Parameters:
+            | fontsList - a list of (fontName, fontSize) tuples (same values you pass to widgets)
+
+        Optional keyword parameters:
+            | background - if True, look for system fonts on a background thread and return right away.
+            |     Only the (slow) search for system font files happens on the thread, the fonts
+            |     themselves are loaded the first time a widget uses them.  (defaults to False)
+
+        Returns:
+            |     the background thread (call its join method to wait for it), or None if background is False
+
+        """
+        if background:
+            sysFontNamesList = [fontName for fontName, fontSize in fontsList
+                                                    if (fontName is not None) and ('.' not in fontName)]
+            oThread = threading.Thread(target=self._preloadSysFontPaths, args=(sysFontNamesList,),
+                                        name='pygwidgets font preload', daemon=True)
+            oThread.start()
+            return oThread
+
+        for fontName, fontSize in fontsList:
+            self.loadFont(fontName, fontSize)
+        return None
+
+    def _preloadSysFontPaths(self, sysFontNamesList):
+        # Internal method, runs on a background thread to find the files of system fonts
+        for fontName in sysFontNamesList:
+            self._getSysFontPath(fontName)
+
+    def _getSysFontPath(self, fontName):
+        # Internal method, returns the path of a system font file, searching only if it is not known yet
+        fontName = fontName.lower()
+        with self._sysFontLock:
+            if fontName in self._sysFontPathsDict:
+                fontPath = self._sysFontPathsDict[fontName]
+                if (fontPath is None) or os.path.isfile(fontPath):
+                    return fontPath
+                # Font file from the cache file was moved or removed, search for it again
+
+            # Same search as pygame.font.SysFont: a comma-separated list of names is tried in order.
+            # None if not found, then the default font is used
+            fontPath = pygame.font.match_font(fontName)
+            if fontPath is None:
+                warnings.warn('The system font ' + repr(fontName) + ' could not be found, using the default font instead')
+            self._sysFontPathsDict[fontName] = fontPath
+            self._saveSysFontCacheFile()
+        return fontPath
+
+    def setSysFontCacheFile(self, cacheFilePath):
+        """Sets a file used to remember the paths of system fonts between runs of your program.
+
+        If the file exists, the paths of system fonts are read from it.  Whenever a new
+        system font is found, the file is rewritten.
+
+        Parameters:
+            | cacheFilePath - path to a JSON file (relative to your main program, or absolute)
+
+        """
+        cacheFilePath = buildPathFromRelativePath(cacheFilePath)
+        with self._sysFontLock:
+            self._sysFontCacheFile = cacheFilePath
+            try:
+                with open(cacheFilePath) as cacheFile:
+                    savedPathsDict = json.load(cacheFile)
+            except (OSError, ValueError):  # no file yet, or not a valid file
+                return
+            for fontName, fontPath in savedPathsDict.items():
+                self._sysFontPathsDict.setdefault(fontName, fontPath)
+
+    def _saveSysFontCacheFile(self):
+        # Internal method, called with the sysFont lock held
+        if self._sysFontCacheFile is None:
+            return
+        # Only save fonts that were found, so a font installed later will be found next time
+        foundPathsDict = {fontName: fontPath for fontName, fontPath in self._sysFontPathsDict.items()
+                                                                        if fontPath is not None}
+        try:
+            with open(self._sysFontCacheFile, 'w') as cacheFile:
+                json.dump(foundPathsDict, cacheFile, indent=2, sort_keys=True)
+        except OSError:
+            pass  # the cache file is only an optimization, fonts are still loaded
+
+    def setMaxFonts(self, maxFonts):
+        """Sets the maximum number of fonts to keep loaded."""
+        with self._lock:
+            self._fontsLRU.maxEntries = maxFonts
+            self._fontsLRU.evict()
+
+    def getStats(self):
+        """Returns a dictionary of statistics: hits, misses, evictions, loaded (number of fonts),
+        maxFonts, and loadSeconds (a dictionary of the seconds it took to load each font)."""
+        with self._lock:
+            return {'hits': self.nHits, 'misses': self.nMisses, 'evictions': self.nEvictions,
+                    'loaded': len(self._fontsLRU), 'maxFonts': self.maxFonts,
+                    'loadSeconds': dict(self._loadTimesDict)}
+
+    def getFontKey(self, oFont):
+        """Returns a key that identifies a font object by its name, size, and style, for use in caches.
+        Fonts that were not loaded by the font manager are their own key."""
+        fontKeyEntry = self._fontKeysDict.get(id(oFont))
+        if (fontKeyEntry is None) or (fontKeyEntry[0]() is not oFont):
+            return oFont
+        return (fontKeyEntry[1], oFont.get_bold(), oFont.get_italic(), oFont.get_underline())
+
+    def _forgetFontKey(self, fontRef):
+        # Internal method, called when a loaded font is deleted
+        for fontId, (entryFontRef, fontKey) in list(self._fontKeysDict.items()):
+            if entryFontRef is fontRef:
+                del self._fontKeysDict[fontId]
+                break
+
+    def getGlyphAtlas(self, oFont, color, antialias=True):
+        """Returns the glyph atlas for a font (a loaded font object) and a text color.
+
+        The atlas is built the first time it is asked for, and shared after that.
+        Up to maxGlyphAtlases atlases are kept, the least recently used is discarded when full.
+        (Used by DisplayText with renderMode='atlas'.)
+
+        """
+        atlasKey = (self.getFontKey(oFont), _makeColorKey(color), antialias)
+        with self._lock:
+            oGlyphAtlas = self._glyphAtlasesLRU.get(atlasKey)
+            if oGlyphAtlas is None:
+                oGlyphAtlas = PygwidgetsGlyphAtlas(oFont, color, antialias)
+                self._glyphAtlasesLRU.add(atlasKey, oGlyphAtlas)
+        return oGlyphAtlas
+
 # create one instance of the font manager
 _PYGWIDGETS_FONT_MANAGER = PygwidgetsFontManager()  
 
+def getFontManager():
+    """Returns the font manager shared by all text widgets.
+    You can use this to preload fonts, set a file to remember system font paths, or get statistics.
+
+    Returns:
+        |     the PygwidgetsFontManager object
+
+    """
+    return _PYGWIDGETS_FONT_MANAGER
+
+class PygwidgetsTextCache(_PygwidgetsLRU):
+    """
+    This is an internal cache of rendered lines of text, shared by the classes that
+    render text (DisplayText, TextButton, TextCheckBox, TextRadioButton).
+    Rendering the same text again (with the same font, antialias, and colors) returns the
+    surface that was rendered earlier, instead of calling font.render again.
+    The cache is limited to a maximum number of bytes.  When it is full, the
+    least recently used surfaces are discarded.
+    The surfaces returned are shared, so they must never be drawn into.
+
+    Surfaces are kept by the font's key (name, size, and style), not by the font object,
+    so the cache does not keep fonts alive after the font manager has discarded them.
+
+    Use getTextCache() to get the single instance, for example to check its statistics:
+
+        | print(pygwidgets.getTextCache().getStats())
+    """
+    DEFAULT_MAX_BYTES = 8 * 1024 * 1024  # 8 MB
+
+    def __init__(self, maxBytes=DEFAULT_MAX_BYTES):
+        super().__init__(maxBytes=maxBytes)
+
+    def render(self, oFont, text, antialias, color, backgroundColor=None):
+        """Returns a surface of the text rendered in the given font (same parameters as font.render)."""
+        key = (_PYGWIDGETS_FONT_MANAGER.getFontKey(oFont), text, antialias,
+               _makeColorKey(color), _makeColorKey(backgroundColor))
+        surface = self.get(key)
+        if surface is not None:
+            return surface
+
+        if backgroundColor is None:
+            surface = oFont.render(text, antialias, color)
+        else:
+            surface = oFont.render(text, antialias, color, backgroundColor)
+        nBytes = surface.get_pitch() * surface.get_height()
+        if nBytes <= self.maxBytes:  # never cache a single surface bigger than the whole cache
+            self.add(key, surface, nBytes)
+        return surface
+
+    def setMaxBytes(self, maxBytes):
+        """Sets the maximum number of bytes of surfaces to keep (discards surfaces if needed)."""
+        self.maxBytes = maxBytes
+        self.evict()
+
+    def getStats(self):
+        """Returns a dictionary of statistics: hits, misses, evictions, entries, bytes, and maxBytes."""
+        statsDict = super().getStats()
+        statsDict['bytes'] = self.nBytes
+        statsDict['maxBytes'] = self.maxBytes
+        return statsDict
+
+class PygwidgetsGlyphAtlas():
+    """
+    This is an internal class that holds the images of individual characters (glyphs)
+    of one font in one color, all rendered once into a single surface (the atlas).
+    An image of a string can then be composed with one blits() call of glyph subsurfaces,
+    instead of rendering the whole string with the font every time it changes.
+    Each glyph is placed at the width of the text before it, as measured by font.size,
+    so the text is as wide as font.size says and rounding does not add up along the line.
+    Glyphs rendered one at a time can be shaded slightly differently than in a whole string
+    rendered by the font, so the image is close to, but not always the same as, font.render.
+
+    Get an atlas from the font manager:  _PYGWIDGETS_FONT_MANAGER.getGlyphAtlas(oFont, color)
+    """
+    # Characters rendered when the atlas is built, any others are added when first used
+    INITIAL_CHARACTERS = ''.join(chr(charCode) for charCode in range(32, 127))
+    MAX_PREFIX_WIDTHS = 4096  # the number of text widths to remember
+
+    def __init__(self, oFont, color, antialias=True):
+        self.oFont = oFont
+        self.color = color
+        self.antialias = antialias
+        self.glyphsDict = {}  # character -> subsurface of the atlas
+        self.prefixWidthsDict = {}  # text -> width of the text, as measured by the font
+        self.atlasImage = None
+        self._buildAtlas(self.INITIAL_CHARACTERS)
+
+    def _buildAtlas(self, characters):
+        # Internal method, renders all characters side by side into a new atlas surface
+        glyphImagesList = []
+        atlasWidth = 0
+        atlasHeight = 1
+        for character in characters:
+            glyphImage = self.oFont.render(character, self.antialias, self.color)
+            glyphImagesList.append(glyphImage)
+            atlasWidth = atlasWidth + glyphImage.get_width()
+            atlasHeight = max(atlasHeight, glyphImage.get_height())
+
+        self.atlasImage = pygame.Surface((max(atlasWidth, 1), atlasHeight), flags=SRCALPHA)
+        self.atlasImage = pygame.Surface.convert_alpha(self.atlasImage)
+        self.atlasImage.fill((0, 0, 0, 0))
+        x = 0
+        self.glyphsDict = {}
+        for character, glyphImage in zip(characters, glyphImagesList):
+            glyphWidth = glyphImage.get_width()
+            self.atlasImage.blit(glyphImage, (x, 0), special_flags=BLEND_RGBA_MAX)
+            self.glyphsDict[character] = self.atlasImage.subsurface((x, 0, glyphWidth, glyphImage.get_height()))
+            x = x + glyphWidth
+
+    def _addCharacters(self, text):
+        # Internal method, rebuilds the atlas if text contains any characters that are not in it yet
+        newCharacters = ''.join(sorted(set(text) - self.glyphsDict.keys()))
+        if newCharacters != '':
+            self._buildAtlas(''.join(self.glyphsDict) + newCharacters)
+
+    def getLayout(self, text):
+        """Returns a tuple of (width of the text, list of (glyph, (x, 0)) tuples) for a single line of text."""
+        if text == '':
+            return 0, []
+        try:
+            return self._layOut(text)
+        except KeyError:  # text has a character that is not in the atlas yet
+            self._addCharacters(text)
+            return self._layOut(text)
+
+    def _layOut(self, text):
+        # Internal method, raises KeyError if any character of text is not in the atlas
+        glyphsDict = self.glyphsDict
+        prefixWidthsDict = self.prefixWidthsDict
+        layoutList = [(glyphsDict[text[0]], (0, 0))]
+        for index in range(1, len(text)):
+            prefix = text[:index]
+            x = prefixWidthsDict.get(prefix)
+            if x is None:
+                x = self._measure(prefix)
+            layoutList.append((glyphsDict[text[index]], (x, 0)))
+        width = prefixWidthsDict.get(text)
+        if width is None:
+            width = self._measure(text)
+        return width, layoutList
+
+    def _measure(self, text):
+        # Internal method, measures and remembers the width of some text
+        # (Changing text like a counter usually starts with the same characters as before)
+        if len(self.prefixWidthsDict) >= PygwidgetsGlyphAtlas.MAX_PREFIX_WIDTHS:
+            self.prefixWidthsDict.clear()
+        width = self.oFont.size(text)[0]
+        self.prefixWidthsDict[text] = width
+        return width
+
+def _makeColorKey(color):
+    # Colors can be tuples, lists, pygame.Color objects, or color names, turn any of these into a dict key
+    if (color is None) or isinstance(color, str):
+        return color
+    return tuple(color)
+
+def _composeStateSurface(size, partSurface, textSurface, textLoc):
+    # Internal function, builds the surface for one state of a checkbox or radio button:
+    # a transparent surface with the (shared) box or circle part, and the label next to it
+    # (The parts are already converted, so a surface with a label is made in the same pixel format
+    # for fast blitting, instead of being converted afterwards.)
+    if textSurface is None:
+        stateSurface = pygame.Surface(size, pygame.SRCALPHA, 32)
+    else:
+        stateSurface = pygame.Surface(size, pygame.SRCALPHA, partSurface)
+    stateSurface.blit(partSurface, (0, 0))
+    if textSurface is not None:
+        stateSurface.blit(textSurface, textLoc)
+    return stateSurface
+
+# create one instance of the text cache
+_PYGWIDGETS_TEXT_CACHE = PygwidgetsTextCache()
+
+def getTextCache():
+    """Returns the cache of rendered text shared by all text widgets.
+    You can use this to get statistics (getStats), or to change the size of the cache (setMaxBytes).
+
+    Returns:
+        |     the PygwidgetsTextCache object
+
+    """
+    return _PYGWIDGETS_TEXT_CACHE
+
+class PygwidgetsSkinCache(_PygwidgetsLRU):
+    """
+    This is an internal cache of the drawn surfaces (skins) of widgets, e.g., the up, over, down, and
+    disabled surfaces of a TextButton.  Widgets that are built with the same parameters (text, size,
+    colors, font, ...) share the same surfaces, so the surfaces are only drawn once.
+    Because the surfaces are shared, they should not be drawn into.
+
+    Skins are kept by a key made from all of the parameters used to draw them.  The cache holds
+    up to maxEntries skins, and discards the least recently used skin when it is full.
+    (Widgets that already use a discarded skin keep it.)
+    """
+    DEFAULT_MAX_ENTRIES = 512
+
+    def __init__(self, maxEntries=DEFAULT_MAX_ENTRIES):
+        super().__init__(maxEntries=maxEntries)  # key -> skin, least recently used first
+
+    def setMaxEntries(self, maxEntries):
+        """Sets the maximum number of skins to keep (discards skins if needed)."""
+        self.maxEntries = maxEntries
+        self.evict()
+
+    def getStats(self):
+        """Returns a dictionary of statistics: hits, misses, evictions, entries, and maxEntries."""
+        statsDict = super().getStats()
+        statsDict['maxEntries'] = self.maxEntries
+        return statsDict
+
+# create one instance of the skin cache
+_PYGWIDGETS_SKIN_CACHE = PygwidgetsSkinCache()
+
+def getSkinCache():
+    """Returns the cache of drawn widget surfaces (skins) shared by all widgets that draw their own surfaces.
+    You can use this to get statistics (getStats), or to change the size of the cache (setMaxEntries).
+
+    Returns:
+        |     the PygwidgetsSkinCache object
+
+    """
+    return _PYGWIDGETS_SKIN_CACHE
+
 class PygWidget(ABC):
     """This is the base class (superclass) of ALL pygwidgets - this is an abstract class.
 
@@ -453,6 +1353,13 @@ class PygWidget(ABC):
         - ability to get and set the loc, and get the rect of any widget
 
     """
+    # Set by an EventRouter when this widget is added to it, so that moving the widget
+    # can update the router's index.  (Class level default, some subclasses skip __init__)
+    oEventRouter = None
+    # True when the appearance or the rect of the widget has changed since it was last drawn
+    # by a WidgetGroup.  Starts out True so that every widget gets drawn the first time.
+    dirty = True
+
     @abstractmethod
     def __init__(self, nickname):
         self.visible = True
@@ -469,10 +1376,12 @@ class PygWidget(ABC):
     def show(self):
         """Make this widget visible."""
         self.visible = True
+        self.dirty = True
 
     def hide(self):
         """Make this widget invisible."""
         self.visible = False
+        self.dirty = True
 
     def getVisible(self):
         """Returns the visible state."""
@@ -481,10 +1390,12 @@ class PygWidget(ABC):
     def enable(self):
         """Set this widget enabled."""
         self.isEnabled = True
+        self.dirty = True
 
     def disable(self):
         """Disables the current widget."""
         self.isEnabled = False
+        self.dirty = True
 
     def getEnabled(self):
         """Returns the enabled state."""
@@ -505,6 +1416,7 @@ class PygWidget(ABC):
         self.loc = loc
         self.rect[0] = self.loc[0]
         self.rect[1] = self.loc[1]
+        self._notifyRectChanged()
 
     def getLoc(self):
         """Returns the location of this widget as a tuple of values (X,Y) ."""
@@ -581,6 +1493,7 @@ class PygWidget(ABC):
         
         self.loc = (self.loc[0] + nPixels, self.loc[1])
         self.rect.left = self.loc[0]
+        self._notifyRectChanged()
 
     def moveY(self, nPixels):
         """Move some number of pixels in the Y direction
@@ -592,6 +1505,7 @@ class PygWidget(ABC):
         
         self.loc = (self.loc[0], self.loc[1] + nPixels)
         self.rect.top = self.loc[1]
+        self._notifyRectChanged()
 
     def moveXY(self, nPixelsX, nPixelsY):
         """Move some number of pixels in the X and Y directions
@@ -605,6 +1519,44 @@ class PygWidget(ABC):
         self.moveX(nPixelsX)
         self.moveY(nPixelsY)
 
+    def getDirty(self):
+        """Returns True if this widget needs to be redrawn (used by WidgetGroup.drawDirty)."""
+        return self.dirty
+
+    def setDirty(self, trueOrFalse):
+        """Sets whether this widget needs to be redrawn.
+
+        Widgets mark themselves as dirty when their appearance or rect changes.
+        You only need to call this (with True) if you change a widget in some other way.
+
+        Parameter:
+            |   trueOrFalse - True if the widget needs to be redrawn, otherwise False
+
+        """
+        self.dirty = trueOrFalse
+
+    def getBlitInfo(self):
+        """Returns what the draw method would blit, without blitting it.
+
+        Used by a WidgetGroup created with batchBlits=True, to draw many widgets
+        with a single call to window.blits().
+
+        Returns:
+            |     a tuple of (surface, location), or
+            |     None if this widget must draw itself (by calling its draw method)
+
+        """
+        return None
+
+    def _getDrawRect(self):
+        """Internal method, returns the area of the window that the draw method draws into."""
+        return self.getRect()
+
+    def _notifyRectChanged(self):
+        """Internal method, called whenever the rect of this widget moves or changes size."""
+        self.dirty = True
+        if self.oEventRouter is not None:
+            self.oEventRouter.updateWidget(self)
 
     # def addDependent(self, oDependent):
     #     if not (isinstance(oDependent, list)):  # if it is a single object, make it a list
@@ -673,9 +1625,8 @@ class PygWidgetsButton(PygWidget):
 
         if self.soundOnClick is not None:
             self.playSoundOnClick = True
-            if type(self.soundOnClick) is str:  # user specified sound path, load it here
-                pygame.mixer.init()
-                self.soundOnClick = pygame.mixer.Sound(self.soundOnClick)  # save in same instance variable
+            if type(self.soundOnClick) is str:  # user specified sound path, load it here (or share it)
+                self.soundOnClick = _PYGWIDGETS_SOUND_CACHE.loadSound(self.soundOnClick)  # save in same instance variable
         else:
             self.playSoundOnClick = False
 
@@ -708,7 +1659,7 @@ class PygWidgetsButton(PygWidget):
 
                 # Return or Enter key
                 if eventObj.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                    self.state = PygWidgetsButton.STATE_IDLE
+                    self._setState(PygWidgetsButton.STATE_IDLE)
                     if self.callBack is not None:
                         self.callBack(self.nickname)  # call the callBack
                     return True
@@ -724,44 +1675,65 @@ class PygWidgetsButton(PygWidget):
 
                 mouseButtonUp = not pygame.mouse.get_pressed()[0]
                 if mouseButtonUp:  # typical case of rolling over a button
-                    self.state = PygWidgetsButton.STATE_OVER
+                    self._setState(PygWidgetsButton.STATE_OVER)
                 # If the user clicked down somewhere (not on this button)
                 # then rolled over this button, do nothing
 
             if (eventObj.type == MOUSEBUTTONUP) and eventPointInButtonRect:
-                self.state = PygWidgetsButton.STATE_OVER
+                self._setState(PygWidgetsButton.STATE_OVER)
 
 
         elif self.state == PygWidgetsButton.STATE_OVER:
             if (eventObj.type == MOUSEBUTTONDOWN) and eventPointInButtonRect:
-                self.state = PygWidgetsButton.STATE_ARMED
+                self._setState(PygWidgetsButton.STATE_ARMED)
 
             if (eventObj.type == MOUSEMOTION) and (not eventPointInButtonRect):
-                self.state = PygWidgetsButton.STATE_IDLE
+                self._setState(PygWidgetsButton.STATE_IDLE)
 
 
         elif self.state == PygWidgetsButton.STATE_ARMED:
             if (eventObj.type == MOUSEBUTTONUP) and eventPointInButtonRect:  # clicked!
-                self.state = PygWidgetsButton.STATE_OVER
+                self._setState(PygWidgetsButton.STATE_OVER)
                 if self.playSoundOnClick:
-                    self.soundOnClick.play()
+                    _playSound(self.soundOnClick)
                 if self.callBack is not None:
                     self.callBack(self.nickname)  # call the callBack
                 return True  # clicked!
 
             if (eventObj.type == MOUSEMOTION) and (not eventPointInButtonRect):
-                self.state = PygWidgetsButton.STATE_DISARMED
+                self._setState(PygWidgetsButton.STATE_DISARMED)
 
         elif self.state == PygWidgetsButton.STATE_DISARMED:
             if eventPointInButtonRect:
-                self.state = PygWidgetsButton.STATE_ARMED
+                self._setState(PygWidgetsButton.STATE_ARMED)
             elif eventObj.type == MOUSEBUTTONUP:
-                self.state = PygWidgetsButton.STATE_IDLE
+                self._setState(PygWidgetsButton.STATE_IDLE)
 
         return False
 
     def setIdle(self):
-        self.state = PygWidgetsButton.STATE_IDLE  # typically used when leaving a scene
+        self._setState(PygWidgetsButton.STATE_IDLE)  # typically used when leaving a scene
+
+    def _setState(self, newState):
+        """Internal method to change the state, and mark the button as needing to be redrawn."""
+        if newState != self.state:
+            self.state = newState
+            self.dirty = True
+
+    def _getCurrentSurface(self):
+        """Internal method, returns the surface to show based on the current state."""
+        if self.isEnabled:
+            if self.state == PygWidgetsButton.STATE_ARMED:
+                return self.surfaceDown
+
+            elif self.state == PygWidgetsButton.STATE_OVER:
+                return self.surfaceOver
+
+            else:  # IDLE or DISARMED
+                return self.surfaceUp
+
+        else:
+            return self.surfaceDisabled
 
     def draw(self):
         """Draws the button image based on its current state.
@@ -773,18 +1745,11 @@ class PygWidgetsButton(PygWidget):
             return
 
         # Blit the button's current appearance to the surface.
-        if self.isEnabled:
-            if self.state == PygWidgetsButton.STATE_ARMED:
-                self.window.blit(self.surfaceDown, self.loc)
-
-            elif self.state == PygWidgetsButton.STATE_OVER:
-                self.window.blit(self.surfaceOver, self.loc)
-
-            else:  # IDLE or DISARMED
-                self.window.blit(self.surfaceUp, self.loc)
+        self.window.blit(self._getCurrentSurface(), self.loc)
 
-        else:
-            self.window.blit(self.surfaceDisabled, self.loc)
+    def getBlitInfo(self):
+        """Returns a tuple of the surface for the current state, and the location to draw it."""
+        return self._getCurrentSurface(), self.loc
 
 
     def __debug(self):
@@ -846,21 +1811,66 @@ class TextButton(PygWidgetsButton):
     def __init__(self, window, loc, text, width=None, height=40, textColor=PYGWIDGETS_BLACK, 
                  upColor=PYGWIDGETS_NORMAL_GRAY, overColor=PYGWIDGETS_OVER_GRAY, downColor=PYGWIDGETS_DOWN_GRAY, 
                  fontName=None, fontSize=20, soundOnClick=None, 
-                 enterToActivate=False, callBack=None, nickname=None, activationKeysList=None):
+                 enterToActivate=False, callBack=None, nickname=None, activationKeysList=None, _skin=None):
 
         # Create the button's Surface objects.
+        # (_skin is only for buildTextButtons, which passes in the skin it already found or drew)
         if nickname is None:
             nickname = text  # use the text as the internal name
-        text = ' ' + text + ' '  # add padding for drawn text
         self.textColor = textColor
         self.upColor = upColor
         self.overColor = overColor
         self.downColor = downColor
 
-        self.font = _PYGWIDGETS_FONT_MANAGER.loadFont(fontName, fontSize)
+        # Identical buttons share their surfaces, which are only drawn once
+        skin = _skin
+        if skin is None:
+            skin = TextButton._getSkin(None, text, width, height, textColor, upColor, overColor, downColor,
+                                       fontName, fontSize, enterToActivate)
+        self.font, surfaceUp, surfaceOver, surfaceDown, surfaceDisabled = skin
+        buttonRect = pygame.Rect(loc[0], loc[1], surfaceUp.get_width(), surfaceUp.get_height())
+
+        # call the PygWidgetsButton superclass to finish initialization
+
+        super().__init__(window, loc, surfaceUp, surfaceOver, surfaceDown, surfaceDisabled, 
+                         buttonRect, soundOnClick, nickname, enterToActivate, callBack, activationKeysList)
+
+
+    @staticmethod
+    def _getSkin(oFont, text, width, height, textColor, upColor, overColor, downColor, fontName, fontSize,
+                 enterToActivate):
+        # Internal method, returns the skin for a button built with these parameters from the skin cache,
+        # drawing it only if it is not there.  oFont is the font to draw with (None to load it if needed)
+        skinKey = TextButton._getSkinKey(text, width, height, textColor, upColor, overColor, downColor,
+                                         fontName, fontSize, enterToActivate)
+        skin = _PYGWIDGETS_SKIN_CACHE.get(skinKey)
+        if skin is None:
+            if oFont is None:
+                oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(fontName, fontSize)
+            skin = TextButton._drawSkin(oFont, text, width, height, textColor, upColor, overColor, downColor,
+                                        enterToActivate)
+            _PYGWIDGETS_SKIN_CACHE.add(skinKey, skin)
+        return skin
+
+    @staticmethod
+    def _getSkinKey(text, width, height, textColor, upColor, overColor, downColor, fontName, fontSize,
+                    enterToActivate):
+        # Internal method, returns the key of the skin cache for a button built with these parameters
+        return ('TextButton', text, width, height, _makeColorKey(textColor), _makeColorKey(upColor),
+                _makeColorKey(overColor), _makeColorKey(downColor), fontName, fontSize, enterToActivate)
+
+    @staticmethod
+    def _drawSkin(oFont, text, width, height, textColor, upColor, overColor, downColor, enterToActivate):
+        """Internal method, draws the up, over, down, and disabled surfaces of a button.
+
+        Returns:
+            | a tuple of the font, and the up, over, down, and disabled surfaces
+
+        """
+        text = ' ' + text + ' '  # add padding for drawn text
 
         # create the text surface for up state of button (to get the size)
-        textSurfaceUp = self.font.render(text, True, self.textColor, self.upColor)
+        textSurfaceUp = _PYGWIDGETS_TEXT_CACHE.render(oFont, text, True, textColor, upColor)
         textRect = textSurfaceUp.get_rect()
         if width is None:
             # See if the text will fit inside the minimum width
@@ -869,7 +1879,7 @@ class TextButton(PygWidgetsButton):
             else:  # Make the width wide enough to handle all the text
                 width = textRect.width
 
-        buttonRect = pygame.Rect(loc[0], loc[1], width, height)
+        buttonRect = pygame.Rect(0, 0, width, height)
         w = buttonRect.width  # syntactic sugar
         h = buttonRect.height  # syntactic sugar
         size = buttonRect.size
@@ -878,7 +1888,7 @@ class TextButton(PygWidgetsButton):
 
         # draw the up button
         surfaceUp = pygame.Surface(size)
-        surfaceUp.fill(self.upColor)
+        surfaceUp.fill(upColor)
         surfaceUp.blit(textSurfaceUp, textRect)
         if enterToActivate:
             pygame.draw.rect(surfaceUp, PYGWIDGETS_BLACK, pygame.Rect((0, 0, w - 1, h - 1)), 2)  # thicker black border
@@ -897,8 +1907,8 @@ class TextButton(PygWidgetsButton):
 
         # draw the down button
         surfaceDown = pygame.Surface(size)
-        surfaceDown.fill(self.downColor)
-        textSurfaceDown = self.font.render(text, True, self.textColor, self.downColor)
+        surfaceDown.fill(downColor)
+        textSurfaceDown = _PYGWIDGETS_TEXT_CACHE.render(oFont, text, True, textColor, downColor)
         textOffsetByOneRect = pygame.Rect(textRect.left + 1, textRect.top + 1, textRect.width,
                                                 textRect.height)
         surfaceDown.blit(textSurfaceDown, textOffsetByOneRect)
@@ -912,8 +1922,8 @@ class TextButton(PygWidgetsButton):
 
         # draw the over button
         surfaceOver = pygame.Surface(size)
-        surfaceOver.fill(self.overColor)
-        textSurfaceOver = self.font.render(text, True, self.textColor, self.overColor)
+        surfaceOver.fill(overColor)
+        textSurfaceOver = _PYGWIDGETS_TEXT_CACHE.render(oFont, text, True, textColor, overColor)
         surfaceOver.blit(textSurfaceOver, textRect)
         pygame.draw.rect(surfaceOver, PYGWIDGETS_BLACK, pygame.Rect((0, 0, w, h)), 1)  # black border around everything
         pygame.draw.line(surfaceOver, PYGWIDGETS_WHITE, (1, 1), (w - 2, 1))
@@ -926,24 +1936,69 @@ class TextButton(PygWidgetsButton):
         # draw the disabled button
         surfaceDisabled = pygame.Surface(size)
         surfaceDisabled.fill(PYGWIDGETS_DISABLED_GRAY)
-        textSurfaceDisabled = self.font.render(text, True, PYGWIDGETS_GRAY, PYGWIDGETS_DISABLED_GRAY)
+        textSurfaceDisabled = _PYGWIDGETS_TEXT_CACHE.render(oFont, text, True, PYGWIDGETS_GRAY, PYGWIDGETS_DISABLED_GRAY)
         surfaceDisabled.blit(textSurfaceDisabled, textRect)
         pygame.draw.line(surfaceDisabled, PYGWIDGETS_GRAY, (1, h - 1), (w - 1, h - 1))
         pygame.draw.line(surfaceDisabled, PYGWIDGETS_GRAY, (w - 1, 1), (w - 1, h - 1))
         pygame.draw.line(surfaceDisabled, PYGWIDGETS_GRAY, (2, h - 2), (w - 2, h - 2))
         pygame.draw.line(surfaceDisabled, PYGWIDGETS_GRAY, (w - 2, 2), (w - 2, h - 2))
 
-        # call the PygWidgetsButton superclass to finish initialization
-
-        super().__init__(window, loc, surfaceUp, surfaceOver, surfaceDown, surfaceDisabled, 
-                         buttonRect, soundOnClick, nickname, enterToActivate, callBack, activationKeysList)
-
+        return oFont, surfaceUp, surfaceOver, surfaceDown, surfaceDisabled
 
 ## Older way to do the same thing:
 ##     super(TextButton, self).__init__(window, loc, surfaceUp, surfaceOver, surfaceDown, surfaceDisabled, 
 ##                   buttonRect, soundOnClick, nickname, enterToActivate)
 
 
+def buildTextButtons(window, buttonsList, width=None, height=40, textColor=PYGWIDGETS_BLACK,
+                     upColor=PYGWIDGETS_NORMAL_GRAY, overColor=PYGWIDGETS_OVER_GRAY, downColor=PYGWIDGETS_DOWN_GRAY,
+                     fontName=None, fontSize=20, soundOnClick=None, enterToActivate=False, callBack=None,
+                     sameWidth=False, activationKeysList=None):
+    """Builds many TextButtons that share the same look (e.g., a toolbar or a keypad) in one call.
+
+    The font is looked up only once, and buttons with the same text share their surfaces.
+
+        | keypadButtonsList = pygwidgets.buildTextButtons(window,
+        |                         [((20, 20), '7'), ((80, 20), '8'), ((140, 20), '9')],
+        |                         width=50, fontSize=24)
+
+    Parameters:
+        | window - the window to draw the buttons in
+        | buttonsList - a list of tuples, one for each button:  (loc, text) or (loc, text, nickname)
+
+    Optional keyword parameters:
+        | sameWidth - if True (and no width is given), make all buttons as wide as the widest one (default False)
+        | All other keyword parameters are the same as TextButton, and are used for every button
+
+    Returns:
+        |     a list of TextButton objects, in the same order as buttonsList
+
+    """
+    oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(fontName, fontSize)  # the only font lookup
+    if sameWidth and (width is None):
+        # Use the width that TextButton would choose for the widest text
+        width = TextButton.MINIMUM_WIDTH
+        for buttonTuple in buttonsList:
+            width = max(width, oFont.size(' ' + buttonTuple[1] + ' ')[0])
+
+    textButtonsList = []
+    for buttonTuple in buttonsList:
+        loc = buttonTuple[0]
+        text = buttonTuple[1]
+        nickname = buttonTuple[2] if len(buttonTuple) > 2 else None
+        # Get (or draw) the skin here with the font found above, and give it to the TextButton,
+        # so each button looks in the skin cache only once
+        skin = TextButton._getSkin(oFont, text, width, height, textColor, upColor, overColor, downColor,
+                                   fontName, fontSize, enterToActivate)
+        oTextButton = TextButton(window, loc, text, width=width, height=height, textColor=textColor,
+                                 upColor=upColor, overColor=overColor, downColor=downColor,
+                                 fontName=fontName, fontSize=fontSize, soundOnClick=soundOnClick,
+                                 enterToActivate=enterToActivate, callBack=callBack, nickname=nickname,
+                                 activationKeysList=activationKeysList, _skin=skin)
+        textButtonsList.append(oTextButton)
+    return textButtonsList
+
+
 class CustomButton(PygWidgetsButton):
     """CustomButton creates a button using custom images.
 
@@ -1070,9 +2125,8 @@ class PygWidgetsCheckBox(PygWidget):
         self.lastMouseDownOverButton = False # was the last mouse down event over the mouse button? (Track clicks.)
         if self.soundOnClick is not None:
             self.playSoundOnClick = True
-            if type(self.soundOnClick) is str:  # user specified sound path, load it here
-                pygame.mixer.init()
-                self.soundOnClick = pygame.mixer.Sound(self.soundOnClick)  # save in same instance variable
+            if type(self.soundOnClick) is str:  # user specified sound path, load it here (or share it)
+                self.soundOnClick = _PYGWIDGETS_SOUND_CACHE.loadSound(self.soundOnClick)  # save in same instance variable
         else:
             self.playSoundOnClick = False
 
@@ -1104,6 +2158,7 @@ class PygWidgetsCheckBox(PygWidget):
             return False
 
         clicked = False
+        previousSurface = self._getCurrentSurface()
 
         if (not self.mouseOverButton) and self.rect.collidepoint(eventObj.pos):
             # if mouse has entered the checkBox:
@@ -1146,11 +2201,14 @@ class PygWidgetsCheckBox(PygWidget):
                     self.callBack(self.nickname)  # call the callBack
                 
                 if self.playSoundOnClick:
-                    self.soundOnClick.play()
+                    _playSound(self.soundOnClick)
 
                 # switch state:
                 self.value = not self.value
 
+        if self._getCurrentSurface() is not previousSurface:
+            self.dirty = True
+
         return clicked
 
     def draw(self):
@@ -1159,25 +2217,31 @@ class PygWidgetsCheckBox(PygWidget):
             return
 
         # Blit the current checkbox's image.
+        self.window.blit(self._getCurrentSurface(), self.loc)
+
+    def getBlitInfo(self):
+        """Returns a tuple of the surface for the current state, and the location to draw it."""
+        return self._getCurrentSurface(), self.loc
 
+    def _getCurrentSurface(self):
+        """Internal method, returns the surface to show based on the current state."""
         if self.isEnabled:
             if self.mouseIsDown and self.lastMouseDownOverButton and self.mouseOverButton:
                 if self.value:
-                    self.window.blit(self.surfaceOnDown, self.loc)
+                    return self.surfaceOnDown
                 else:
-                    self.window.blit(self.surfaceOffDown, self.loc)
+                    return self.surfaceOffDown
             else:
                 if self.value:
-                    self.window.blit(self.surfaceOn, self.loc)
+                    return self.surfaceOn
                 else:
-                    self.window.blit(self.surfaceOff, self.loc)
-
+                    return self.surfaceOff
 
         else:
             if self.value:
-                self.window.blit(self.surfaceOnDisabled, self.loc)
+                return self.surfaceOnDisabled
             else:
-                self.window.blit(self.surfaceOffDisabled, self.loc)
+                return self.surfaceOffDisabled
 
 
     def getValue(self):    # This is the key method for getting the current value of the checkbox
@@ -1187,10 +2251,12 @@ class PygWidgetsCheckBox(PygWidget):
     def setValue(self, trueOrFalse):
         """Sets a new value for the checkBox to the value passed in."""
         self.value = trueOrFalse
+        self.dirty = True
 
     def toggleValue(self):
         """Switches the current value of a checkBox and returns the new value"""
         self.value = not self.value
+        self.dirty = True
         return self.value
 
 
@@ -1247,10 +2313,34 @@ class TextCheckBox(PygWidgetsCheckBox):
         if nickname is None:
             nickname = text  # use the text on the button as the internal name
 
-        # Create the button's surfaces.
+        # Create the button's surfaces.  Identical checkboxes share their surfaces,
+        # and all checkboxes with the same box size and colors share the parts used to draw the box.
+        skinKey = ('TextCheckBox', text, fontName, fontSize, size, _makeColorKey(insideColor),
+                   _makeColorKey(insideDownColor), _makeColorKey(textColor))
+        skin = _PYGWIDGETS_SKIN_CACHE.get(skinKey)
+        if skin is None:
+            skin = TextCheckBox._drawSkin(text, fontName, fontSize, size, insideColor, insideDownColor, textColor)
+            _PYGWIDGETS_SKIN_CACHE.add(skinKey, skin)
+        (self.font, self.fontHeight, boxSize, surfaceOn, surfaceOff, surfaceOnDown, surfaceOffDown,
+                surfaceOnDisabled, surfaceOffDisabled) = skin
+        checkBoxRect = pygame.Rect(loc[0], loc[1], boxSize[0], boxSize[1])
 
-        self.font = _PYGWIDGETS_FONT_MANAGER.loadFont(fontName, fontSize)
-        self.fontHeight = self.font.size('Anything')[1]  # returns a tuple of (width, height)
+        super().__init__(window, loc, checkBoxRect, 
+                                             surfaceOn, surfaceOff, 
+                                             surfaceOnDown, surfaceOffDown, 
+                                             surfaceOnDisabled, surfaceOffDisabled, 
+                                             soundOnClick, value, nickname, callBack)
+
+    @staticmethod
+    def _drawSkin(text, fontName, fontSize, size, insideColor, insideDownColor, textColor):
+        """Internal method, draws the six surfaces of a checkbox from the (cached) box parts and label.
+
+        Returns:
+            | a tuple of the font, the font height, the size of the surfaces, and the six surfaces
+
+        """
+        oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(fontName, fontSize)
+        fontHeight = oFont.size('Anything')[1]  # returns a tuple of (width, height)
 
         if text == '':
             actualWidth = size
@@ -1259,87 +2349,90 @@ class TextCheckBox(PygWidgetsCheckBox):
             textSurfaceGray = None
             textOffset = 0
         else:
-            textSurface = self.font.render(text, True, self.textColor)
-            textSurfaceGray = self.font.render(text, True, PYGWIDGETS_DISABLED_GRAY)
+            textSurface = _PYGWIDGETS_TEXT_CACHE.render(oFont, text, True, textColor)
+            textSurfaceGray = _PYGWIDGETS_TEXT_CACHE.render(oFont, text, True, PYGWIDGETS_DISABLED_GRAY)
             thisRect = textSurface.get_rect()
             textOffset = size + 4  # to offset from checkbox, where to start the text
             actualWidth = thisRect.width + textOffset
 
-            if size > self.fontHeight:
+            if size > fontHeight:
                 actualHeight = size
             else:
-                actualHeight = self.fontHeight
+                actualHeight = fontHeight
+        boxSize = (actualWidth, actualHeight)
+
+        partsKey = ('TextCheckBox parts', size, _makeColorKey(insideColor), _makeColorKey(insideDownColor))
+        partsTuple = _PYGWIDGETS_SKIN_CACHE.get(partsKey)
+        if partsTuple is None:
+            partsTuple = TextCheckBox._drawBoxParts(size, insideColor, insideDownColor)
+            partsTuple = tuple(pygame.Surface.convert_alpha(part) for part in partsTuple)  # optimizes blitting
+            _PYGWIDGETS_SKIN_CACHE.add(partsKey, partsTuple)
+        partOn, partOff, partOnDown, partOffDown, partOnDisabled, partOffDisabled = partsTuple
+
+        textLoc = (textOffset, 0)
+        surfaceOn = _composeStateSurface(boxSize, partOn, textSurface, textLoc)
+        surfaceOff = _composeStateSurface(boxSize, partOff, textSurface, textLoc)
+        surfaceOnDown = _composeStateSurface(boxSize, partOnDown, textSurface, textLoc)
+        surfaceOffDown = _composeStateSurface(boxSize, partOffDown, textSurface, textLoc)
+        surfaceOnDisabled = _composeStateSurface(boxSize, partOnDisabled, textSurfaceGray, textLoc)
+        surfaceOffDisabled = _composeStateSurface(boxSize, partOffDisabled, textSurfaceGray, textLoc)
+        return (oFont, fontHeight, boxSize, surfaceOn, surfaceOff, surfaceOnDown, surfaceOffDown,
+                surfaceOnDisabled, surfaceOffDisabled)
+
+    @staticmethod
+    def _drawBoxParts(size, insideColor, insideDownColor):
+        """Internal method, draws the box (without the label) for each of the six states of a checkbox.
 
-        checkBoxRect = pygame.Rect(loc[0], loc[1], actualWidth, actualHeight)
+        Returns:
+            | a tuple of the on, off, onDown, offDown, onDisabled, and offDisabled box surfaces
 
+        """
         w = size  # syntactic sugar
         h = size  # syntactic sugar
-        boxSize = (actualWidth, actualHeight)
+        # Leave room for lines that are drawn past the edge of the box, these are clipped when used
+        partSize = (size + 4, size + 4)
 
         # draw the On checkBox, with an X across it to show On state
-        surfaceOn = pygame.Surface(boxSize, pygame.SRCALPHA, 32)
-        pygame.draw.rect(surfaceOn, self.insideColor, pygame.Rect(0, 0, w, h), 0)  # fill the box with inside color
-        pygame.draw.rect(surfaceOn, PYGWIDGETS_BLACK, pygame.Rect(0, 0, w, h), 1)  # black border around everything
-        pygame.draw.line(surfaceOn, PYGWIDGETS_BLACK, (0, 0), (w - 2, h - 1), 2)
-        pygame.draw.line(surfaceOn, PYGWIDGETS_BLACK, (0, h), (w - 2, 0), 2)
-        if text != '':
-            surfaceOn.blit(textSurface, (textOffset, 0))
-            surfaceOn = pygame.Surface.convert_alpha(surfaceOn)  # optimizes blitting
+        partOn = pygame.Surface(partSize, pygame.SRCALPHA, 32)
+        pygame.draw.rect(partOn, insideColor, pygame.Rect(0, 0, w, h), 0)  # fill the box with inside color
+        pygame.draw.rect(partOn, PYGWIDGETS_BLACK, pygame.Rect(0, 0, w, h), 1)  # black border around everything
+        pygame.draw.line(partOn, PYGWIDGETS_BLACK, (0, 0), (w - 2, h - 1), 2)
+        pygame.draw.line(partOn, PYGWIDGETS_BLACK, (0, h), (w - 2, 0), 2)
 
         # draw the Off checkBox
-        surfaceOff = pygame.Surface(boxSize, pygame.SRCALPHA, 32)
-        pygame.draw.rect(surfaceOff, self.insideColor, pygame.Rect(0, 0, w, h), 0)  # fill the box with inside color
-        pygame.draw.rect(surfaceOff, PYGWIDGETS_BLACK, pygame.Rect(0, 0, w, h), 1)  # black border around everything
-        if text != '':
-            surfaceOff.blit(textSurface, (textOffset, 0))
-            surfaceOff = pygame.Surface.convert_alpha(surfaceOff)  # optimizes blitting
+        partOff = pygame.Surface(partSize, pygame.SRCALPHA, 32)
+        pygame.draw.rect(partOff, insideColor, pygame.Rect(0, 0, w, h), 0)  # fill the box with inside color
+        pygame.draw.rect(partOff, PYGWIDGETS_BLACK, pygame.Rect(0, 0, w, h), 1)  # black border around everything
 
         # draw the OnDown checkBox, with an X across it to show On state
-        surfaceOnDown = pygame.Surface(boxSize, pygame.SRCALPHA, 32)
-        pygame.draw.rect(surfaceOnDown, self.insideDownColor, pygame.Rect(0, 0, w, h), 0)
+        partOnDown = pygame.Surface(partSize, pygame.SRCALPHA, 32)
+        pygame.draw.rect(partOnDown, insideDownColor, pygame.Rect(0, 0, w, h), 0)
         # fill the box with inside color
-        pygame.draw.rect(surfaceOnDown, PYGWIDGETS_BLACK, pygame.Rect(0, 0, w, h), 1)  # black border around everything
-        pygame.draw.line(surfaceOnDown, PYGWIDGETS_BLACK, (0, 0), (w - 2, h - 1), 2)
-        pygame.draw.line(surfaceOnDown, PYGWIDGETS_BLACK, (0, h), (w - 2, 0), 2)
-        if text != '':
-            surfaceOnDown.blit(textSurface, (textOffset, 0))
-            surfaceOnDown = pygame.Surface.convert_alpha(surfaceOnDown)  # optimizes blitting
+        pygame.draw.rect(partOnDown, PYGWIDGETS_BLACK, pygame.Rect(0, 0, w, h), 1)  # black border around everything
+        pygame.draw.line(partOnDown, PYGWIDGETS_BLACK, (0, 0), (w - 2, h - 1), 2)
+        pygame.draw.line(partOnDown, PYGWIDGETS_BLACK, (0, h), (w - 2, 0), 2)
 
         # draw the OffDown checkBox
-        surfaceOffDown = pygame.Surface(boxSize, pygame.SRCALPHA, 32)
-        pygame.draw.rect(surfaceOffDown, self.insideDownColor, pygame.Rect(0, 0, w, h), 0)
-        pygame.draw.rect(surfaceOffDown, PYGWIDGETS_BLACK, pygame.Rect(0, 0, w, h), 1)  # black border around everything
-        if text != '':
-            surfaceOffDown.blit(textSurface, (textOffset, 0))
-            surfaceOffDown = pygame.Surface.convert_alpha(surfaceOffDown)  # optimizes blitting
+        partOffDown = pygame.Surface(partSize, pygame.SRCALPHA, 32)
+        pygame.draw.rect(partOffDown, insideDownColor, pygame.Rect(0, 0, w, h), 0)
+        pygame.draw.rect(partOffDown, PYGWIDGETS_BLACK, pygame.Rect(0, 0, w, h), 1)  # black border around everything
 
         # draw the OnDisabled checkBox, with an X across it to show On state
-        surfaceOnDisabled = pygame.Surface(boxSize, pygame.SRCALPHA, 32)
-        pygame.draw.rect(surfaceOnDisabled, PYGWIDGETS_DISABLED_GRAY, pygame.Rect(0, 0, w, h),
+        partOnDisabled = pygame.Surface(partSize, pygame.SRCALPHA, 32)
+        pygame.draw.rect(partOnDisabled, PYGWIDGETS_DISABLED_GRAY, pygame.Rect(0, 0, w, h),
                          0)  # fill the box with disabled color
-        pygame.draw.rect(surfaceOnDisabled, PYGWIDGETS_DISABLED_GRAY, pygame.Rect(0, 0, w, h), 1)  # black border around everything
-        pygame.draw.line(surfaceOnDisabled, PYGWIDGETS_BLACK, (0, 0), (w - 2, h - 1), 2)
-        pygame.draw.line(surfaceOnDisabled, PYGWIDGETS_BLACK, (0, h), (w - 2, 0), 2)
-        if nickname != '':
-            surfaceOnDisabled.blit(textSurfaceGray, (textOffset, 0))
-            surfaceOnDisabled = pygame.Surface.convert_alpha(surfaceOnDisabled)  # optimizes blitting
+        pygame.draw.rect(partOnDisabled, PYGWIDGETS_DISABLED_GRAY, pygame.Rect(0, 0, w, h), 1)  # black border around everything
+        pygame.draw.line(partOnDisabled, PYGWIDGETS_BLACK, (0, 0), (w - 2, h - 1), 2)
+        pygame.draw.line(partOnDisabled, PYGWIDGETS_BLACK, (0, h), (w - 2, 0), 2)
 
         # draw the OffDisabled checkBox
-        surfaceOffDisabled = pygame.Surface(boxSize, pygame.SRCALPHA, 32)
-        pygame.draw.rect(surfaceOffDisabled, PYGWIDGETS_DISABLED_GRAY, pygame.Rect(0, 0, w, h),
+        partOffDisabled = pygame.Surface(partSize, pygame.SRCALPHA, 32)
+        pygame.draw.rect(partOffDisabled, PYGWIDGETS_DISABLED_GRAY, pygame.Rect(0, 0, w, h),
                          0)  # fill the box with disabled color
-        pygame.draw.rect(surfaceOffDisabled, PYGWIDGETS_DISABLED_GRAY, pygame.Rect(0, 0, w, h),
+        pygame.draw.rect(partOffDisabled, PYGWIDGETS_DISABLED_GRAY, pygame.Rect(0, 0, w, h),
                          1)  # black border around everything
-        if text != '':
-            surfaceOffDisabled.blit(textSurfaceGray, (textOffset, 0))
-            surfaceOffDisabled = pygame.Surface.convert_alpha(surfaceOffDisabled)  # optimizes blitting
 
-
-        super().__init__(window, loc, checkBoxRect, 
-                                             surfaceOn, surfaceOff, 
-                                             surfaceOnDown, surfaceOffDown, 
-                                             surfaceOnDisabled, surfaceOffDisabled, 
-                                             soundOnClick, value, nickname, callBack)
+        return partOn, partOff, partOnDown, partOffDown, partOnDisabled, partOffDisabled
 
 
 class CustomCheckBox(PygWidgetsCheckBox):
@@ -1433,6 +2526,85 @@ class CustomCheckBox(PygWidgetsCheckBox):
 # RADIOBUTTON
 #
 #
+class RadioGroup():
+    """RadioGroup - a group of radio buttons, only one of which can be selected at a time.
+
+    You do not need to create a RadioGroup yourself.  When you create a radio button, you give
+    the name of its group, and the radio button finds (or creates) the group with that name.
+    You can get the group of a radio button by calling its getRadioGroup method.
+    (You can also create a RadioGroup, and pass it to radio buttons instead of a group name.
+    Its name must not be the name of another group that still has radio buttons.)
+
+    The group keeps track of the selected radio button, so selecting a radio button, and finding the
+    selected one, take the same time no matter how many radio buttons are in the group.
+
+    The group only keeps weak references to its radio buttons, so a radio button that your program
+    no longer uses is removed from the group automatically.  When all radio buttons of a group are
+    gone, the group itself is removed.
+
+    Parameters:
+        | name - the name of the group
+
+    """
+    def __init__(self, name):
+        self.name = name
+        self.membersSet = weakref.WeakSet()  # radio buttons in this group
+        self.selectedRef = None  # weak reference to the selected radio button, or None
+
+    def add(self, oRadioButton):
+        """Adds a radio button to the group (radio buttons add themselves when they are created).
+
+        If the radio button is on, it becomes the selected radio button, and the one that
+        was selected is turned off, so that only one radio button in the group is ever on.
+
+        """
+        self.membersSet.add(oRadioButton)
+        if oRadioButton.getValue():
+            self.select(oRadioButton)
+
+    def select(self, oRadioButton):
+        """Selects a radio button in the group, and turns off the one that was selected."""
+        oPrevious = self.getSelected()
+        if (oPrevious is not None) and (oPrevious is not oRadioButton):
+            oPrevious.value = False
+            oPrevious.dirty = True
+        self.selectedRef = weakref.ref(oRadioButton)
+        oRadioButton.value = True
+        oRadioButton.dirty = True
+
+    def getSelected(self):
+        """Returns the selected radio button, or None if no radio button is selected."""
+        if self.selectedRef is None:
+            return None
+        return self.selectedRef()  # None if the radio button no longer exists
+
+    def getName(self):
+        """Returns the name of the group."""
+        return self.name
+
+    def getMembers(self):
+        """Returns a list of the radio buttons in the group."""
+        return list(self.membersSet)
+
+    def enable(self):
+        """Enables all radio buttons in the group."""
+        for oRadioButton in list(self.membersSet):
+            oRadioButton.enable()
+
+    def disable(self):
+        """Disables all radio buttons in the group."""
+        for oRadioButton in list(self.membersSet):
+            oRadioButton.disable()
+
+    def _deselect(self, oRadioButton):
+        # Internal method, called when a radio button in the group is turned off
+        if self.getSelected() is oRadioButton:
+            self.selectedRef = None
+
+    def __len__(self):
+        return len(self.membersSet)
+
+
 class PygWidgetsRadioButton(PygWidget):
     """PygWidgetsRadioButton is the base class for TextRadioButton and CustomRadioButton
 
@@ -1440,12 +2612,12 @@ class PygWidgetsRadioButton(PygWidget):
     Instead you should create an instance of TextRadioButton or CustomRadioButton.
 
     """
-    #  The following is a class variable (dict) that is used to keep track of all groups of RadioButtons.
-    #  Each group has a group name (used as a key), and a list of radioButton objects (as the value).
-    #  This makes it easy to send a "turn yourself off" message to all members of a group,
-    #     before turning on the selected button.  It also makes it easy to find the currently
-    #     selected radioButton, when it is requested.
-    __PygWidgets__Radio__Buttons__Groups__Dicts__ = {}
+    #  The following is a class variable that is used to keep track of all groups of RadioButtons.
+    #  Each group has a group name (used as a key), and a RadioGroup object (as the value).
+    #  The RadioGroup keeps track of the selected radio button, so it can send a "turn yourself off"
+    #     message to it before turning on a different button.  The dictionary only keeps weak
+    #     references, so a group disappears when none of its radio buttons exist any more.
+    __PygWidgets__Radio__Buttons__Groups__Dicts__ = weakref.WeakValueDictionary()
 
 
     @abstractmethod
@@ -1466,7 +2638,6 @@ class PygWidgetsRadioButton(PygWidget):
         self.soundOnClick = soundOnClick
         self.value = value
         self.callBack = callBack
-        self.obj = self   # save a reference to ourselves
 
         # used to track the state of the radioButton
         self.buttonDown = False # is the radioButton currently pushed down?
@@ -1474,25 +2645,28 @@ class PygWidgetsRadioButton(PygWidget):
         self.lastMouseDownOverButton = False # was the last mouse down event over the mouse button? (Track clicks.)
         if self.soundOnClick is not None:
             self.playSoundOnClick = True
-            if type(self.soundOnClick) is str:  # user specified sound path, load it here
-                pygame.mixer.init()
-                self.soundOnClick = pygame.mixer.Sound(self.soundOnClick)  # save in same instance variable
+            if type(self.soundOnClick) is str:  # user specified sound path, load it here (or share it)
+                self.soundOnClick = _PYGWIDGETS_SOUND_CACHE.loadSound(self.soundOnClick)  # save in same instance variable
         else:
             self.playSoundOnClick = False
 
         self.mouseIsDown = False
 
-        #print('In init:', PygWidgetsRadioButton.__PygWidgets__Radio__Buttons__Groups__Dicts__)
-        if self.group in PygWidgetsRadioButton.__PygWidgets__Radio__Buttons__Groups__Dicts__:
-            # find the group
-            thisGroupList = PygWidgetsRadioButton.__PygWidgets__Radio__Buttons__Groups__Dicts__[self.group]
-            thisGroupList.append(self.obj)  # add this radio button object to the group
-            #  Testing: print('GroupList', self.group, 'is;', thisGroupList)
-
-
-        else:  # new group, not seen before
-            # Add a new group, and set the value to a list of the first object
-            PygWidgetsRadioButton.__PygWidgets__Radio__Buttons__Groups__Dicts__[self.group] = [self.obj]
+        groupsDict = PygWidgetsRadioButton.__PygWidgets__Radio__Buttons__Groups__Dicts__
+        if isinstance(group, RadioGroup):  # caller built the group
+            self.oRadioGroup = group
+            self.group = group.getName()
+            oOtherGroup = groupsDict.get(self.group)
+            if (oOtherGroup is not None) and (oOtherGroup is not group) and (len(oOtherGroup) > 0):
+                raise ValueError('RadioGroup: there is already a group named ' + repr(self.group))
+            groupsDict[self.group] = group  # radio buttons created later with this name join this group
+        else:
+            self.oRadioGroup = groupsDict.get(self.group)
+            if self.oRadioGroup is None:  # new group, not seen before
+                self.oRadioGroup = RadioGroup(self.group)
+                groupsDict[self.group] = self.oRadioGroup
+        # The radio button keeps its group alive, the group only has a weak reference to the radio button
+        self.oRadioGroup.add(self)
 
 
     def handleEvent(self, eventObj):
@@ -1519,6 +2693,7 @@ class PygWidgetsRadioButton(PygWidget):
             return False
 
         clicked = False
+        previousSurface = self._getCurrentSurface()
 
         if (not self.mouseOverButton) and self.rect.collidepoint(eventObj.pos):
             # if mouse has entered the radioButton:
@@ -1559,37 +2734,36 @@ class PygWidgetsRadioButton(PygWidget):
                 if self.callBack is not None:
                     self.callBack(self.nickname)  # call the callBack
 
-                # Turn all radio buttons in this group off
-                for radioButton in PygWidgetsRadioButton.__PygWidgets__Radio__Buttons__Groups__Dicts__[self.group]:
-                    radioButton.setValue(False)
-                self.setValue(True)   # And turn the current one (the one that was clicked) on
+                # Turn the selected radio button in this group off,
+                # and turn the current one (the one that was clicked) on
+                self.oRadioGroup.select(self)
                 
                 if self.playSoundOnClick:
-                    self.soundOnClick.play()
+                    _playSound(self.soundOnClick)
 
         if clicked:
             if self.callBack is not None:
                 self.callBack(self.nickname)
 
+        if self._getCurrentSurface() is not previousSurface:
+            self.dirty = True
+
         return clicked
 
     def getSelectedRadioButton(self):
         """Returns the nickname of the currently selected radio button."""
-        radioButtonListInGroup = PygWidgetsRadioButton.__PygWidgets__Radio__Buttons__Groups__Dicts__[self.group]
-        for radioButton in radioButtonListInGroup:
-            if radioButton.getValue():
-                selectedNickname = radioButton.getNickname()
-                return selectedNickname
-
-        raise RuntimeError('No radio button was selected')
+        oSelected = self.oRadioGroup.getSelected()
+        if oSelected is None:
+            raise RuntimeError('No radio button was selected')
+        return oSelected.getNickname()
 
     def setSelectedRadioButton(self):
         """Sets this radio button on (and turns currently selected off)."""
-        radioButtonListInGroup = PygWidgetsRadioButton.__PygWidgets__Radio__Buttons__Groups__Dicts__[self.group]
-        for radioButton in radioButtonListInGroup:
-            radioButton.setValue(False)
-        self.setValue(True)
-        return
+        self.oRadioGroup.select(self)
+
+    def getRadioGroup(self):
+        """Returns the RadioGroup object of the group that this radio button belongs to."""
+        return self.oRadioGroup
 
 
     def draw(self):
@@ -1598,23 +2772,31 @@ class PygWidgetsRadioButton(PygWidget):
             return
 
         # Blit the radioButton's appropriate appearance
+        self.window.blit(self._getCurrentSurface(), self.loc)
+
+    def getBlitInfo(self):
+        """Returns a tuple of the surface for the current state, and the location to draw it."""
+        return self._getCurrentSurface(), self.loc
+
+    def _getCurrentSurface(self):
+        """Internal method, returns the surface to show based on the current state."""
         if self.isEnabled:
             if self.mouseIsDown and self.lastMouseDownOverButton and self.mouseOverButton:
                 if self.value:
-                    self.window.blit(self.surfaceOnDown, self.loc)
+                    return self.surfaceOnDown
                 else:
-                    self.window.blit(self.surfaceOffDown, self.loc)
+                    return self.surfaceOffDown
             else:
                 if self.value:
-                    self.window.blit(self.surfaceOn, self.loc)
+                    return self.surfaceOn
                 else:
-                    self.window.blit(self.surfaceOff, self.loc)
+                    return self.surfaceOff
 
         else:  # show disabled state
             if self.value:
-                self.window.blit(self.surfaceOnDisabled, self.loc)
+                return self.surfaceOnDisabled
             else:
-                self.window.blit(self.surfaceOffDisabled, self.loc)
+                return self.surfaceOffDisabled
 
 
     def enable(self, allInGroup=False):
@@ -1625,9 +2807,7 @@ class PygWidgetsRadioButton(PygWidget):
 
     def enableGroup(self):
         """Enables all radio buttons in the group."""
-        radioButtonListInGroup = PygWidgetsRadioButton.__PygWidgets__Radio__Buttons__Groups__Dicts__[self.group]
-        for radioButton in radioButtonListInGroup:
-            radioButton.enable()  # enable all in this group
+        self.oRadioGroup.enable()  # enable all in this group
 
     def disable(self, allInGroup=False):
         """Disables the current radio button"""
@@ -1637,13 +2817,18 @@ class PygWidgetsRadioButton(PygWidget):
 
     def disableGroup(self):
         """Disables all radio buttons in the group"""
-        radioButtonListInGroup = PygWidgetsRadioButton.__PygWidgets__Radio__Buttons__Groups__Dicts__[self.group]
-        for radioButton in radioButtonListInGroup:
-            radioButton.disable()  # not recursive
+        self.oRadioGroup.disable()  # not recursive
 
     def setValue(self, trueOrFalse):
-        """Sets the value of the current radio button True or False."""
-        self.value = trueOrFalse
+        """Sets the value of the current radio button True or False.
+        (Setting it to True turns off the radio button that was selected in the group.)
+        """
+        if trueOrFalse:
+            self.oRadioGroup.select(self)
+        else:
+            self.value = False
+            self.dirty = True
+            self.oRadioGroup._deselect(self)
 
     def getValue(self):
         """Returns the current value of the current radio button (True or False)."""
@@ -1652,6 +2837,7 @@ class PygWidgetsRadioButton(PygWidget):
     def removeGroup(self, groupName):
         """Removes a group of radio buttons
             This could be called when leaving a page/scene, so the group is eliminated.
+            (Groups are also removed automatically when none of their radio buttons exist any more.)
 
         """
         if groupName in PygWidgetsRadioButton.__PygWidgets__Radio__Buttons__Groups__Dicts__:
@@ -1694,6 +2880,7 @@ class TextRadioButton(PygWidgetsRadioButton):
 
     Optional keyword parameters:
         | value - True for on, False for off  (defaults to False)
+        |         (if True, the radio button that was on in the same group is turned off)
         | fontName - font to use for text, or font file, or None for system font (default is None)
         | fontSize - size of the font to use (defaults to 20)
         | value - True for on, False for off  (defaults to False)
@@ -1713,72 +2900,113 @@ class TextRadioButton(PygWidgetsRadioButton):
                     soundOnClick=None, nickname=None, callBack=None):
 
 
-        radius = TextRadioButton.CIRCLE_DIAMETER // 2
-        center = TextRadioButton.CIRCLE_DIAMETER // 2
         if nickname is None:
             nickname = text  # use the text on the button as the internal name
 
-        # set up to draw the different states of the radioButton
-        self.font = _PYGWIDGETS_FONT_MANAGER.loadFont(fontName, fontSize)
-        self.fontHeight = self.font.size('Anything')[1]   # returns a tuple of (width, height)
+        # set up to draw the different states of the radioButton.  Identical radio buttons share their
+        # surfaces, and all radio buttons with the same circle colors share the parts used to draw the circle.
+        skinKey = ('TextRadioButton', text, fontName, fontSize,
+                   _makeColorKey(textColorSelected), _makeColorKey(circleColorSelected),
+                   _makeColorKey(textColorDeselected), _makeColorKey(circleColorDeselected))
+        skin = _PYGWIDGETS_SKIN_CACHE.get(skinKey)
+        if skin is None:
+            skin = TextRadioButton._drawSkin(text, fontName, fontSize, textColorSelected, circleColorSelected,
+                                             textColorDeselected, circleColorDeselected)
+            _PYGWIDGETS_SKIN_CACHE.add(skinKey, skin)
+        (self.font, self.fontHeight, buttonSize, surfaceOn, surfaceOff, surfaceOnDown, surfaceOffDown,
+                surfaceOnDisabled, surfaceOffDisabled) = skin
+        thisRect = pygame.Rect(loc[0], loc[1], buttonSize[0], buttonSize[1])
+
+        # call the PygWidgetsRadio superclass to initialize
+        super().__init__(window, loc, group, thisRect, 
+                                          surfaceOn, surfaceOff, 
+                                          surfaceOnDown, surfaceOffDown, 
+                                          surfaceOnDisabled, surfaceOffDisabled, 
+                                          soundOnClick, value, nickname, callBack)
+
+    @staticmethod
+    def _drawSkin(text, fontName, fontSize, textColorSelected, circleColorSelected,
+                  textColorDeselected, circleColorDeselected):
+        """Internal method, draws the six surfaces of a radio button from the (cached) circle parts and label.
+
+        Returns:
+            | a tuple of the font, the font height, the size of the surfaces, and the six surfaces
 
-        textSurfaceSelected = self.font.render(text, True, textColorSelected)
-        textSurfaceDeselected = self.font.render(text, True, textColorDeselected)
-        textSurfaceGray = self.font.render(text, True, PYGWIDGETS_DISABLED_GRAY)
+        """
+        oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(fontName, fontSize)
+        fontHeight = oFont.size('Anything')[1]   # returns a tuple of (width, height)
+
+        textSurfaceSelected = _PYGWIDGETS_TEXT_CACHE.render(oFont, text, True, textColorSelected)
+        textSurfaceDeselected = _PYGWIDGETS_TEXT_CACHE.render(oFont, text, True, textColorDeselected)
+        textSurfaceGray = _PYGWIDGETS_TEXT_CACHE.render(oFont, text, True, PYGWIDGETS_DISABLED_GRAY)
         thisRect = textSurfaceSelected.get_rect()
         actualWidth = thisRect.width + TextRadioButton.TEXT_OFFSET
 
-        if TextRadioButton.CIRCLE_DIAMETER > self.fontHeight:
+        if TextRadioButton.CIRCLE_DIAMETER > fontHeight:
             actualHeight = TextRadioButton.CIRCLE_DIAMETER
         else:
-            actualHeight = self.fontHeight
-        thisRect = pygame.Rect(loc[0], loc[1], actualWidth, actualHeight)
+            actualHeight = fontHeight
+        buttonSize = (actualWidth, actualHeight)
+
+        partsKey = ('TextRadioButton parts', _makeColorKey(circleColorSelected), _makeColorKey(circleColorDeselected))
+        partsTuple = _PYGWIDGETS_SKIN_CACHE.get(partsKey)
+        if partsTuple is None:
+            partsTuple = TextRadioButton._drawCircleParts(circleColorSelected, circleColorDeselected)
+            partsTuple = tuple(pygame.Surface.convert_alpha(part) for part in partsTuple)  # optimizes blitting
+            _PYGWIDGETS_SKIN_CACHE.add(partsKey, partsTuple)
+        partOn, partOff, partOnDown, partOnDisabled, partOffDisabled = partsTuple
 
         # For each state of the button, create one larger surface, then blit the circle and the text
+        textLoc = (TextRadioButton.TEXT_OFFSET, 0)
+        surfaceOn = _composeStateSurface(buttonSize, partOn, textSurfaceSelected, textLoc)
+        surfaceOff = _composeStateSurface(buttonSize, partOff, textSurfaceDeselected, textLoc)
+        surfaceOnDown = _composeStateSurface(buttonSize, partOnDown, textSurfaceSelected, textLoc)
+        surfaceOffDown = surfaceOnDown   # Copy the same surface as the onDown state
+        surfaceOnDisabled = _composeStateSurface(buttonSize, partOnDisabled, textSurfaceGray, textLoc)
+        surfaceOffDisabled = _composeStateSurface(buttonSize, partOffDisabled, textSurfaceGray, textLoc)
+        return (oFont, fontHeight, buttonSize, surfaceOn, surfaceOff, surfaceOnDown, surfaceOffDown,
+                surfaceOnDisabled, surfaceOffDisabled)
+
+    @staticmethod
+    def _drawCircleParts(circleColorSelected, circleColorDeselected):
+        """Internal method, draws the circle (without the label) for the states of a radio button.
+
+        Returns:
+            | a tuple of the on, off, onDown (also used for offDown), onDisabled, and offDisabled circle surfaces
+
+        """
+        radius = TextRadioButton.CIRCLE_DIAMETER // 2
+        center = TextRadioButton.CIRCLE_DIAMETER // 2
+        # Leave room for pixels drawn past the edge of the circle, these are clipped when used
+        partSize = (TextRadioButton.CIRCLE_DIAMETER + 2, TextRadioButton.CIRCLE_DIAMETER + 2)
         # Special flags are needed to set the background alpha as transparent
 
         # draw the On TextRadioButton
-        surfaceOn = pygame.Surface((actualWidth, actualHeight), pygame.SRCALPHA, 32)
-        pygame.draw.circle(surfaceOn, PYGWIDGETS_WHITE, (center, center), radius, 0)
-        pygame.draw.circle(surfaceOn, circleColorSelected, (center, center), radius, TextRadioButton.CIRCLE_LINE_WIDTH)
-        pygame.draw.circle(surfaceOn, circleColorSelected, (center, center), 3, 0)
-        surfaceOn.blit(textSurfaceSelected, (TextRadioButton.TEXT_OFFSET, 0))
-        surfaceOn = pygame.Surface.convert_alpha(surfaceOn)  # optimizes blitting
+        partOn = pygame.Surface(partSize, pygame.SRCALPHA, 32)
+        pygame.draw.circle(partOn, PYGWIDGETS_WHITE, (center, center), radius, 0)
+        pygame.draw.circle(partOn, circleColorSelected, (center, center), radius, TextRadioButton.CIRCLE_LINE_WIDTH)
+        pygame.draw.circle(partOn, circleColorSelected, (center, center), 3, 0)
 
         # draw the Off TextRadioButton
-        surfaceOff = pygame.Surface((actualWidth, actualHeight), pygame.SRCALPHA, 32)
-        pygame.draw.circle(surfaceOff, PYGWIDGETS_WHITE, (center, center), radius, 0)
-        pygame.draw.circle(surfaceOff, circleColorDeselected, (center, center), radius, TextRadioButton.CIRCLE_LINE_WIDTH)
-        surfaceOff.blit(textSurfaceDeselected, (TextRadioButton.TEXT_OFFSET, 0))
-        surfaceOff = pygame.Surface.convert_alpha(surfaceOff)  # optimizes blitting
-
-        # draw the onDown and offDown surfaces
-        surfaceOnDown = pygame.Surface((actualWidth, actualHeight), pygame.SRCALPHA, 32)
-        pygame.draw.circle(surfaceOnDown, PYGWIDGETS_GRAY, (center, center), radius, 0)
-        pygame.draw.circle(surfaceOnDown, circleColorSelected, (center, center), radius, TextRadioButton.CIRCLE_LINE_WIDTH)
-        surfaceOnDown.blit(textSurfaceSelected, (TextRadioButton.TEXT_OFFSET, 0))
-        surfaceOnDown = pygame.Surface.convert_alpha(surfaceOnDown)  # optimizes blitting
-        surfaceOffDown = surfaceOnDown   # Copy the same surface as the onDown state
+        partOff = pygame.Surface(partSize, pygame.SRCALPHA, 32)
+        pygame.draw.circle(partOff, PYGWIDGETS_WHITE, (center, center), radius, 0)
+        pygame.draw.circle(partOff, circleColorDeselected, (center, center), radius, TextRadioButton.CIRCLE_LINE_WIDTH)
+
+        # draw the onDown (and offDown) TextRadioButton
+        partOnDown = pygame.Surface(partSize, pygame.SRCALPHA, 32)
+        pygame.draw.circle(partOnDown, PYGWIDGETS_GRAY, (center, center), radius, 0)
+        pygame.draw.circle(partOnDown, circleColorSelected, (center, center), radius, TextRadioButton.CIRCLE_LINE_WIDTH)
 
         # draw the OnDisabled radioButton
-        surfaceOnDisabled = pygame.Surface((actualWidth, actualHeight), pygame.SRCALPHA, 32)
-        pygame.draw.circle(surfaceOnDisabled, PYGWIDGETS_DISABLED_GRAY, (center, center), radius, TextRadioButton.CIRCLE_LINE_WIDTH)
-        pygame.draw.circle(surfaceOnDisabled, PYGWIDGETS_DISABLED_GRAY, (center, center), 3, 0)
-        surfaceOnDisabled.blit(textSurfaceGray, (TextRadioButton.TEXT_OFFSET, 0))
-        surfaceOnDisabled = pygame.Surface.convert_alpha(surfaceOnDisabled)  # optimizes blitting
+        partOnDisabled = pygame.Surface(partSize, pygame.SRCALPHA, 32)
+        pygame.draw.circle(partOnDisabled, PYGWIDGETS_DISABLED_GRAY, (center, center), radius, TextRadioButton.CIRCLE_LINE_WIDTH)
+        pygame.draw.circle(partOnDisabled, PYGWIDGETS_DISABLED_GRAY, (center, center), 3, 0)
 
         # draw the OffDisabled radioButton
-        surfaceOffDisabled = pygame.Surface((actualWidth, actualHeight), pygame.SRCALPHA, 32)
-        pygame.draw.circle(surfaceOffDisabled, PYGWIDGETS_DISABLED_GRAY, (center, center), radius, TextRadioButton.CIRCLE_LINE_WIDTH)
-        surfaceOffDisabled.blit(textSurfaceGray, (TextRadioButton.TEXT_OFFSET, 0))
-        surfaceOffDisabled = pygame.Surface.convert_alpha(surfaceOffDisabled)  # optimizes blitting
+        partOffDisabled = pygame.Surface(partSize, pygame.SRCALPHA, 32)
+        pygame.draw.circle(partOffDisabled, PYGWIDGETS_DISABLED_GRAY, (center, center), radius, TextRadioButton.CIRCLE_LINE_WIDTH)
 
-        # call the PygWidgetsRadio superclass to initialize
-        super().__init__(window, loc, group, thisRect, 
-                                          surfaceOn, surfaceOff, 
-                                          surfaceOnDown, surfaceOffDown, 
-                                          surfaceOnDisabled, surfaceOffDisabled, 
-                                          soundOnClick, value, nickname, callBack)
+        return partOn, partOff, partOnDown, partOnDisabled, partOffDisabled
 
 
 class CustomRadioButton(PygWidgetsRadioButton):
@@ -1820,6 +3048,7 @@ class CustomRadioButton(PygWidgetsRadioButton):
 
     Optional keyword parameters:
         | value - True for selected, False for not selected (defaults to False)
+        |         (if True, the radio button that was selected in the same group is deselected)
         | onDown - a path to the file with the radioButton's on down appearance. (defaults to copy of on)
         | offDown - a path to the file with the radioButton's off down appearance.(defaults to copy of off)
         | onDisabled - a path to a file with the radioButton's on appearance when not clickable. (defaults to copy of on)
@@ -1908,9 +3137,16 @@ class DisplayText(PygWidget):
         |     Note: If you want center or right justified, you probably want to specify a width value
         |     (Otherwise, with a single text line, you will not see any difference)
         | nickname - a text name to refer to this object (defaults to None)
+        | renderMode - 'surface' or 'atlas' (defaults to 'surface')
+        |     'surface' renders the text with the font whenever the text changes
+        |     'atlas' builds the text from a glyph atlas, where each character is rendered only once,
+        |     and reuses the same text image.  Use 'atlas' for text that changes very often,
+        |     like scores, timers, and counters.  The text has the same size and character
+        |     positions as in 'surface' mode, but the edges of characters may be shaded slightly differently.
 
     Raises:
         | ValueError if justified is not 'left', 'center', or 'right'
+        | ValueError if renderMode is not 'surface' or 'atlas'
 
 
     Inspired by a similar module written by David Clark (da_clark at shaw.ca)
@@ -1918,10 +3154,12 @@ class DisplayText(PygWidget):
 
     """
 
+    MAX_ATLAS_IMAGES = 8  # in atlas mode, the number of different sized text images to keep
+
     def __init__(self, window, loc=(0, 0), value='',
                  fontName=None, fontSize=18, width=None, height=None, 
                  textColor=PYGWIDGETS_BLACK, backgroundColor=None,
-                 justified='left', nickname=None):
+                 justified='left', nickname=None, renderMode='surface'):
 
 
         super().__init__(nickname)  # initialize base class
@@ -1937,6 +3175,12 @@ class DisplayText(PygWidget):
         if justified not in ('left', 'center', 'right'):
             raise ValueError('Value of justified was: ' + justified + '. Must be left, center, or right')
         self.justified = justified
+        if renderMode not in ('surface', 'atlas'):
+            raise ValueError('Value of renderMode was: ' + renderMode + '. Must be surface or atlas')
+        self.renderMode = renderMode
+        if renderMode == 'atlas':
+            self.oGlyphAtlas = _PYGWIDGETS_FONT_MANAGER.getGlyphAtlas(self.font, textColor)
+            self.atlasImagesDict = {}  # (width, height) -> text image to reuse
         self.textImage = None
 
         self.fontHeight = self.font.size('Anything')[1]   # returns a tuple of (width, height)
@@ -1967,12 +3211,16 @@ class DisplayText(PygWidget):
 
     def render(self):
         """ Convert the text into an image so it can be drawn in the window.  (Called by setValue.)"""
+        if self.renderMode == 'atlas':
+            self._renderFromAtlas()
+            return
+
         nLines = len(self.textLines)
         surfacesList = []  # build up a list of surfaces, one for each line of original text
         actualWidth = 0  # will eventually be set the width of longest line
 
         for line in self.textLines:
-            lineSurface = self.font.render(line, True, self.textColor)
+            lineSurface = _PYGWIDGETS_TEXT_CACHE.render(self.font, line, True, self.textColor)
             surfacesList.append(lineSurface)
             thisRect = lineSurface.get_rect()
             if thisRect.width > actualWidth:
@@ -2034,6 +3282,64 @@ class DisplayText(PygWidget):
             self.textImage = userSizedImage
             self.textImage = pygame.Surface.convert_alpha(self.textImage)  # optimizes blitting
 
+        self._notifyRectChanged()
+
+    def _renderFromAtlas(self):
+        # Internal method, builds the text image from glyphs with a single call to blits
+        layoutsList = []
+        actualWidth = 0  # will eventually be set the width of longest line
+        for line in self.textLines:
+            lineWidth, lineLayoutList = self.oGlyphAtlas.getLayout(line)
+            layoutsList.append((lineWidth, lineLayoutList))
+            if lineWidth > actualWidth:
+                actualWidth = lineWidth
+
+        heightOfOneLine = self.fontHeight
+        actualHeight = len(self.textLines) * heightOfOneLine
+        theWidth = actualWidth if self.userWidth is None else self.userWidth
+        theHeight = actualHeight if self.userHeight is None else self.userHeight
+        self.rect = pygame.Rect(self.loc[0], self.loc[1], theWidth, theHeight)
+
+        # Same placement as the image built by render:  each line is justified within the
+        # longest line, then that whole block is justified within the user specified area
+        if self.justified == 'left':
+            blockLeft = 0
+        elif self.justified == 'center':
+            blockLeft = int((theWidth - actualWidth) / 2)
+        else:  # right justified
+            blockLeft = theWidth - actualWidth
+
+        blitsList = []
+        thisLineTop = 0
+        for lineWidth, lineLayoutList in layoutsList:
+            if self.justified == 'left':
+                theLeft = blockLeft
+            elif self.justified == 'center':
+                theLeft = blockLeft + int((actualWidth - lineWidth) / 2)
+            else:  # right justified
+                theLeft = blockLeft + actualWidth - lineWidth
+            for glyph, (x, y) in lineLayoutList:
+                blitsList.append((glyph, (theLeft + x, thisLineTop)))
+            thisLineTop = thisLineTop + heightOfOneLine
+
+        # Text images are kept and reused by size.  Changing text usually only switches
+        # between a few sizes (e.g., numbers with different numbers of digits)
+        textImage = self.atlasImagesDict.get((theWidth, theHeight))
+        if textImage is None:
+            if len(self.atlasImagesDict) >= DisplayText.MAX_ATLAS_IMAGES:
+                self.atlasImagesDict.clear()
+            textImage = pygame.Surface((theWidth, theHeight), flags=SRCALPHA)
+            textImage = pygame.Surface.convert_alpha(textImage)  # optimizes blitting
+            self.atlasImagesDict[(theWidth, theHeight)] = textImage
+        self.textImage = textImage
+        if self.backgroundColor is None:
+            self.textImage.fill((0, 0, 0, 0))
+        else:
+            self.textImage.fill(self.backgroundColor)
+        self.textImage.blits(blitsList, doreturn=False)
+
+        self._notifyRectChanged()
+
     def setText(self, newText):
         """older name, keeping this for older code that used it, now use setValue"""
         self.setValue(newText)
@@ -2057,6 +3363,10 @@ class DisplayText(PygWidget):
 
         self.window.blit(self.textImage, self.loc)
 
+    def getBlitInfo(self):
+        """Returns a tuple of the current text image, and the location to draw it."""
+        return self.textImage, self.loc
+
 
 #
 #
@@ -2104,6 +3414,8 @@ class InputText(PygWidget):
         |             (defaults to None)
         | mask - a character used to mask the text, typically set to asterisk for password field (defaults to None)
         | keepFocusOnSubmit - when user presses Return/Enter should the field keep focus (defaults to False)
+        | scrolling - if True, text longer than the width scrolls horizontally to keep the cursor visible,
+        |             and only the visible part of the text is rendered (defaults to False)
 
     """
 
@@ -2116,10 +3428,13 @@ class InputText(PygWidget):
     CANCELLED_TAB = -1
     KEY_REPEAT_DELAY = 500  # ms before starting to repeat
     KEY_REPEAT_RATE = 50  # ms between repeating keys
+    SCROLLING_CHUNK_SIZE = 64  # when scrolling, text is kept in chunks of about this many characters
+    MAX_CHUNK_IMAGES = 64  # when scrolling, the number of rendered chunks to keep
 
     def __init__(self, window, loc, value='', fontName=None, fontSize=24, width=200, 
                  textColor=PYGWIDGETS_BLACK, backgroundColor=PYGWIDGETS_WHITE, focusColor=PYGWIDGETS_BLACK,
-                 initialFocus=False, nickname=None, callBack=None, mask=None, keepFocusOnSubmit=False):
+                 initialFocus=False, nickname=None, callBack=None, mask=None, keepFocusOnSubmit=False,
+                 scrolling=False):
 
         super().__init__(nickname)  # initialize base class
         self.window = window
@@ -2158,6 +3473,20 @@ class InputText(PygWidget):
         self.cursorLoc = [self.loc[0], self.loc[1]]   # this is a list because element 0 will change as the user edits
         self.clock = pygame.time.Clock()
 
+        # Widths of the text, so the cursor can be placed without measuring the text again
+        self.prefixWidthsList = [0]  # element i is the width of the first i characters, or None if not measured yet
+
+        # When scrolling, the text (as shown) is kept as a list of chunks, so that an edit
+        # only changes one chunk, and only the chunks in view need to be rendered
+        self.scrolling = scrolling
+        self.scrollOffset = 0  # number of pixels of text scrolled off the left side
+        self.chunksList = ['']
+        self.chunkWidthsList = [0]
+        self.chunkCharStartsList = [0]  # index in the text of the first character of each chunk
+        self.chunkPixelStartsList = [0]  # left edge of each chunk, in pixels from the start of the text
+        self.chunkImagesDict = {}  # chunk of text -> rendered image
+        self._updateWidths(0, 0, len(self.text))
+
 
         # Create one surface, blit the text into it during _updateImage
         # Special flags are needed to set the background alpha as transparent
@@ -2167,9 +3496,17 @@ class InputText(PygWidget):
 
     def _updateImage(self):
         """Internal method to render text as an image."""
-        # Fill the background of the image
+        # Fill the background of the image (clear it if there is no background color)
         if self.backgroundColor is not None:
             self.textImage.fill(self.backgroundColor)
+        else:
+            self.textImage.fill((0, 0, 0, 0))
+
+        if self.scrolling:
+            self._scrollToCursor()
+            self._blitVisibleChunks()
+            self.dirty = True
+            return
 
         # Render the text as a single line, and blit it onto the textImage surface
         if self.mask is None:
@@ -2179,7 +3516,147 @@ class InputText(PygWidget):
             maskedText = self.mask * nChars
             lineSurface = self.font.render(maskedText, True, self.textColor)
         self.textImage.blit(lineSurface, (0, 0))
+        self.dirty = True
+
+    def _updateWidths(self, editPosition, nCharsRemoved, nCharsInserted):
+        """Internal method, updates the widths of the text after an edit (call after changing self.text).
+
+        Parameters:
+            | editPosition - index in the text where the edit happened
+            | nCharsRemoved - number of characters removed at editPosition
+            | nCharsInserted - number of characters inserted at editPosition
+
+        """
+        if not self.scrolling:
+            # The width of the text up to the edit does not change, so those widths are kept.
+            # Widths after the edit are measured again, but only when they are needed.
+            del self.prefixWidthsList[editPosition + 1:]
+            self.prefixWidthsList.extend([None] * (len(self.text) - editPosition))
+            return
+
+        if nCharsInserted == len(self.text):  # all of the text is new
+            shownText = self._getShownText(self.text)
+            chunkSize = InputText.SCROLLING_CHUNK_SIZE
+            self.chunksList = [shownText[index:index + chunkSize] for index in range(0, len(shownText), chunkSize)]
+            if self.chunksList == []:
+                self.chunksList = ['']
+            self.chunkWidthsList = [None] * len(self.chunksList)
+            self._measureChunks(0)
+            return
+
+        insertedText = self._getShownText(self.text[editPosition:editPosition + nCharsInserted])
+        firstChunkIndex = self._editChunks(editPosition, nCharsRemoved, insertedText)
+        self._measureChunks(firstChunkIndex)
 
+    def _getShownText(self, text):
+        """Internal method, returns the text as it is shown in the field (masked or not)."""
+        if self.mask is None:
+            return text
+        return self.mask * len(text)
+
+    def _editChunks(self, editPosition, nCharsRemoved, insertedText):
+        """Internal method, removes and inserts text in the chunks, returns the index of the first chunk changed."""
+        firstChunkIndex, firstOffset = self._locateChunk(editPosition)
+
+        # Characters to remove may span more than one chunk
+        chunkIndex = firstChunkIndex
+        offset = firstOffset
+        nCharsToRemove = nCharsRemoved
+        while nCharsToRemove > 0:
+            chunk = self.chunksList[chunkIndex]
+            nCharsInChunk = min(nCharsToRemove, len(chunk) - offset)
+            self.chunksList[chunkIndex] = chunk[:offset] + chunk[offset + nCharsInChunk:]
+            nCharsToRemove = nCharsToRemove - nCharsInChunk
+            chunkIndex = chunkIndex + 1
+            offset = 0
+        lastChunkIndex = max(chunkIndex - 1, firstChunkIndex)
+
+        chunk = self.chunksList[firstChunkIndex]
+        self.chunksList[firstChunkIndex] = chunk[:firstOffset] + insertedText + chunk[firstOffset:]
+
+        # Split chunks that got too long, and drop chunks that are now empty
+        chunkSize = InputText.SCROLLING_CHUNK_SIZE
+        newChunksList = []
+        for chunk in self.chunksList[firstChunkIndex:lastChunkIndex + 1]:
+            if len(chunk) > (2 * chunkSize):
+                newChunksList.extend(chunk[index:index + chunkSize] for index in range(0, len(chunk), chunkSize))
+            elif chunk != '':
+                newChunksList.append(chunk)
+        self.chunksList[firstChunkIndex:lastChunkIndex + 1] = newChunksList
+        self.chunkWidthsList[firstChunkIndex:lastChunkIndex + 1] = [None] * len(newChunksList)
+        if self.chunksList == []:
+            self.chunksList = ['']
+            self.chunkWidthsList = [None]
+        return min(firstChunkIndex, len(self.chunksList) - 1)
+
+    def _measureChunks(self, firstChunkIndex):
+        """Internal method, measures changed chunks, and updates the starts of all chunks from firstChunkIndex."""
+        for chunkIndex in range(firstChunkIndex, len(self.chunksList)):
+            if self.chunkWidthsList[chunkIndex] is None:
+                self.chunkWidthsList[chunkIndex] = self.font.size(self.chunksList[chunkIndex])[0]
+
+        if firstChunkIndex == 0:
+            charStart = 0
+            pixelStart = 0
+        else:
+            charStart = self.chunkCharStartsList[firstChunkIndex - 1] + len(self.chunksList[firstChunkIndex - 1])
+            pixelStart = self.chunkPixelStartsList[firstChunkIndex - 1] + self.chunkWidthsList[firstChunkIndex - 1]
+        self.chunkCharStartsList[firstChunkIndex:] = \
+                        accumulate(map(len, self.chunksList[firstChunkIndex:-1]), initial=charStart)
+        self.chunkPixelStartsList[firstChunkIndex:] = \
+                        accumulate(self.chunkWidthsList[firstChunkIndex:-1], initial=pixelStart)
+
+    def _locateChunk(self, charIndex):
+        """Internal method, returns a tuple of (index of the chunk, offset in that chunk) of a character index."""
+        chunkIndex = bisect_right(self.chunkCharStartsList, charIndex) - 1
+        return chunkIndex, charIndex - self.chunkCharStartsList[chunkIndex]
+
+    def _scrollToCursor(self):
+        """Internal method, scrolls the text so the cursor is visible.  Returns True if the scroll changed."""
+        previousScrollOffset = self.scrollOffset
+        cursorX = self._getPrefixWidth(self.cursorPosition)
+        textWidth = self.chunkPixelStartsList[-1] + self.chunkWidthsList[-1]
+        if (cursorX - self.scrollOffset) > self.width:
+            self.scrollOffset = cursorX - self.width
+        elif cursorX < self.scrollOffset:
+            self.scrollOffset = max(cursorX - (self.width // 4), 0)  # show some text before the cursor
+
+        # Don't leave empty space on the right if the end of the text is in view
+        if (textWidth - self.scrollOffset) < self.width:
+            self.scrollOffset = max(textWidth - self.width + 1, 0)
+        return self.scrollOffset != previousScrollOffset
+
+    def _blitVisibleChunks(self):
+        """Internal method, blits only the chunks that are in view into the text image."""
+        firstChunkIndex = max(bisect_right(self.chunkPixelStartsList, self.scrollOffset) - 1, 0)
+        for chunkIndex in range(firstChunkIndex, len(self.chunksList)):
+            chunkLeft = self.chunkPixelStartsList[chunkIndex] - self.scrollOffset
+            if chunkLeft >= self.width:
+                break
+            chunk = self.chunksList[chunkIndex]
+            chunkImage = self.chunkImagesDict.get(chunk)
+            if chunkImage is None:
+                if len(self.chunkImagesDict) >= InputText.MAX_CHUNK_IMAGES:
+                    self.chunkImagesDict.clear()
+                chunkImage = self.font.render(chunk, True, self.textColor)
+                self.chunkImagesDict[chunk] = chunkImage
+            self.textImage.blit(chunkImage, (chunkLeft, 0))
+
+    def _getPrefixWidth(self, nChars):
+        """Internal method, returns the width of the first nChars characters of the text (as shown)."""
+        if self.scrolling:
+            chunkIndex, offset = self._locateChunk(nChars)
+            chunkPrefix = self.chunksList[chunkIndex][:offset]
+            return self.chunkPixelStartsList[chunkIndex] + self.font.size(chunkPrefix)[0]
+
+        prefixWidth = self.prefixWidthsList[nChars]
+        if prefixWidth is None:  # not measured since the last edit
+            if self.mask is None:
+                prefixWidth = self.font.size(self.text[:nChars])[0]
+            else:
+                prefixWidth = self.font.size(self.mask * nChars)[0]
+            self.prefixWidthsList[nChars] = prefixWidth
+        return prefixWidth
 
     def handleEvent(self, event):
         """This method should be called every time through the event loop (inside the main loop).
@@ -2205,25 +3682,28 @@ class InputText(PygWidget):
             if self.imageRect.collidepoint(theX, theY):
                 if not self.focus:
                     self.focus = True   # give this field focus
+                    self.dirty = True
                     pygame.key.set_repeat(InputText.KEY_REPEAT_DELAY, InputText.KEY_REPEAT_RATE)
                 else:
                     # Field already has focus, must position the cursor where the user clicked
-                    nPixelsFromLeft = theX - self.loc[0]
-                    nChars = len(self.text)
-
-                    lastCharOffset = self.font.size(self.text)[0]
-                    if nPixelsFromLeft >= lastCharOffset:
-                        self.cursorPosition = nChars
-                    else:
-                        for thisCharNum in range(0, nChars):
-                            thisCharOffset = self.font.size(self.text[:thisCharNum])[0]
-                            if thisCharOffset >= nPixelsFromLeft:
-                                self.cursorPosition = thisCharNum  # Found the proper position for the cursor
-                                break
+                    # Binary search for the first character boundary at or after the click point
+                    nPixelsFromLeft = theX - self.loc[0] + self.scrollOffset
+                    low = 0
+                    high = len(self.text)
+                    while low < high:
+                        middle = (low + high) // 2
+                        if self._getPrefixWidth(middle) < nPixelsFromLeft:
+                            low = middle + 1
+                        else:
+                            high = middle
+                    self.cursorPosition = low
                     self.cursorVisible = True # Show the cursor at the click point
+                    if self.scrolling and self._scrollToCursor():
+                        self._updateImage()
 
-            else:
+            elif self.focus:
                 self.focus = False
+                self.dirty = True
             return False  # means:  handled click, nothing for client to do
 
         if not self.focus:  # if this field does not have focus, don't do anything
@@ -2250,16 +3730,18 @@ class InputText(PygWidget):
                 pass
 
             elif currentKey == pygame.K_BACKSPACE:
-                self.text = self.text[:max(self.cursorPosition - 1, 0)] + \
-                                self.text[self.cursorPosition:]
-
-                # Subtract one from cursor_pos, but do not go below zero:
-                self.cursorPosition = max(self.cursorPosition - 1, 0)
+                if self.cursorPosition > 0:
+                    self.text = self.text[:self.cursorPosition - 1] + \
+                                    self.text[self.cursorPosition:]
+                    self.cursorPosition = self.cursorPosition - 1
+                    self._updateWidths(self.cursorPosition, 1, 0)
                 self._updateImage()
 
             elif currentKey == pygame.K_DELETE: # forward delete key
-                self.text = self.text[:self.cursorPosition] + \
-                                self.text[self.cursorPosition + 1:]
+                if self.cursorPosition < len(self.text):
+                    self.text = self.text[:self.cursorPosition] + \
+                                    self.text[self.cursorPosition + 1:]
+                    self._updateWidths(self.cursorPosition, 1, 0)
                 self._updateImage()
 
             elif currentKey == pygame.K_RIGHT:
@@ -2296,9 +3778,14 @@ class InputText(PygWidget):
                 self.text = self.text[:self.cursorPosition] + \
                                             unicodeOfKey + \
                                             self.text[self.cursorPosition:]
+                self._updateWidths(self.cursorPosition, 0, len(unicodeOfKey))
                 self.cursorPosition = self.cursorPosition + len(unicodeOfKey)
                 self._updateImage()
 
+            # Moving the cursor may need the text to scroll
+            if self.scrolling and self._scrollToCursor():
+                self._updateImage()
+
         return False  # means: handled key, nothing for client code to do
 
 
@@ -2322,7 +3809,7 @@ class InputText(PygWidget):
                 self.cursorVisible = not self.cursorVisible
 
             if self.cursorVisible:
-                cursorOffset = self.font.size(self.text[:self.cursorPosition])[0]
+                cursorOffset = self._getPrefixWidth(self.cursorPosition) - self.scrollOffset
                 if self.cursorPosition > 0: # Try to get between characters
                     cursorOffset = cursorOffset - 1
                 if cursorOffset < self.width:  # if the loc is within the text area, draw it
@@ -2343,7 +3830,9 @@ class InputText(PygWidget):
 
     def setValue(self, newText):
         """Sets new text into the field"""
+        nCharsRemoved = len(self.text)
         self.text = newText
+        self._updateWidths(0, nCharsRemoved, len(self.text))
         self.cursorPosition = len(self.text)
         self._updateImage()
 
@@ -2357,7 +3846,10 @@ class InputText(PygWidget):
 
     def clearText(self, keepFocus=False):
         """Clear the text in the field"""
+        nCharsRemoved = len(self.text)
         self.text = ''
+        self._updateWidths(0, nCharsRemoved, 0)
+        self.cursorPosition = 0
         self.focus = keepFocus
         self._updateImage()
 
@@ -2368,12 +3860,22 @@ class InputText(PygWidget):
 
          """
         self.focus = False
+        self.dirty = True
 
     def giveFocus(self):
         """ Give focus to this field
         Make sure focus is removed from any previous field before calling this
         """
         self.focus = True
+        self.dirty = True
+
+    def getDirty(self):
+        """Returns True if this field needs to be redrawn.  A field with focus is always redrawn (blinking cursor)."""
+        return self.dirty or self.focus
+
+    def _getDrawRect(self):
+        """Internal method, the draw method also draws the focus rectangle around the text."""
+        return self.focusedImageRect
 
     def setNextFieldOnTab(self, oNextFieldOnTab):
         """ Allows TAB key to move to a field of programmers choice
@@ -2393,6 +3895,7 @@ class InputText(PygWidget):
         # Set the rect of the focus highlight rectangle (when the text has been clicked on and has focus)
         self.focusedImageRect = pygame.Rect(self.loc[0] - 3, self.loc[1] - 3, self.width + 6, self.height + 6)
         self.cursorLoc = [self.loc[0], self.loc[1]]  # this is a list because element 0 will change as the user edits
+        self._notifyRectChanged()
 
 #
 #
@@ -2501,6 +4004,7 @@ class Dragger(PygWidget):
         if eventObj.type == MOUSEBUTTONDOWN:
             if self.rect.collidepoint(eventObj.pos):
                 self.dragging = True
+                self.dirty = True
                 self.deltaX = eventObj.pos[0] - self.rect.left
                 self.deltaY = eventObj.pos[1] - self.rect.top
                 self.startDraggingX = self.rect.left
@@ -2520,10 +4024,13 @@ class Dragger(PygWidget):
             if self.dragging:
                 self.rect.left = eventObj.pos[0] - self.deltaX
                 self.rect.top = eventObj.pos[1] - self.deltaY
-
+                self.dirty = True
 
             else:
-                self.mouseOver = self.rect.collidepoint(eventObj.pos)
+                mouseOver = self.rect.collidepoint(eventObj.pos)
+                if mouseOver != self.mouseOver:
+                    self.mouseOver = mouseOver
+                    self.dirty = True
 
         if clicked:
             if self.callBack is not None:
@@ -2543,6 +4050,7 @@ class Dragger(PygWidget):
         """
         self.rect.left = self.startDraggingX
         self.rect.top = self.startDraggingY
+        self._notifyRectChanged()
 
     def draw(self):
         """Draws the dragger at the current mouse location.
@@ -2553,18 +4061,25 @@ class Dragger(PygWidget):
         if not self.visible:
             return
 
+        # Draw the dragger's current appearance to the window.
+        self.window.blit(self._getCurrentSurface(), self.rect)
+
+    def getBlitInfo(self):
+        """Returns a tuple of the surface for the current state, and the rect to draw it in."""
+        return self._getCurrentSurface(), self.rect
+
+    def _getCurrentSurface(self):
+        """Internal method, returns the surface to show based on the current state."""
         if self.isEnabled:
-        
-            # Draw the dragger's current appearance to the window.
             if self.dragging:
-                self.window.blit(self.surfaceDown, self.rect)
+                return self.surfaceDown
             else:  # mouse is up
                 if self.mouseOver:
-                    self.window.blit(self.surfaceOver, self.rect)
+                    return self.surfaceOver
                 else:
-                    self.window.blit(self.surfaceUp, self.rect)
+                    return self.surfaceUp
         else:
-            self.window.blit(self.surfaceDisabled, self.rect)
+            return self.surfaceDisabled
 
 
 
@@ -2600,12 +4115,21 @@ class Image(PygWidget):
 
     Optional keyword parameters:
         | nickname - any nickname you want to use to identify this image (defaults to None)
-        
+        | angleStep - if given, rotated images are drawn at the nearest multiple of this many degrees,
+        |             so that a spinning image only needs a few different rotated images (defaults to None)
+        | transformCacheSize - number of rotated, scaled, and flipped images to remember, so that
+        |             going back to an angle or size that was used before does not transform
+        |             the image again (defaults to 16).  The cache is only created the first time
+        |             the image is rotated, scaled, or flipped.
+        | oTransformCache - a PygwidgetsTransformCache to share between many images, instead of
+        |             each image having its own (defaults to None)
+
     Raises:
         | FileNotFoundError if a file at a given path cannot be found
 
     """
-    def __init__(self, window, loc, pathOrLoadedImage, nickname=None):
+    def __init__(self, window, loc, pathOrLoadedImage, nickname=None,
+                 angleStep=None, transformCacheSize=16, oTransformCache=None):
 
         super().__init__(nickname)  # initialize base class
         self.window = window
@@ -2617,6 +4141,9 @@ class Image(PygWidget):
         self.flipV = False
         self.focus = False
         self.rect = None  # flag for first image not being loaded yet
+        self.angleStep = angleStep
+        self.transformCacheSize = transformCacheSize
+        self.oTransformCache = oTransformCache  # if None, created when first needed (see _getTransformCache)
 
         ###  SPECIAL NOTE HERE
         # In the following line of code, I want to call  the "replace" method
@@ -2626,8 +4153,7 @@ class Image(PygWidget):
         # but that failed when used inside the "ImageCollection" subclass, because it was
         # calling the "replace" method inside the ImageCollection class.
         # This solution allows both the Image and ImageCollection classes to have a method named "replace"
-        Image.replace(self, pathOrLoadedImage)      # creates self.originalImage
-        self.image = self.originalImage.copy()
+        Image.replace(self, pathOrLoadedImage)      # creates self.originalImage and self.image
 
     def replace(self, newPathOrImage):
         """replace the image with a different image.
@@ -2648,7 +4174,7 @@ class Image(PygWidget):
         else:  # must be an image
             self.originalImage = newPathOrImage
 
-        self.image = self.originalImage.copy()
+        self.image = self.originalImage  # replaced by the transformed image below
         if self.rect is None:
             self.rect = self.image.get_rect()
             self.rect[0] = self.loc[0]
@@ -2736,39 +4262,83 @@ class Image(PygWidget):
         """
         self._transmogrophy(self.angle, percent, scaleFromCenter, self.flipH, self.flipV)
 
+    def prebakeRotations(self, nAngles):
+        """Creates rotated images for nAngles evenly spaced angles now, so rotating later is very fast.
 
-    def _transmogrophy(self, angle, percent, scaleFromCenter, flipH, flipV):
-        """
-        Internal method to scale and rotate
-
-        """
+        This also sets the angleStep to 360 / nAngles, so the image is always drawn at one of these angles.
+        The images are made at the current size and flips.  (Useful for spinning dials, gauges, etc.)
 
-        self.angle = angle % 360
-        self.percent = percent
-        self.scaleFromCenter = scaleFromCenter
+        Parameters:
+            | nAngles - the number of angles to prepare, for example 72 for every 5 degrees
 
-        previousRect = self.rect
-        previousCenter = previousRect.center
-        previousLoc = self.loc
+        """
+        self.angleStep = 360 / nAngles
+        oTransformCache = self._getTransformCache()
+        oTransformCache.setMaxEntries(max(oTransformCache.maxEntries, nAngles + 1))
+        for angleIndex in range(nAngles):
+            self._getTransformedImage(angleIndex * self.angleStep, self.percent, self.flipH, self.flipV)
+
+    def _getTransformedImage(self, angle, percent, flipH, flipV):
+        """Internal method, returns the original image rotated, scaled, and flipped (from the cache if possible)."""
+        if self.angleStep is not None:
+            angle = (round(angle / self.angleStep) * self.angleStep) % 360
+        if (angle == 0) and (percent == 100) and (not flipH) and (not flipV):
+            return self.originalImage  # nothing to do, so no need for the cache
+        oTransformCache = self._getTransformCache()
+        key = (self.originalImage, angle, percent, flipH, flipV)
+        image = oTransformCache.get(key)
+        if image is None:
+            image = self._transformImage(self.originalImage, angle, percent, flipH, flipV)
+            oTransformCache.add(key, image)
+        return image
+
+    def _getTransformCache(self):
+        """Internal method, returns the transform cache, creating it the first time it is needed."""
+        if self.oTransformCache is None:
+            self.oTransformCache = PygwidgetsTransformCache(self.transformCacheSize)
+        return self.oTransformCache
+
+    def _transformImage(self, originalImage, angle, percent, flipH, flipV):
+        """Internal method, rotates, scales and flips an image."""
+        if (angle == 0) and (percent == 100) and (not flipH) and (not flipV):
+            return originalImage  # nothing to do, images are never drawn into, so this can be shared
 
         # Rotate - pygame rotates in the opposite direction
-        pygameAngle = -self.angle
+        pygameAngle = -angle
         # print('Pygame Transmogrophy')
-        rotatedImage = pygame.transform.rotate(self.originalImage, pygameAngle)
+        rotatedImage = pygame.transform.rotate(originalImage, pygameAngle)
         rotatedRect = rotatedImage.get_rect()
         rotatedWidth = rotatedRect.width
         rotatedHeight = rotatedRect.height
 
         # Scale
-        newWidth = int(rotatedWidth * .01 * self.percent)
-        newHeight = int(rotatedHeight * .01 * self.percent)
-        self.image = pygame.transform.scale(rotatedImage, (newWidth, newHeight))
+        newWidth = int(rotatedWidth * .01 * percent)
+        newHeight = int(rotatedHeight * .01 * percent)
+        image = pygame.transform.scale(rotatedImage, (newWidth, newHeight))
 
         # Flip
         if flipH:
-            self.image = pygame.transform.flip(self.image, True, False)
+            image = pygame.transform.flip(image, True, False)
         if flipV:
-            self.image = pygame.transform.flip(self.image, False, True)
+            image = pygame.transform.flip(image, False, True)
+        return image
+
+    def _transmogrophy(self, angle, percent, scaleFromCenter, flipH, flipV):
+        """
+        Internal method to scale and rotate
+
+        """
+
+        self.angle = angle % 360
+        self.percent = percent
+        self.scaleFromCenter = scaleFromCenter
+
+        previousRect = self.rect
+        previousCenter = previousRect.center
+        previousLoc = self.loc
+
+        # Rotate, scale, and flip - or reuse the image from an earlier identical transform
+        self.image = self._getTransformedImage(self.angle, self.percent, flipH, flipV)
 
         # Placement
         self.rect = self.image.get_rect()
@@ -2799,6 +4369,10 @@ class Image(PygWidget):
 
         self.window.blit(self.image, self.loc)
 
+    def getBlitInfo(self):
+        """Returns a tuple of the current image, and the location to draw it."""
+        return self.image, self.loc
+
 
 
 #
@@ -2845,6 +4419,8 @@ class ImageCollection(Image):
         | path - any path that you want to prepend to each image  for example,
         |        if all images are in a folder named 'images', give the relative path to that folder as 'images/' (defaults to empty string)
         | nickname - any nickname you want to use to identify this ImageCollection (defaults to None)
+        | angleStep, transformCacheSize, oTransformCache - same as in the Image class
+        |        (the transform cache always has room for at least one image for every key)
 
     Raises:
         | ValueError if the startImageKey is not found in the imagesDict dictionary
@@ -2853,7 +4429,8 @@ class ImageCollection(Image):
 
     """
 
-    def __init__(self, window, loc, imagesDict, startImageKey, path='', nickname=None):
+    def __init__(self, window, loc, imagesDict, startImageKey, path='', nickname=None,
+                 angleStep=None, transformCacheSize=16, oTransformCache=None):
 
         self.window = window
         self.loc = loc
@@ -2885,7 +4462,10 @@ class ImageCollection(Image):
         self.currentKey = startImageKey
         startImage = self.imagesDict[self.currentKey]
 
-        super().__init__(window, loc, startImage, nickname)  # initialize Image base class
+        # Keep the transformed image of every key, so switching between keys does no transforms
+        transformCacheSize = max(transformCacheSize, len(self.imagesDict))
+        super().__init__(window, loc, startImage, nickname, angleStep=angleStep,
+                         transformCacheSize=transformCacheSize, oTransformCache=oTransformCache)  # initialize Image base class
 
         self.percent = 100
         self.angle = 0
@@ -2909,17 +4489,16 @@ class ImageCollection(Image):
             raise KeyError(message)
         self.currentKey = key
         self.originalImage = self.imagesDict[self.currentKey]
-        self.image = self.originalImage.copy()
+        self.image = self.originalImage  # replaced by the transformed image below
 
         # Set the rect of the image to appropriate values - using the current image
-        # then scale and rotate
+        # then scale, rotate, and flip in a single step (using the transform cache when possible)
         if self.rect is None:
             self.rect = self.image.get_rect()
             self.rect.x = self.loc[0]
             self.rect.y = self.loc[1]
 
-        self.scale(self.percent, self.scaleFromCenter)
-        self.rotateTo(self.angle)
+        self._transmogrophy(self.angle, self.percent, self.scaleFromCenter, self.flipH, self.flipV)
 
     def getCurrentKey(self):
         """Returns the currently selected key in an ImageCollection"""
@@ -2928,67 +4507,162 @@ class ImageCollection(Image):
 
 #
 #
-# PygAnimation
+# ANIMATION CLIP
 #
 #
-class PygAnimation(PygWidget):
-    """Base class of the Animation class and the SpriteSheetAnimation class
+class AnimationClip():
+    """AnimationClip - the images and timings of an animation, which can be shared by many animations.
 
-    This is an abstract class. Do not instantiate this class.
-    Instead, you should instantiate either an Animation class (using multiple images)
-    or a SpriteSheetAnimation (single file made up of equally spaces images).
-    Details are in comments for those classes below.
+    A clip never changes once it is built.  Any number of Animation, SpriteSheetAnimation, or
+    AnimationPlayer objects can play the same clip, each with its own location, current image, and state.
+    This way, the images and timings are stored only once, no matter how many animations are showing.
+
+    Typical use:
+
+        | oClip = pygwidgets.AnimationClip.fromSpriteSheet('images/explosion.png', 12, 64, 64, .05)
+        | playersList = []
+        | for loc in explosionLocsList:
+        |     playersList.append(pygwidgets.AnimationPlayer(window, loc, oClip, autoStart=True))
+
+    Parameters:
+        | imagesList - list of images (pygame surfaces).  None means no image is shown for that entry
+        | durationsList - list of durations (in seconds), one for each image
+
+    Optional keyword parameters:
+        | offsetsList - list of offsets from loc, one for each image (defaults to None, meaning all (0, 0))
+
+    Raises:
+        | ValueError if the lists are empty, or do not have the same length
 
     """
+    __slots__ = ('imagesTuple', 'endTimesTuple', 'offsetsTuple', 'duration')
+
+    def __init__(self, imagesList, durationsList, offsetsList=None):
+        nImages = len(imagesList)
+        if nImages == 0:
+            raise ValueError('AnimationClip: the list of images cannot be empty')
+        if len(durationsList) != nImages:
+            raise ValueError('AnimationClip: number of images ' + str(nImages) +
+                             ' and number of duration times ' + str(len(durationsList)) +
+                             ' do not match.')
+        if offsetsList is None:
+            offsetsList = ((0, 0),) * nImages  # use default location - no offsets
+        elif len(offsetsList) != nImages:
+            raise ValueError('AnimationClip: number of images ' + str(nImages) +
+                             ' and number of offsets ' + str(len(offsetsList)) + ' do not match.')
+
+        self.imagesTuple = tuple(imagesList)
+        self.endTimesTuple = tuple(accumulate(durationsList))  # elapsed times when each image ends
+        self.offsetsTuple = tuple(offsetsList)
+        self.duration = self.endTimesTuple[-1]
+
+    @classmethod
+    def fromAnimTuples(cls, animTuplesList, path=''):
+        """Builds a clip from a list of animation tuples, as used by Animation.
 
-    @abstractmethod
-    def __init__(self, window, loc, loop, showFirstImageAtEnd, nickname, callBack,
-                 nTimes):
+        Parameters:
+            | animTuplesList - list of tuples, where each tuple looks like this:
+            |     (<path to image>, <duration>, <optional offset>)
+            |     The path may also be a pre-loaded image, or the empty string for no image
 
-        super().__init__(nickname)
-        # Initialize instance variables common to both types of Animations
-        self.window = window
-        self.loc = loc
-        self.loop = loop
-        self.showFirstImageAtEnd = showFirstImageAtEnd
-        self.nickname = nickname
-        self.callBack = callBack
-        self.nTimes = nTimes
+        Optional keyword parameters:
+            | path - a path to be prepended to all file paths (default is the empty string)
 
-        self.imagesList = []
-        self.endTimesList = []
-        self.offsetsList = []
-        self.index = 0  # Used to index into all three lists
-        self.elapsed = 0  # Time that has elapsed in the current animation
-        self.nIterationsLeft = 0
-        self.state = PYGWIDGETS_ANIMATION_STOPPED
+        Raises:
+            | FileNotFoundError if a file at a given path cannot be found
+
+        """
+        imagesList = []
+        durationsList = []
+        offsetsList = []
+        for animTuple in animTuplesList:
+            picPath = animTuple[0]
+            if isinstance(picPath, str):  #typical case, picPath is a string
+                if picPath == '':
+                    image = None  # special value, meaning no image to show
+                else:
+                    image = _loadImageAndConvert(path + picPath)  # normal case, load an image
+            else:
+                image = picPath  # assume that picPath is an pre-loaded image
+            imagesList.append(image)
+            durationsList.append(animTuple[1])
+            if len(animTuple) == 2:
+                offsetsList.append((0, 0))  # use default location - no offset
+            else:
+                offsetsList.append(animTuple[2])  # use specific location offset
+        return cls(imagesList, durationsList, offsetsList)
 
+    @classmethod
+    def fromSpriteSheet(cls, imagePath, nImages, width, height, durationOrDurationsList):
+        """Builds a clip from a sprite sheet, as used by SpriteSheetAnimation.
 
-    def handleEvent(self, eventObj):
-        """This method should be called every time through the event loop (inside the main loop).
+        The sprite sheet is loaded and cut into images only once (see PygwidgetsImageCache).
+
+        Parameters:
+            | imagePath - path to the file containing multiple images
+            | nImages - total number of images in the single file
+            | width - width of each individual image
+            | height - height of each individual image
+            | durationOrDurationsList - a single duration for all images, or a list or tuple of durations
+
+        Raises:
+            | ValueError if the number of images and the length of the durations list don't match
+            | FileNotFoundError if a file at a given path cannot be found
 
-        Returns:
-            | False - if no event happens on this widget.
-            | True - if the user clicks the animation (typically to start it playing).
         """
-        if not self.visible:
-            return
-        if not self.isEnabled:
-            return False
+        if isinstance(durationOrDurationsList, tuple) or isinstance(durationOrDurationsList, list):
+            durationsList = durationOrDurationsList
+        else:
+            durationsList = (durationOrDurationsList,) * nImages  # all images use the same duration
+        framesTuple = _PYGWIDGETS_IMAGE_CACHE.getSpriteSheetFrames(imagePath, width, height, nImages)
+        return cls(framesTuple, durationsList)
 
-        if eventObj.type != MOUSEBUTTONDOWN:
-            # The animation only cares about a mouse down event
-            return False
+    def getNImages(self):
+        """Returns the number of images in the clip."""
+        return len(self.imagesTuple)
 
-        eventPointInAnimationRect = self.rect.collidepoint(eventObj.pos)
-        if not eventPointInAnimationRect:  # clicked outside of animation
-            return False
+    def getDuration(self):
+        """Returns the time (in seconds) to play the whole clip once."""
+        return self.duration
 
-        if self.state == PYGWIDGETS_ANIMATION_PLAYING:  # if playing, ignore the click
-            return False
 
-        return True
+#
+#
+# PygAnimationPlayback
+#
+#
+class PygAnimationPlayback():
+    """Playback of an AnimationClip - shared by PygAnimation and AnimationPlayer.
+
+    This is a mixin class.  Do not instantiate this class.
+    It keeps track of which image of its clip to show, and when to move on to the next one.
+    The class that uses it must set these instance variables (by calling _initPlayback):
+    oClip, loop, showFirstImageAtEnd, nickname, callBack, nTimes, index, elapsed, elapsedAtPause,
+    nIterationsLeft, state, timeSource, animationPlayingStartTime, nextElapsedThreshold,
+    dirty, oScheduler, and oCollection.
+
+    """
+    __slots__ = ()
 
+    def _initPlayback(self, oClip, loop, showFirstImageAtEnd, nickname, callBack, nTimes):
+        # Internal method, initializes the playback state of a newly created animation
+        self.oClip = oClip
+        self.loop = loop
+        self.showFirstImageAtEnd = showFirstImageAtEnd
+        self.nickname = nickname
+        self.callBack = callBack
+        self.nTimes = nTimes
+        self.index = 0  # Used to index into the images, end times, and offsets of the clip
+        self.elapsed = 0  # Time that has elapsed in the current animation
+        self.elapsedAtPause = 0
+        self.nIterationsLeft = 0
+        self.state = PYGWIDGETS_ANIMATION_STOPPED
+        self.timeSource = time.time  # function that returns the current time in seconds
+        self.animationPlayingStartTime = 0
+        self.nextElapsedThreshold = 0
+        self.dirty = True
+        self.oScheduler = None  # Set by an AnimationScheduler when this animation is added to it
+        self.oCollection = None  # Set by an AnimationCollection for each of its animations
 
     def start(self):
         """Starts an animation playing."""
@@ -2998,18 +4672,17 @@ class PygAnimation(PygWidget):
         elif self.state == PYGWIDGETS_ANIMATION_STOPPED:  # restart from beginning of animation
             self.index = 0  # first image in list
             self.elapsed = 0
-            self.animationPlayingStartTime = time.time()
-            self.elapsedStopTime = self.endTimesList[-1]  # end of last animation image time
-            self.nextElapsedThreshold = self.endTimesList[0]
+            self.dirty = True
+            self.animationPlayingStartTime = self.timeSource()
+            self.nextElapsedThreshold = self.oClip.endTimesTuple[0]
             self.nIterationsLeft = self.nTimes  # typically 1
 
         elif self.state == PYGWIDGETS_ANIMATION_PAUSED:  # restart where we left off
-            self.animationPlayingStartTime = time.time() - self.elapsedAtPause  # recalc start time
+            self.animationPlayingStartTime = self.timeSource() - self.elapsedAtPause  # recalc start time
             self.elapsed = self.elapsedAtPause
-            self.elapsedStopTime = self.endTimesList[-1]  # end of last animation image time
-            self.nextElapsedThreshold = self.endTimesList[self.index]
+            self.nextElapsedThreshold = self.oClip.endTimesTuple[self.index]
 
-        self.state = PYGWIDGETS_ANIMATION_PLAYING
+        self._setState(PYGWIDGETS_ANIMATION_PLAYING)
 
     # Leaving in for historical reasons.  (Old programs called "play")
     def play(self):
@@ -3030,14 +4703,15 @@ class PygAnimation(PygWidget):
             self.index = 0  # set up for first image in list
             self.elapsed = 0
 
-        self.state = PYGWIDGETS_ANIMATION_STOPPED
+        self._setState(PYGWIDGETS_ANIMATION_STOPPED)
+        self.dirty = True
 
     def pause(self):
         """Pauses a playing animation.  A subsequent call to play will continue where it left off."""
         if self.state == PYGWIDGETS_ANIMATION_PLAYING:
             self.elapsedAtPause = self.elapsed
             # only change state if it was playing
-            self.state = PYGWIDGETS_ANIMATION_PAUSED
+            self._setState(PYGWIDGETS_ANIMATION_PAUSED)
 
         elif self.state == PYGWIDGETS_ANIMATION_STOPPED:
             pass  # nothing to do
@@ -3054,84 +4728,118 @@ class PygAnimation(PygWidget):
         This method typically returns False, but will return True
         when an animation ends (and it is not looping)
 
+        (If this animation has been added to an AnimationScheduler, you do not need to call this,
+        the scheduler's update method updates all of its animations.)
+
         """
         if self.state != PYGWIDGETS_ANIMATION_PLAYING:
             return False
+
+        finished = self._advance(self.timeSource())
+        if finished and (self.callBack is not None):  # if there is a callBack
+            self.callBack(self.nickname)  # do it
+        return finished
+
+    def _advance(self, now):
+        """Internal method, moves the animation along to the given time (does not call the callBack).
+
+        Returns:
+            | True if the animation ended, otherwise False
+
+        """
         returnValue = False  # typical return value
+        previousIndex = self.index
 
         # The job here is to figure out the index of the image to show
         # and the matching elapsed time threshold for the current image
-        self.elapsed = (time.time() - self.animationPlayingStartTime)
-
-        if self.elapsed > self.elapsedStopTime:  # anim finished
-            if self.loop:  # restart the animation
-                self.animationPlayingStartTime = time.time()
-                self.nextElapsedThreshold = self.endTimesList[0]
-                self.index = 0
-            else:  # not looping
-                self.nIterationsLeft = self.nIterationsLeft - 1
-                if self.nIterationsLeft == 0:  # done
-                    self.state = PYGWIDGETS_ANIMATION_STOPPED
-                    if self.callBack is not None:  # if there is a callBack
-                        self.callBack(self.nickname)  # do it
-                    returnValue = True  # animation has ended
-
-                else:  # another iteration - start over again
-                    self.animationPlayingStartTime = time.time()
-                    self.nextElapsedThreshold = self.endTimesList[0]
-            if self.showFirstImageAtEnd:
-                self.index = 0  # show first image
-            else:
-                 self.index = len(self.imagesList) - 1  # show last image
+        self.elapsed = (now - self.animationPlayingStartTime)
+
+        if self.elapsed <= self.nextElapsedThreshold:
+            return False  # still showing the current image (the common case)
+
+        oClip = self.oClip
+        if self.elapsed > oClip.duration:  # anim finished (maybe more than once if frames were slow)
+            nFinished = int(self.elapsed // oClip.duration)
+            if (not self.loop) and (nFinished >= self.nIterationsLeft):  # done
+                self.nIterationsLeft = 0
+                self._setState(PYGWIDGETS_ANIMATION_STOPPED)
+                if self.showFirstImageAtEnd:
+                    self.index = 0  # show first image
+                else:
+                    self.index = len(oClip.imagesTuple) - 1  # show last image
+                self.dirty = True
+                return True  # animation has ended
 
-        elif self.elapsed > self.nextElapsedThreshold:
-            # Time to move on to next picture
-            self.index = self.index + 1
-            self.nextElapsedThreshold = self.endTimesList[self.index]
+            if not self.loop:
+                self.nIterationsLeft = self.nIterationsLeft - nFinished
+            # Start over again, keeping whatever time went past the end
+            self.animationPlayingStartTime = self.animationPlayingStartTime + (nFinished * oClip.duration)
+            self.elapsed = now - self.animationPlayingStartTime
 
-        return returnValue
+        # Find the image to show at this time, skipping any images whose time has already passed
+        endTimesTuple = oClip.endTimesTuple
+        self.index = min(bisect_left(endTimesTuple, self.elapsed), len(endTimesTuple) - 1)
+        self.nextElapsedThreshold = endTimesTuple[self.index]
 
-    def draw(self):
-        """Draws the current frame of the animation
+        if self.index != previousIndex:
+            self.dirty = True
 
-        Should be called in every frame.
+        return returnValue
 
-        """
-        # Assumes that self.index has been set earlier (typically in update method)
-        # it is used as the index of the current image/endTime/loc
-        theImage = self.imagesList[self.index]  # choose the image to show
+    def jumpTo(self, imageIndex):
+        """Moves the animation to the start of the given image.
 
-        if theImage is None:  # if there is no image to show
-            return
+        If the animation is playing, it continues playing from there.
+        If the animation is stopped, it is paused at that image, so a call to start will play from there.
 
-        if not self.visible:
-            return
-
-        theImageOffset = self.offsetsList[self.index]
-        self.window.blit(theImage, self.loc)
+        Parameter:
+            | imageIndex - index of the image to jump to
 
+        Raises:
+            | IndexError if the index is not valid
 
-    def getRect(self):
-        """Returns the rect of the current animation image
         """
-        theImage = self.imagesList[self.index]
-        if theImage is None:
-            return pygame.Rect(0, 0, 0, 0)
+        if (imageIndex < 0) or (imageIndex >= len(self.oClip.imagesTuple)):
+            raise IndexError('Invalid index in Animation.jumpTo: ' + str(imageIndex))
+        if imageIndex == 0:
+            seconds = 0
         else:
-            theRect = theImage.get_rect()
-            theRect[0] = self.loc[0]
-            theRect[1] = self.loc[1]
-            return theRect
+            seconds = self.oClip.endTimesTuple[imageIndex - 1]  # time when this image starts
+        self._seek(imageIndex, seconds)
+
+    def jumpToTime(self, seconds):
+        """Moves the animation to the image that is shown at the given time.
+
+        If the animation is playing, it continues playing from there.
+        If the animation is stopped, it is paused at that time, so a call to start will play from there.
+
+        Parameter:
+            | seconds - time from the start of the animation
+
+        Raises:
+            | ValueError if the time is negative, or past the end of the animation
 
-### For this to work correctly, I need to figure out the matching elapsedTime
-### Would be nice to add 'endImageIndex', to play a subAnimation.
-##    def jumpTo(self, imageIndex):
-##        """Returns the rect of the current animation image
-##        """
-##        if (imageIndex < 0) or (imageIndex >= len(self.imagesList)):
-##            raise IndexError('Invalid index in Animation.jumpTo:', str(index))
-##        self.index = imageIndex
+        """
+        if (seconds < 0) or (seconds > self.oClip.duration):
+            raise ValueError('Invalid time in Animation.jumpToTime: ' + str(seconds))
+        imageIndex = bisect_left(self.oClip.endTimesTuple, seconds)
+        self._seek(imageIndex, seconds)
+
+    def _seek(self, imageIndex, seconds):
+        # Internal method, shows the given image and sets the elapsed time to match
+        if self.index != imageIndex:
+            self.index = imageIndex
+            self.dirty = True
+        self.elapsed = seconds
+        self.nextElapsedThreshold = self.oClip.endTimesTuple[imageIndex]
 
+        if self.state == PYGWIDGETS_ANIMATION_PLAYING:
+            self.animationPlayingStartTime = self.timeSource() - seconds
+        else:
+            if self.state == PYGWIDGETS_ANIMATION_STOPPED:
+                self.nIterationsLeft = self.nTimes  # set up as start() would
+                self._setState(PYGWIDGETS_ANIMATION_PAUSED)
+            self.elapsedAtPause = seconds
 
     def setLoop(self, trueOrFalse):
         """Sets a value telling the animation if it should loop or not.
@@ -3146,16 +4854,139 @@ class PygAnimation(PygWidget):
         """Returns True if the animation is looping, otherwise False."""
         return self.loop
 
+    def getClip(self):
+        """Returns the AnimationClip (images and timings) that this animation plays."""
+        return self.oClip
+
     def reset(self):
         """Resets the current animation to the first image and stops"""
         self.index = 0
-        self.state = PYGWIDGETS_ANIMATION_STOPPED
+        self._setState(PYGWIDGETS_ANIMATION_STOPPED)
+        self.dirty = True
+
+    def _setState(self, newState):
+        """Internal method, sets the state, and lets the scheduler (if any) know if this animation is playing."""
+        self.state = newState
+        if self.oScheduler is not None:
+            self.oScheduler._setPlaying(self, newState == PYGWIDGETS_ANIMATION_PLAYING)
+
+    def _setTimeSource(self, timeSource):
+        """Internal method, changes the function used to get the time, keeping a playing animation in place."""
+        if self.state == PYGWIDGETS_ANIMATION_PLAYING:
+            elapsed = self.timeSource() - self.animationPlayingStartTime
+            self.animationPlayingStartTime = timeSource() - elapsed
+        self.timeSource = timeSource
 
 
 #
 #
-# ANIMATION
+# PygAnimation
+#
+#
+class PygAnimation(PygWidget, PygAnimationPlayback):
+    """Base class of the Animation class and the SpriteSheetAnimation class
+
+    This is an abstract class. Do not instantiate this class.
+    Instead, you should instantiate either an Animation class (using multiple images)
+    or a SpriteSheetAnimation (single file made up of equally spaces images).
+    Details are in comments for those classes below.
+
+    """
+    # Class level defaults, because AnimationCollection skips __init__
+    oScheduler = None
+    oCollection = None
+
+    @abstractmethod
+    def __init__(self, window, loc, loop, showFirstImageAtEnd, nickname, callBack,
+                 nTimes, oClip):
+
+        super().__init__(nickname)
+        # Initialize instance variables common to both types of Animations
+        self.window = window
+        self.loc = loc
+        self._initPlayback(oClip, loop, showFirstImageAtEnd, nickname, callBack, nTimes)
+
+    # The images, end times, and offsets are kept in the (shared) clip
+    @property
+    def imagesList(self):
+        return self.oClip.imagesTuple
+
+    @property
+    def endTimesList(self):
+        return self.oClip.endTimesTuple
+
+    @property
+    def offsetsList(self):
+        return self.oClip.offsetsTuple
+
+    def handleEvent(self, eventObj):
+        """This method should be called every time through the event loop (inside the main loop).
+
+        Returns:
+            | False - if no event happens on this widget.
+            | True - if the user clicks the animation (typically to start it playing).
+        """
+        if not self.visible:
+            return
+        if not self.isEnabled:
+            return False
+
+        if eventObj.type != MOUSEBUTTONDOWN:
+            # The animation only cares about a mouse down event
+            return False
+
+        eventPointInAnimationRect = self.rect.collidepoint(eventObj.pos)
+        if not eventPointInAnimationRect:  # clicked outside of animation
+            return False
+
+        if self.state == PYGWIDGETS_ANIMATION_PLAYING:  # if playing, ignore the click
+            return False
+
+        return True
+
+    def draw(self):
+        """Draws the current frame of the animation
+
+        Should be called in every frame.
+
+        """
+        # Assumes that self.index has been set earlier (typically in update method)
+        # it is used as the index of the current image/endTime/loc
+        theImage = self.oClip.imagesTuple[self.index]  # choose the image to show
+
+        if theImage is None:  # if there is no image to show
+            return
+
+        if not self.visible:
+            return
+
+        self.window.blit(theImage, self.loc)
+
+    def getBlitInfo(self):
+        """Returns a tuple of the current frame's image, and the location to draw it.
+        (Returns None if the current frame has no image.)
+        """
+        theImage = self.oClip.imagesTuple[self.index]
+        if theImage is None:  # nothing to blit, draw does nothing
+            return None
+        return theImage, self.loc
+
+
+    def getRect(self):
+        """Returns the rect of the current animation image
+        """
+        theImage = self.oClip.imagesTuple[self.index]
+        if theImage is None:
+            return pygame.Rect(0, 0, 0, 0)
+        else:
+            theRect = theImage.get_rect()
+            theRect[0] = self.loc[0]
+            theRect[1] = self.loc[1]
+            return theRect
+
+
 #
+# ANIMATION
 #
 class Animation(PygAnimation):
     """Shows an animated sequence of images
@@ -3200,6 +5031,7 @@ class Animation(PygAnimation):
         |     In most cases you will only need a path and a duration
         |     The duration is in seconds, e.g., 1 for one second, or .5 for half a second
         |     If an optional offset is given, it is used as an offset from loc
+        |     (Can also be an AnimationClip, to share the images of another animation)
 
     Optional keyword parameters:
         | autoStart - should the animation start right away (default False)
@@ -3219,46 +5051,29 @@ class Animation(PygAnimation):
                  showFirstImageAtEnd=True, path='', nickname=None, callBack=None,
                  nIterations=1):
 
-        # Takes incoming list of animation tuples and creates three lists:
-        # 1) imagesList list of images to show (empty string means no image)
-        # 2) endTimesList - list of (elapsed times) when next pic should show
-        # 3) offsetsList - list of offsets from the base loc to show each image
+        # Takes incoming list of animation tuples and creates an AnimationClip with three tuples:
+        # 1) imagesTuple - images to show (None means no image)
+        # 2) endTimesTuple - (elapsed times) when next pic should show
+        # 3) offsetsTuple - offsets from the base loc to show each image
         #             if no offset given, use (0, 0) - (most typical)
         #
         # self.state is one of:  PYGWIDGETS_ANIMATION_PLAYING, PYGWIDGETS_ANIMATION_PAUSED, PYGWIDGETS_ANIMATION_STOPPED
-        # self.endTimesList is used to decide when it is time to move onto the next image
+        # the end times are used to decide when it is time to move onto the next image
+        if isinstance(animTuplesList, AnimationClip):
+            oClip = animTuplesList
+        else:
+            oClip = AnimationClip.fromAnimTuples(animTuplesList, path)
 
         super().__init__(window, loc, loop, showFirstImageAtEnd, nickname, callBack,
-                         nIterations)
+                         nIterations, oClip)
 
-        # Load the images
-        endTime = 0
+        # Build rect of the first image
         self.rect = None
-        for animTuple in animTuplesList:
-            picPath = animTuple[0]
-            duration = animTuple[1]
-            if len(animTuple) == 2:
-                self.offsetsList.append((0, 0))  # use default location - no offset
-            else:
-                self.offsetsList.append(animTuple[2])  # use specific location offset
-
-            if isinstance(picPath, str):  #typical case, picPath is a string
-                if picPath == '':
-                    image = None  # special value, meaning no image to show
-                else:
-                    image = _loadImageAndConvert(path + picPath)  # normal case, load an image
-
-            else:
-                image = picPath  # assume that picPath is an pre-loaded image
-
-            if self.rect is None:  # first time through the loop - build rect of 1st image
-                if image is not None:
-                    thisWidth, thisHeight = image.get_size()
-                    self.rect = pygame.Rect(self.loc[0], self.loc[1], thisWidth, thisHeight)
-
-            self.imagesList.append(image)
-            endTime = endTime + duration
-            self.endTimesList.append(endTime)
+        for image in oClip.imagesTuple:
+            if image is not None:
+                thisWidth, thisHeight = image.get_size()
+                self.rect = pygame.Rect(self.loc[0], self.loc[1], thisWidth, thisHeight)
+                break
 
         if autoStart:
             self.start()  # start animation playing
@@ -3331,56 +5146,22 @@ class SpriteSheetAnimation(PygAnimation):
                  autoStart=False, loop=False, showFirstImageAtEnd=True, path='',
                  nickname=None, callBack=None, nIterations=1):
 
-        super().__init__(window, loc, loop, showFirstImageAtEnd, nickname, callBack,
-                         nIterations)
-
-        # Create images by taking subSurfaces of the sprite sheet
-        endTime = 0
         if isinstance(durationOrDurationsList, tuple) or isinstance(durationOrDurationsList, list):
-            useSameDuration = False  # this is a list of durations
             if nImages != len(durationOrDurationsList):
                 raise ValueError('In SpriteSheetAnimation, number of images ' + str(nImages) +
                                 ' and number of duration times ' + str(len(durationOrDurationsList)) +
                                 ' do not match.')
 
-        else:
-            useSameDuration = True  # this is a single duration
-
-        self.rect = pygame.Rect(loc[0], loc[1], width, height)
-
-        # Load the sprite sheet.
-        spriteSheetImage = _loadImageAndConvert(path + imagePath)
-
-        # Calculate the number of columns in the starting image
-        nCols = spriteSheetImage.get_width() // width
-
-        # Break the starting image into subimages
-        row = 0
-        col = 0
-        for imageNumber in range(nImages):
-            x = col * width
-            y = row * height
-
-            # Create a sub-image
-            subsurfaceRect = pygame.Rect(x, y, width, height)
-            image = spriteSheetImage.subsurface(subsurfaceRect)
+        # The images are cut from the sprite sheet only once, and shared by all animations
+        # that use the same sprite sheet
+        oClip = AnimationClip.fromSpriteSheet(path + imagePath, nImages, width, height,
+                                              durationOrDurationsList)
 
-            self.imagesList.append(image)
-            self.offsetsList.append((0, 0))  # use default location - no offsets
-
-            if useSameDuration:
-                endTime = endTime + durationOrDurationsList
-            else:
-                endTime = endTime + durationOrDurationsList[imageNumber]
-            self.endTimesList.append(endTime)
+        super().__init__(window, loc, loop, showFirstImageAtEnd, nickname, callBack,
+                         nIterations, oClip)
 
-            col = col + 1
-            if col == nCols:
-                col = 0
-                row = row + 1
+        self.rect = pygame.Rect(loc[0], loc[1], width, height)
 
-        # self.nextElapsedThreshold = self.endTimesList[0]  # endpoint for current image
-        self.state = PYGWIDGETS_ANIMATION_STOPPED
         if autoStart:
             self.start()  # start animation playing
 
@@ -3430,6 +5211,9 @@ class AnimationCollection(Animation):
         | path - any path that you want to prepend to each animation, for example,
         |        if all images are in a folder named 'animations', give the relative path to that folder as 'animations/' (defaults to empty string)
         | nickname - any nickname you want to use to identify this AnimationCollection (defaults to None)
+        | lazy - if True, each animation is only built (and its images loaded) the first time it is shown
+        |        by replace, so creating the collection only loads the starting animation.
+        |        Use prefetch to load animations that are likely to be shown next.  (defaults to False)
 
     Raises:
         | ValueError if the startImageKey is not found in the animationsDict dictionary
@@ -3438,18 +5222,86 @@ class AnimationCollection(Animation):
     """
     def __init__(self, window, loc, animationsTuplesDict, startAnimationKey,
                  autoStart=False, loop=False, showFirstImageAtEnd=True, path='',
-                 nickname=None, callBack=None, nIterations=1):
+                 nickname=None, callBack=None, nIterations=1, lazy=False):
         self.window = window
         self.loc = loc
-        self.animationsDict = {}
+        self.animationsTuplesDict = animationsTuplesDict
+        self.path = path
+        # Options used to build each animation
+        self.animationOptionsTuple = (autoStart, loop, showFirstImageAtEnd, path, nickname, callBack, nIterations)
+        self.animationsDict = {}  # key -> animation, only animations that have been built
 
-        for key, animationTuple in animationsTuplesDict.items():
-            oAnimation = Animation(self.window, self.loc, animationTuple, autoStart,
-                                              loop, showFirstImageAtEnd, path, nickname, callBack, nIterations)
-            self.animationsDict[key] = oAnimation
+        if not lazy:
+            for key in animationsTuplesDict:
+                self._buildAnimation(key)
 
         self.replace(startAnimationKey)
 
+    def _buildAnimation(self, key):
+        # Internal method, builds the animation for a key
+        oAnimation = Animation(self.window, self.loc, self.animationsTuplesDict[key],
+                               *self.animationOptionsTuple)
+        self._addAnimation(key, oAnimation)
+        return oAnimation
+
+    def _addAnimation(self, key, oAnimation):
+        # Internal method, adds a newly built animation to the collection (and to the scheduler, if any)
+        oAnimation.oCollection = self
+        self.animationsDict[key] = oAnimation
+        if self.oScheduler is not None:
+            self.oScheduler.add(oAnimation)
+
+    def _loadImages(self, key):
+        # Internal method, loads the images of an animation into the image cache (thread safe)
+        for animTuple in self.animationsTuplesDict[key]:
+            picPath = animTuple[0]
+            if isinstance(picPath, str) and (picPath != ''):
+                _PYGWIDGETS_IMAGE_CACHE.loadImage(self.path + picPath)
+
+    def prefetch(self, keysList, background=False):
+        """Loads animations that are likely to be shown soon, so that replace does not need to wait.
+        (Only useful if the collection was created with lazy=True.)
+
+        Parameters:
+            | keysList - a list of keys of animations to load
+
+        Optional keyword parameters:
+            | background - if True, load the images on a background thread and return right away.
+            |     Only the (slow) loading of image files happens on the thread, the animation
+            |     itself is built the first time replace shows it.  (defaults to False)
+
+        Returns:
+            |     the background thread (call its join method to wait for it), or None if background is False
+
+        Raises:
+            | KeyError if a key is not found in the animations dictionary
+
+        """
+        for key in keysList:
+            if not (key in self.animationsTuplesDict):
+                message = 'AnimationCollection: The  key "' + str(key) + '" was not found in the animations dictionary'
+                raise KeyError(message)
+        keysToLoadList = [key for key in keysList if not (key in self.animationsDict)]
+
+        if background:
+            oThread = threading.Thread(target=self._prefetchImages, args=(keysToLoadList,),
+                                       name='pygwidgets animation prefetch', daemon=True)
+            oThread.start()
+            return oThread
+
+        for key in keysToLoadList:
+            self._buildAnimation(key)
+        return None
+
+    def _prefetchImages(self, keysList):
+        # Internal method, runs on a background thread to load the images of animations
+        for key in keysList:
+            self._loadImages(key)
+
+    def isLoaded(self, key):
+        """Returns True if the animation for the key has been built, otherwise False."""
+        return key in self.animationsDict
+
     def replace(self, key, reset=False):
         """Selects a different animation to be shown.
 
@@ -3463,14 +5315,18 @@ class AnimationCollection(Animation):
             | KeyError if the key to use to replace an animation is not found in the dictionary
 
         """
-        if not (key in self.animationsDict):
+        if not (key in self.animationsTuplesDict):
             message = 'AnimationCollection: The  key "' + key + '" was not found in the animations dictionary'
             raise KeyError(message)
 
         self.currentAnimationKey = key
-        self.oCurrentAnimation = self.animationsDict[self.currentAnimationKey]
+        if key in self.animationsDict:
+            self.oCurrentAnimation = self.animationsDict[key]
+        else:  # lazy collection, first time this animation is shown
+            self.oCurrentAnimation = self._buildAnimation(key)
         if reset:
             self.oCurrentAnimation.reset()
+        self._notifyRectChanged()  # new animation may be a different size
 
 
     def start(self):
@@ -3489,12 +5345,30 @@ class AnimationCollection(Animation):
         done = self.oCurrentAnimation.update()
         return done
 
+    def handleEvent(self, eventObj):
+        return self.oCurrentAnimation.handleEvent(eventObj)
+
     def getRect(self):
         return self.oCurrentAnimation.getRect()
 
+    def getVisible(self):
+        return self.oCurrentAnimation.getVisible()
+
+    def getBlitInfo(self):
+        return self.oCurrentAnimation.getBlitInfo()
+
+    def getDirty(self):
+        return self.dirty or self.oCurrentAnimation.getDirty()
+
+    def setDirty(self, trueOrFalse):
+        self.dirty = trueOrFalse
+        self.oCurrentAnimation.setDirty(trueOrFalse)
+
     def setLoc(self, locTuple):
+        self.loc = locTuple  # used for animations that are built later
         for key, oAnimation in self.animationsDict.items():
             oAnimation.setLoc(locTuple)
+        self._notifyRectChanged()
 
     def draw(self):
         self.oCurrentAnimation.draw()
@@ -3548,6 +5422,9 @@ class SpriteSheetAnimationCollection(AnimationCollection):
         | nickname -  an internal name to refer to this animation (default None)
         | callBack - function or object.method to call when the animation finishes (default None)
         | nIterations - number of iterations (default 1)
+        | lazy - if True, each animation is only built (and its sprite sheet loaded) the first time it is shown
+        |        by replace, so creating the collection only loads the starting animation.
+        |        Use prefetch to load animations that are likely to be shown next.  (defaults to False)
 
     Raises:
         | ValueError if the number of images and the length of the durations list don't match
@@ -3557,20 +5434,265 @@ class SpriteSheetAnimationCollection(AnimationCollection):
 
     def __init__(self, window, loc, spriteSheetAnimationsDict, startAnimationKey,
                  autoStart=False, loop=False, showFirstImageAtEnd=True, path='',
+                 nickname=None, callBack=None, nIterations=1, lazy=False):
+        super().__init__(window, loc, spriteSheetAnimationsDict, startAnimationKey,
+                         autoStart, loop, showFirstImageAtEnd, path,
+                         nickname, callBack, nIterations, lazy)
+
+    def _buildAnimation(self, key):
+        # Internal method, builds the sprite sheet animation for a key
+        animationInfo = self.animationsTuplesDict[key]
+        oAnimation = SpriteSheetAnimation(self.window, self.loc,
+                                        animationInfo[0], animationInfo[1], animationInfo[2],
+                                        animationInfo[3],animationInfo[4],
+                                        *self.animationOptionsTuple)
+        self._addAnimation(key, oAnimation)
+        return oAnimation
+
+    def _loadImages(self, key):
+        # Internal method, loads and cuts up the sprite sheet of an animation in the image cache (thread safe)
+        imagePath, nImages, width, height = self.animationsTuplesDict[key][:4]
+        _PYGWIDGETS_IMAGE_CACHE.getSpriteSheetFrames(self.path + imagePath, width, height, nImages)
+
+
+#
+#
+# ANIMATION PLAYER
+#
+#
+class AnimationPlayer(PygAnimationPlayback):
+    """AnimationPlayer - a lightweight animation that plays an AnimationClip.
+
+    An AnimationPlayer has the same methods for playing as Animation (start, stop, pause, update,
+    jumpTo, ...) and for drawing (draw, getBlitInfo, getRect), but it is not a full widget:
+    it does not handle events, and cannot be shown, hidden, enabled, or disabled.
+    In exchange, it only stores its own playback state, so it is very small and very fast to create.
+    Use it when you have thousands of animations on the screen (e.g., particles, explosions, coins).
+
+    Typical use:
+
+        | oClip = pygwidgets.AnimationClip.fromSpriteSheet('images/coin.png', 8, 32, 32, .08)
+        | oScheduler = pygwidgets.AnimationScheduler()
+        | coinsList = []
+        | for loc in coinLocsList:
+        |     oCoin = pygwidgets.AnimationPlayer(window, loc, oClip, autoStart=True, loop=True)
+        |     coinsList.append(oCoin)
+        | oScheduler.add(coinsList)
+        |
+        | # In the big loop:
+        | oScheduler.update()
+        | window.blits([oCoin.getBlitInfo() for oCoin in coinsList], doreturn=False)
+
+    Parameters:
+        | window - the window of the application for the draw method to draw into
+        | loc - location of where the animation image should be drawn
+        | oClip - the AnimationClip to play
+
+    Optional keyword parameters:
+        | autoStart - should the animation start right away (default False)
+        | loop -  should the animation loop continuously (default False)
+        | showFirstImageAtEnd - when an animation ends, show the first image again (default True)
+        | nickname -  an internal name to refer to this animation (default None)
+        | callBack - function or object.method to call when the animation finishes (default None)
+        | nIterations - number of iterations (default 1)
+
+    """
+    __slots__ = ('window', 'loc', 'oClip', 'loop', 'showFirstImageAtEnd', 'nickname', 'callBack',
+                 'nTimes', 'index', 'elapsed', 'elapsedAtPause', 'nIterationsLeft', 'state',
+                 'timeSource', 'animationPlayingStartTime', 'nextElapsedThreshold', 'dirty',
+                 'oScheduler', 'oCollection')
+
+    def __init__(self, window, loc, oClip, autoStart=False, loop=False, showFirstImageAtEnd=True,
                  nickname=None, callBack=None, nIterations=1):
         self.window = window
         self.loc = loc
-        self.animationsDict = {}
+        self._initPlayback(oClip, loop, showFirstImageAtEnd, nickname, callBack, nIterations)
+        if autoStart:
+            self.start()  # start animation playing
+
+    def draw(self):
+        """Draws the current image of the animation."""
+        theImage = self.oClip.imagesTuple[self.index]
+        if theImage is not None:
+            self.window.blit(theImage, self.loc)
+
+    def getBlitInfo(self):
+        """Returns a tuple of the current image, and the location to draw it.
+        (Returns None if the current image is None.)
+        """
+        theImage = self.oClip.imagesTuple[self.index]
+        if theImage is None:  # nothing to blit, draw does nothing
+            return None
+        return theImage, self.loc
 
-        for key, animationInfo in spriteSheetAnimationsDict.items():
-            oAnimation = SpriteSheetAnimation(self.window, self.loc,
-                                            animationInfo[0], animationInfo[1], animationInfo[2],
-                                            animationInfo[3],animationInfo[4],
-                                            autoStart, loop, showFirstImageAtEnd, path,
-                                            nickname, callBack, nIterations)
-            self.animationsDict[key] = oAnimation
+    def getRect(self):
+        """Returns the rect of the current animation image."""
+        theImage = self.oClip.imagesTuple[self.index]
+        if theImage is None:
+            return pygame.Rect(self.loc[0], self.loc[1], 0, 0)
+        return theImage.get_rect(topleft=self.loc)
 
-        self.replace(startAnimationKey)
+    def getLoc(self):
+        """Returns the location of this animation as a tuple of values (X,Y)."""
+        return self.loc
+
+    def setLoc(self, loc):
+        """Sets a new location for this animation.
+
+        Parameter:
+            |   loc - a tuple of X,Y coordinates
+
+        """
+        self.loc = loc
+        self.dirty = True
+
+    def getNickname(self):
+        """Returns the nickname associated with this animation."""
+        return self.nickname
+
+
+#
+#
+# ANIMATION SCHEDULER
+#
+#
+class AnimationScheduler():
+    """AnimationScheduler - updates many animations together, reading the clock only once per frame.
+
+    Without a scheduler, you call the update method of every animation in every frame, and each
+    one gets the time for itself.  A scheduler gets the time once, and only updates the animations
+    that are playing.  Animations that are stopped or paused cost nothing.
+
+    Typical use:
+
+    1) Create an AnimationScheduler, and add your animations to it (Animation,
+        SpriteSheetAnimation, AnimationCollection, or SpriteSheetAnimationCollection objects):
+
+        | oScheduler = pygwidgets.AnimationScheduler()
+        | oScheduler.add([oAnimation1, oAnimation2, oAnimationCollection])
+
+    2) In your big loop, instead of calling the update method of each animation, call:
+
+        | finishedList = oScheduler.update()
+
+        This returns a list of the animations that finished in this frame (usually an empty list).
+        For an animation collection, the collection itself is in the list, not its current animation.
+        The callBack of any animation that finished is called after all animations are updated.
+
+    3) Draw the animations as usual.
+
+    Optional keyword parameters:
+        | clock - a function that returns the current time in seconds (defaults to time.monotonic)
+        |         You can pass in your own function, for example, to get repeatable results when testing
+
+    """
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.animationsList = []
+        self.playingDict = {}  # animations that are playing (used as an ordered set)
+        self.now = clock()
+
+    def add(self, oAnimationOrList):
+        """Adds an animation, an animation collection, or a list of these, to the scheduler.
+
+        Parameters:
+            | oAnimationOrList - an animation or animation collection, or a list of them
+
+        """
+        if not isinstance(oAnimationOrList, (list, tuple)):
+            oAnimationOrList = [oAnimationOrList]
+        for oAnimation in oAnimationOrList:
+            if isinstance(oAnimation, AnimationCollection):  # add every animation in the collection
+                oAnimation.oScheduler = self  # so that animations built later (lazy) are added too
+                self.add(list(oAnimation.animationsDict.values()))
+                continue
+            if oAnimation.oScheduler is self:
+                continue
+            if oAnimation.oScheduler is not None:
+                oAnimation.oScheduler.remove(oAnimation)
+            oAnimation._setTimeSource(self.clock)
+            oAnimation.oScheduler = self
+            self.animationsList.append(oAnimation)
+            self._setPlaying(oAnimation, oAnimation.state == PYGWIDGETS_ANIMATION_PLAYING)
+
+    def remove(self, oAnimation):
+        """Removes an animation or an animation collection from the scheduler.
+
+        Raises:
+            | ValueError if the animation was not added to this scheduler
+
+        """
+        if isinstance(oAnimation, AnimationCollection):
+            oAnimation.oScheduler = None
+            for oMemberAnimation in oAnimation.animationsDict.values():
+                self.remove(oMemberAnimation)
+            return
+        if oAnimation.oScheduler is not self:
+            raise ValueError('AnimationScheduler.remove: animation was not added to this scheduler')
+        self.animationsList.remove(oAnimation)
+        self.playingDict.pop(oAnimation, None)
+        oAnimation.oScheduler = None
+        oAnimation._setTimeSource(time.time)
+
+    def removeAll(self):
+        """Removes all animations from the scheduler."""
+        for oAnimation in list(self.animationsList):
+            oCollection = oAnimation.oCollection
+            if (oCollection is not None) and (oCollection.oScheduler is self):
+                oCollection.oScheduler = None
+            self.remove(oAnimation)
+
+    def getAnimations(self):
+        """Returns a list of all animations in the scheduler."""
+        return list(self.animationsList)
+
+    def getTime(self):
+        """Returns the time used for the most recent update."""
+        return self.now
+
+    def update(self, now=None):
+        """Updates all playing animations.  Call this once in every frame.
+
+        Optional keyword parameters:
+            | now - the time to update to (defaults to None, meaning read the time from the clock)
+
+        Returns:
+            | a list of the animations and animation collections (as they were added) that finished
+            | (usually an empty list)
+
+        """
+        if now is None:
+            now = self.clock()
+        self.now = now
+
+        finishedList = []
+        # Copy the playing animations, because animations that finish remove themselves
+        for oAnimation in list(self.playingDict):
+            oCollection = oAnimation.oCollection
+            if (oCollection is not None) and (oCollection.oCurrentAnimation is not oAnimation):
+                continue  # only the current animation of a collection is updated
+            if oAnimation._advance(now):
+                finishedList.append(oAnimation)
+
+        # Call the callBacks after all animations are updated
+        for oAnimation in finishedList:
+            if oAnimation.callBack is not None:
+                oAnimation.callBack(oAnimation.nickname)
+
+        # Report each finished animation as it was added:  an animation of a collection is reported
+        # as the collection (only the current animation of a collection is updated, so it is only once)
+        for index, oAnimation in enumerate(finishedList):
+            oCollection = oAnimation.oCollection
+            if (oCollection is not None) and (oCollection.oScheduler is self):
+                finishedList[index] = oCollection
+        return finishedList
+
+    def _setPlaying(self, oAnimation, isPlaying):
+        # Internal method, called by animations when they start or stop playing
+        if isPlaying:
+            self.playingDict[oAnimation] = True
+        else:
+            self.playingDict.pop(oAnimation, None)
 
 
 class SoundEffect():
@@ -3588,21 +5710,35 @@ class SoundEffect():
     Parameters:
         | relativePath - a relative path to the sound file
 
+    Optional keyword parameters (only used when a SoundManager has been set, see setSoundManager):
+        | priority - a higher priority sound can take over the channel of a lower priority sound (default 0)
+        | maxInstances - the most copies of this sound that can play at once
+        |     (default None, meaning the SoundManager's value)
+        | minInterval - the shortest time (in seconds) between starts of this sound, starts that come
+        |     sooner are ignored (default None, meaning the SoundManager's value)
+
     Raises:
         | FileNotFoundError if a file at a given path cannot be found
 
     """
-    def __init__(self, relativePath):
-        fullPath = buildPathFromRelativePath(relativePath)
-        pygame.mixer.init()
+    def __init__(self, relativePath, priority=0, maxInstances=None, minInterval=None):
+        self.priority = priority
+        self.maxInstances = maxInstances
+        self.minInterval = minInterval
         try:
-            self.oSound = pygame.mixer.Sound(fullPath)
+            # SoundEffects using the same file share one (already loaded) Sound
+            self.oSound = _PYGWIDGETS_SOUND_CACHE.loadSound(relativePath)
         except FileNotFoundError:
             raise FileNotFoundError(f'Trying to create SoundEffect, but the file {relativePath} count not be found')
 
     def play(self):
-        """Starts the sound effect playing"""
-        self.oSound.play()
+        """Starts the sound effect playing
+
+        Returns:
+            | the pygame Channel the sound is playing on, or None if it was not played
+
+        """
+        return _playSound(self.oSound, self.priority, self.maxInstances, self.minInterval)
 
 class BackgroundSound():
     """BackgroundSound - allows you to play a long background file - typically music.
@@ -3625,6 +5761,7 @@ class BackgroundSound():
      """
     def __init__(self, relativePath):
         fullPath = buildPathFromRelativePath(relativePath)
+        _initMixer()
         try:
             pygame.mixer.music.load(fullPath)
         except FileNotFoundError:
@@ -3670,3 +5807,1579 @@ class BackgroundSound():
     def getPlaying(self):
         """Returns True if the music is playing, or False if it is not"""
         return self.musicPlaying
+
+
+class BackgroundPlaylist():
+    """BackgroundPlaylist - plays a list of background music files (typically .mp3 files) one after another.
+
+    Each file is checked and read into memory on a background thread before it is needed, so
+    starting or changing tracks never waits for the disk.  The next track is queued in pygame's music
+    player (pygame.mixer.music.queue), so when a track ends, the next one starts with no gap.
+
+    pygame plays only one music file at a time, so two tracks cannot overlap (no true crossfade).
+    Instead, if you give a fadeMs value, calls to next, previous, playTrack, and stop fade the current
+    track out, and the new track fades in.  Tracks that end by themselves always go straight into the next track.
+
+    A BackgroundPlaylist uses pygame's music player, so do not play a BackgroundSound at the same time.
+
+    Typical use:
+
+    1) Create a BackgroundPlaylist object specifying a list of paths to music files
+        | oPlaylist = pygwidgets.BackgroundPlaylist(['sounds/song1.mp3', 'sounds/song2.mp3'])
+
+    2) To start playing:
+        | oPlaylist.play()
+
+    3) In your event loop, pass every event to the playlist, and call update once per frame:
+        | oPlaylist.handleEvent(event)  # returns True when the next track starts
+        | ...
+        | oPlaylist.update()
+
+    Parameters:
+        | pathsList - a list of relative paths to music files
+
+    Optional keyword parameters:
+        | loop - start over with the first track after the last track ends (default True)
+        | fadeMs - number of milliseconds to fade out and in when you change tracks (default 0, no fade)
+
+    Files that cannot be found are skipped (see getInvalidPaths).
+
+    """
+    def __init__(self, pathsList=None, loop=True, fadeMs=0):
+        _initMixer()
+        self.loop = loop
+        self.fadeMs = fadeMs
+        self._lock = threading.RLock()  # guards the tracks, their data, and the current and pending tracks
+        self.tracksList = []  # for each track: [relativePath, fullPath, isValid] (isValid is None until checked)
+        self.dataDict = {}  # track index -> contents of the file, for the current and next tracks
+        self.loadingSet = set()  # indices of tracks being read on background threads
+        self.currentIndex = None
+        self.queuedIndex = None  # track queued to follow the current track
+        self.pendingIndex = None  # track to start as soon as its data is read (and any fade out ends)
+        self.pendingStart = 0.0
+        self.pendingFadeMs = 0
+        self.nStaleEndEvents = 0  # end events still to come from tracks that were faded out
+        self.musicPlaying = False
+        self.musicPaused = False
+        if pathsList is not None:
+            self.add(pathsList)
+
+    def add(self, pathsList):
+        """Adds one or more music files to the end of the playlist.
+
+        Parameters:
+            | pathsList - a relative path, or a list of relative paths, to music files
+
+        Returns:
+            |     the background thread that checks the files (call its join method to wait for it)
+
+        """
+        if isinstance(pathsList, str):
+            pathsList = [pathsList]
+        with self._lock:
+            firstIndex = len(self.tracksList)
+            for relativePath in pathsList:
+                self.tracksList.append([relativePath, None, None])
+        oThread = threading.Thread(target=self._checkTracks, args=(firstIndex, firstIndex + len(pathsList)),
+                                   name='pygwidgets playlist check', daemon=True)
+        oThread.start()
+        return oThread
+
+    def _checkTracks(self, firstIndex, lastIndex):
+        # Internal method, runs on a background thread: builds full paths and checks that the files exist
+        for index in range(firstIndex, lastIndex):
+            with self._lock:
+                relativePath = self.tracksList[index][0]
+            fullPath = buildPathFromRelativePath(relativePath)
+            isValid = os.path.isfile(fullPath)
+            with self._lock:
+                self.tracksList[index][1] = fullPath
+                self.tracksList[index][2] = isValid
+        with self._lock:
+            if (self.currentIndex is not None) or (self.pendingIndex is not None):
+                return
+            nextIndex = self._getNextIndex(-1)
+        if nextIndex is not None:
+            self._prefetchTrack(nextIndex)  # the first track is likely to be played first, read it now
+
+    def _prefetchTrack(self, index):
+        # Internal method, starts reading a track on a background thread (if it is not already read)
+        with self._lock:
+            if (index in self.dataDict) or (index in self.loadingSet):
+                return
+            self.loadingSet.add(index)
+        oThread = threading.Thread(target=self._readTrack, args=(index,),
+                                   name='pygwidgets playlist read', daemon=True)
+        oThread.start()
+
+    def _readTrack(self, index):
+        # Internal method, runs on a background thread started by _prefetchTrack: reads a file into memory
+        with self._lock:
+            relativePath, fullPath, isValid = self.tracksList[index]
+        if fullPath is None:
+            fullPath = buildPathFromRelativePath(relativePath)
+        try:
+            with open(fullPath, 'rb') as musicFile:
+                data = musicFile.read()
+        except OSError:
+            data = None
+        with self._lock:
+            self.tracksList[index][1] = fullPath
+            self.tracksList[index][2] = data is not None
+            if data is not None:
+                self.dataDict[index] = data
+            self.loadingSet.discard(index)
+
+    def _getNextIndex(self, index):
+        # Internal method, returns the index of the track to play after the given one (skipping
+        # files that could not be found), or None if there is none
+        with self._lock:
+            nTracks = len(self.tracksList)
+            for offset in range(1, nTracks + 1):
+                nextIndex = index + offset
+                if nextIndex >= nTracks:
+                    if not self.loop:
+                        return None
+                    nextIndex = nextIndex % nTracks
+                if self.tracksList[nextIndex][2] is not False:
+                    return nextIndex
+        return None
+
+    def _getTrackFile(self, index):
+        # Internal method, returns a file object and name hint (file extension) to give to pygame
+        relativePath = self.tracksList[index][0]
+        return io.BytesIO(self.dataDict[index]), os.path.splitext(relativePath)[1][1:]
+
+    def _startTrack(self, index, start, fadeMs):
+        # Internal method, starts playing a track whose data has been read
+        oFile, nameHint = self._getTrackFile(index)
+        pygame.mixer.music.load(oFile, nameHint)
+        pygame.mixer.music.set_endevent(PYGWIDGETS_MUSIC_END_EVENT)
+        pygame.mixer.music.play(0, start, fadeMs)
+        with self._lock:
+            self.currentIndex = index
+            self.queuedIndex = None
+        self.musicPlaying = True
+        self.musicPaused = False
+        self._discardData()
+        self.update()  # queue the next track, if it is ready
+
+    def _discardData(self):
+        # Internal method, frees the data of tracks other than the current and queued tracks
+        keepSet = {self.currentIndex, self.queuedIndex, self.pendingIndex}
+        with self._lock:
+            for index in list(self.dataDict):
+                if index not in keepSet:
+                    del self.dataDict[index]
+
+    def _stopMusic(self, fadeMs):
+        # Internal method, stops (or fades out) the current track without moving on to a queued track
+        if fadeMs > 0 and self.musicPlaying and (not self.musicPaused):
+            pygame.mixer.music.fadeout(fadeMs)  # also drops any queued track
+            self.nStaleEndEvents = self.nStaleEndEvents + 1
+        else:
+            pygame.mixer.music.set_endevent()  # stopping posts an end event, ignore it
+            pygame.mixer.music.stop()
+            pygame.mixer.music.set_endevent(PYGWIDGETS_MUSIC_END_EVENT)
+            self.nStaleEndEvents = 0
+        self.queuedIndex = None
+
+    def playTrack(self, index, start=0.0):
+        """Starts playing a given track.  The track starts as soon as its file has been read.
+
+        Parameters:
+            | index - index of the track in the playlist
+
+        Optional keyword parameters:
+            | start - how far into the track to start, in seconds (default is 0.0 meaning start at the beginning)
+
+        Raises:
+            | IndexError if there is no track with the given index
+
+        """
+        if not (0 <= index < len(self.tracksList)):
+            raise IndexError('BackgroundPlaylist has no track with index ' + str(index))
+        if self.musicPlaying:
+            self._stopMusic(self.fadeMs)
+            fadeMs = self.fadeMs
+        else:
+            fadeMs = 0
+        with self._lock:
+            self.pendingIndex = index
+            self.pendingStart = start
+            self.pendingFadeMs = fadeMs
+        self.musicPlaying = True
+        self.musicPaused = False
+        self._prefetchTrack(index)
+        self.update()
+
+    def play(self, start=0.0):
+        """Starts the playlist playing from its first track
+
+        Optional keyword parameters:
+            | start - how far into the first track to start, in seconds (default is 0.0 meaning start at the beginning)
+
+        """
+        firstIndex = self._getNextIndex(-1) if self.tracksList else None
+        if firstIndex is not None:
+            self.playTrack(firstIndex, start)
+
+    def next(self):
+        """Moves on to the next track"""
+        fromIndex = self.currentIndex if self.pendingIndex is None else self.pendingIndex
+        nextIndex = self._getNextIndex(-1 if fromIndex is None else fromIndex)
+        if nextIndex is None:
+            self.stop()
+        else:
+            self.playTrack(nextIndex)
+
+    def previous(self):
+        """Moves back to the previous track"""
+        fromIndex = self.currentIndex if self.pendingIndex is None else self.pendingIndex
+        previousIndex = None
+        with self._lock:
+            nTracks = len(self.tracksList)
+            for offset in range(1, nTracks + 1):
+                index = ((0 if fromIndex is None else fromIndex) - offset) % nTracks
+                if self.tracksList[index][2] is not False:
+                    previousIndex = index
+                    break
+        if previousIndex is not None:
+            self.playTrack(previousIndex)
+
+    def pause(self):
+        """If music is playing, pause the music"""
+        if self.musicPlaying and (self.pendingIndex is None):
+            pygame.mixer.music.pause()
+            self.musicPaused = True
+
+    def unPause(self):
+        """If music is playing, but is paused, unpause the music to let it play again"""
+        if self.musicPlaying and self.musicPaused:
+            pygame.mixer.music.unpause()
+            self.musicPaused = False
+
+    def stop(self, fadeMs=None):
+        """Stops the music
+
+        Optional keyword parameters:
+            | fadeMs - number of milliseconds to fade out (default None, meaning the fadeMs of the playlist)
+
+        """
+        if fadeMs is None:
+            fadeMs = self.fadeMs
+        self._stopMusic(fadeMs)
+        with self._lock:
+            self.pendingIndex = None
+            self.currentIndex = None
+        self.musicPlaying = False
+        self.musicPaused = False
+        self._discardData()
+
+    def handleEvent(self, event):
+        """Call this method with every event, so the playlist knows when a track ends.
+
+        Parameters:
+            | event - the event to be handled
+
+        Returns:
+            |    True if the event started the next track, otherwise False
+
+        """
+        if event.type != PYGWIDGETS_MUSIC_END_EVENT:
+            return False
+        if self.nStaleEndEvents > 0:  # a faded out track has ended
+            self.nStaleEndEvents = self.nStaleEndEvents - 1
+            return False
+        if (not self.musicPlaying) or (self.pendingIndex is not None):
+            return False  # end of music that was stopped
+        if self.queuedIndex is None:  # no more tracks
+            self.musicPlaying = False
+            with self._lock:
+                self.currentIndex = None
+            return False
+        with self._lock:
+            self.currentIndex = self.queuedIndex  # pygame has already started the queued track
+            self.queuedIndex = None
+        self._discardData()
+        self.update()
+        return True
+
+    def update(self):
+        """Call this method once per frame.  Starts a track once its file has been read, and queues the next track."""
+        if not self.musicPlaying:
+            return
+        if self.pendingIndex is not None:
+            if pygame.mixer.music.get_busy():
+                return  # still fading out
+            with self._lock:
+                isReady = self.pendingIndex in self.dataDict
+                isValid = self.tracksList[self.pendingIndex][2]
+                isLoading = self.pendingIndex in self.loadingSet
+            if isReady:
+                index = self.pendingIndex
+                with self._lock:
+                    self.pendingIndex = None
+                self._startTrack(index, self.pendingStart, self.pendingFadeMs)
+            elif (isValid is False) and (not isLoading):
+                with self._lock:
+                    self.pendingIndex = self._getNextIndex(self.pendingIndex)  # file could not be read, skip it
+                    self.pendingStart = 0.0
+                if self.pendingIndex is None:
+                    self.musicPlaying = False
+                else:
+                    self._prefetchTrack(self.pendingIndex)
+            return
+
+        if (self.queuedIndex is not None) or (self.currentIndex is None):
+            return
+        nextIndex = self._getNextIndex(self.currentIndex)
+        if nextIndex is None:
+            return
+        with self._lock:
+            isReady = nextIndex in self.dataDict
+        if isReady:
+            oFile, nameHint = self._getTrackFile(nextIndex)
+            pygame.mixer.music.queue(oFile, nameHint)
+            self.queuedIndex = nextIndex
+        else:
+            self._prefetchTrack(nextIndex)
+
+    def getCurrentIndex(self):
+        """Returns the index of the track that is playing (or None)"""
+        return self.currentIndex
+
+    def getCurrentPath(self):
+        """Returns the relative path of the track that is playing (or None)"""
+        if self.currentIndex is None:
+            return None
+        return self.tracksList[self.currentIndex][0]
+
+    def getInvalidPaths(self):
+        """Returns a list of the paths of files that could not be found (once they have been checked)"""
+        with self._lock:
+            return [relativePath for relativePath, fullPath, isValid in self.tracksList if isValid is False]
+
+    def getPlaying(self):
+        """Returns True if the music is playing, or False if it is not"""
+        return self.musicPlaying
+
+
+class SoundManager():
+    """SoundManager - plays sound effects on a limited pool of channels, so that many sounds at once stay clean.
+
+    Without a SoundManager, every sound plays on any free channel of the mixer.  When many sounds
+    start at the same time, pygame drops sounds or cuts off others, and rapid repeated clicks
+    stack many copies of the same sound.  A SoundManager:
+        - reserves a pool of channels for its sounds
+        - limits how many copies of the same sound can play at once (the oldest copy is restarted)
+        - ignores a sound if it is started again too soon (within minInterval seconds)
+        - when all channels are busy, stops the lowest priority sound to play a new sound
+          of the same or higher priority (otherwise the new sound is not played)
+
+    Typical use:
+
+        | oSoundManager = pygwidgets.SoundManager(nChannels=12)
+        | pygwidgets.setSoundManager(oSoundManager)  # all SoundEffects and click sounds of widgets use it
+        | explosionSound = pygwidgets.SoundEffect('sounds/explosion.wav', priority=10)
+        | coinSound = pygwidgets.SoundEffect('sounds/coin.wav', maxInstances=2)
+
+    You can also play any pygame.mixer.Sound (or SoundEffect) directly:
+
+        | oSoundManager.play(coinSound, priority=1)
+
+    Optional keyword parameters:
+        | nChannels - number of channels reserved for sounds played by the manager (default 16)
+        | maxInstances - default for the most copies of one sound that can play at once (default 4)
+        | minInterval - default for the shortest time (in seconds) between starts of one sound (default .03)
+        | clock - a function that returns the current time in seconds (defaults to time.monotonic)
+
+    """
+    DEFAULT_N_CHANNELS = 16
+    N_EXTRA_CHANNELS = 8  # channels left for sounds that are not played through the manager
+
+    def __init__(self, nChannels=DEFAULT_N_CHANNELS, maxInstances=4, minInterval=.03, clock=time.monotonic):
+        _initMixer()
+        if pygame.mixer.get_num_channels() < (nChannels + SoundManager.N_EXTRA_CHANNELS):
+            pygame.mixer.set_num_channels(nChannels + SoundManager.N_EXTRA_CHANNELS)
+        pygame.mixer.set_reserved(nChannels)  # Sound.play() will not pick these channels
+        self.channelsList = [pygame.mixer.Channel(channelNumber) for channelNumber in range(nChannels)]
+        self.channelInfoList = [None] * nChannels  # for each channel: (sound, priority, start time) or None
+        self.maxInstances = maxInstances
+        self.minInterval = minInterval
+        self.clock = clock
+        self.lastStartDict = {}  # sound -> time it was last started
+        self.nPlayed = 0
+        self.nRateLimited = 0
+        self.nDropped = 0
+        self.nStolen = 0
+
+    def play(self, oSound, priority=0, loops=0, maxInstances=None, minInterval=None):
+        """Plays a sound on one of the manager's channels.
+
+        Parameters:
+            | oSound - a pygame.mixer.Sound or a SoundEffect
+
+        Optional keyword parameters:
+            | priority - a higher priority sound can take over the channel of a lower priority sound (default 0)
+            | loops - number of extra times to play the sound (default 0), -1 means repeat forever
+            | maxInstances - the most copies of this sound that can play at once (default None, meaning the manager's value)
+            | minInterval - the shortest time between starts of this sound (default None, meaning the manager's value)
+
+        Returns:
+            | the pygame Channel the sound is playing on, or None if the sound was not played
+
+        """
+        if isinstance(oSound, SoundEffect):
+            oSound = oSound.oSound
+        if maxInstances is None:
+            maxInstances = self.maxInstances
+        if minInterval is None:
+            minInterval = self.minInterval
+
+        now = self.clock()
+        lastStart = self.lastStartDict.get(oSound)
+        if (lastStart is not None) and ((now - lastStart) < minInterval):
+            self.nRateLimited = self.nRateLimited + 1
+            return None  # started again too soon
+
+        # Find the copies of this sound that are playing, a free channel, and the channel to steal
+        freeIndex = None
+        nInstances = 0
+        oldestInstanceIndex = None
+        stealIndex = None
+        for index, channelInfo in enumerate(self.channelInfoList):
+            if (channelInfo is None) or (not self.channelsList[index].get_busy()):
+                self.channelInfoList[index] = None
+                if freeIndex is None:
+                    freeIndex = index
+                continue
+            playingSound, playingPriority, playingStart = channelInfo
+            if playingSound is oSound:
+                nInstances = nInstances + 1
+                if (oldestInstanceIndex is None) or (playingStart < self.channelInfoList[oldestInstanceIndex][2]):
+                    oldestInstanceIndex = index
+            if playingPriority <= priority:  # lowest priority, then oldest, is stolen first
+                if (stealIndex is None) or \
+                        ((playingPriority, playingStart) < self.channelInfoList[stealIndex][1:]):
+                    stealIndex = index
+
+        if nInstances >= maxInstances:
+            index = oldestInstanceIndex  # restart the oldest copy of this sound
+            self.nStolen = self.nStolen + 1
+        elif freeIndex is not None:
+            index = freeIndex
+        elif stealIndex is not None:
+            index = stealIndex
+            self.nStolen = self.nStolen + 1
+        else:
+            self.nDropped = self.nDropped + 1
+            return None  # all channels play sounds of higher priority
+
+        oChannel = self.channelsList[index]
+        oChannel.play(oSound, loops)
+        self.channelInfoList[index] = (oSound, priority, now)
+        self.lastStartDict[oSound] = now
+        self.nPlayed = self.nPlayed + 1
+        return oChannel
+
+    def stopAll(self):
+        """Stops all sounds playing on the manager's channels."""
+        for oChannel in self.channelsList:
+            oChannel.stop()
+        self.channelInfoList = [None] * len(self.channelsList)
+
+    def getNChannelsBusy(self):
+        """Returns the number of the manager's channels that are playing a sound."""
+        return sum(1 for oChannel in self.channelsList if oChannel.get_busy())
+
+    def getStats(self):
+        """Returns a dictionary of statistics: played, rateLimited, dropped, stolen, and nChannels."""
+        return {'played': self.nPlayed, 'rateLimited': self.nRateLimited, 'dropped': self.nDropped,
+                'stolen': self.nStolen, 'nChannels': len(self.channelsList)}
+
+
+#
+#
+# EVENT ROUTER
+#
+#
+class EventRouter():
+    """EventRouter - sends each event only to the widgets that could be interested in it.
+
+    With a small number of widgets, calling the handleEvent method of every widget is fine.
+    But with hundreds or thousands of widgets, every mouse motion results in a call to
+    every widget.  An EventRouter keeps the rects of its widgets in a grid of cells,
+    so it can quickly find the widgets that are under the mouse.
+
+        - Mouse events are sent to the widgets under the mouse, to widgets that the mouse
+          just left, and to widgets that were clicked down on (until the mouse button comes up).
+        - All other events (e.g., keyboard events) are only sent to widgets added as key listeners.
+          Key listeners also get every mouse down event, so that they can give up focus
+          when the user clicks somewhere else.
+
+    Moving a widget (setLoc, moveX, moveY, moveXY) automatically updates the router.
+
+    Typical use:
+
+    1) Create an EventRouter and add widgets to it:
+
+        | oRouter = pygwidgets.EventRouter()
+        | oRouter.add([oButton1, oButton2, oCheckBox])
+        | oRouter.add(oInputText, keyListener=True)
+
+    2) In your event loop, pass every event to the router:
+
+        | for oWidget in oRouter.handleEvent(event):
+        |     # oWidget returned True from its handleEvent method, do whatever you want here
+
+    Optional keyword parameters:
+        | cellSize - the width and height (in pixels) of each cell in the grid (default is 64)
+
+    """
+    DEFAULT_CELL_SIZE = 64
+
+    def __init__(self, cellSize=DEFAULT_CELL_SIZE):
+        self.cellSize = cellSize
+        self.cellsDict = {}  # (col, row) -> dict of widgets in that cell (dict is used as an ordered set)
+        self.widgetCellsDict = {}  # widget -> tuple of (col, row) cells the widget currently covers
+        self.orderDict = {}  # widget -> number, used to send events in the order that widgets were added
+        self.keyListenersDict = {}  # widgets that get all non-mouse events (dict used as an ordered set)
+        self.hoveredList = []  # widgets under the mouse since the last mouse motion event
+        self.capturedList = []  # widgets that got a mouse down, they get all mouse events until mouse up
+        self.nextOrder = 0
+
+    def add(self, oWidgetOrList, keyListener=None):
+        """Adds a widget (or a list of widgets) to the router.
+
+        Parameters:
+            | oWidgetOrList - a widget, or a list of widgets
+
+        Optional keyword parameters:
+            | keyListener - should the widget(s) get keyboard (and other non-mouse) events
+            |       (default is None, meaning: True for InputText fields and buttons with activation keys)
+
+        """
+        if not isinstance(oWidgetOrList, (list, tuple)):
+            oWidgetOrList = [oWidgetOrList]
+        for oWidget in oWidgetOrList:
+            if oWidget in self.orderDict:
+                continue  # already added
+            self.orderDict[oWidget] = self.nextOrder
+            self.nextOrder = self.nextOrder + 1
+            thisKeyListener = keyListener
+            if thisKeyListener is None:
+                thisKeyListener = isinstance(oWidget, InputText) or \
+                                  (getattr(oWidget, 'activationKeysList', None) is not None)
+            if thisKeyListener:
+                self.keyListenersDict[oWidget] = None
+            self.widgetCellsDict[oWidget] = ()
+            oWidget.oEventRouter = self
+            self.updateWidget(oWidget)
+
+    def remove(self, oWidget):
+        """Removes a widget from the router.
+
+        Raises:
+            | KeyError if the widget was not added to this router
+
+        """
+        if oWidget not in self.orderDict:
+            raise KeyError('EventRouter: Attempt to remove a widget that was not added')
+        for cell in self.widgetCellsDict.pop(oWidget):
+            self._removeFromCell(oWidget, cell)
+        del self.orderDict[oWidget]
+        self.keyListenersDict.pop(oWidget, None)
+        if oWidget in self.hoveredList:
+            self.hoveredList.remove(oWidget)
+        if oWidget in self.capturedList:
+            self.capturedList.remove(oWidget)
+        oWidget.oEventRouter = None
+
+    def removeAll(self):
+        """Removes all widgets from the router (for example, when leaving a scene)."""
+        for oWidget in list(self.orderDict):
+            self.remove(oWidget)
+
+    def updateWidget(self, oWidget):
+        """Updates the position of a widget in the grid.
+
+        This is called automatically when a widget is moved using setLoc, moveX, moveY, or moveXY.
+        You only need to call it if you change the rect of a widget in some other way.
+
+        """
+        newCells = self._getCells(oWidget.getRect())
+        oldCells = self.widgetCellsDict[oWidget]
+        if newCells == oldCells:
+            return  # typical case, e.g., moved within the same cells
+        for cell in oldCells:
+            self._removeFromCell(oWidget, cell)
+        for cell in newCells:
+            if cell in self.cellsDict:
+                self.cellsDict[cell][oWidget] = None
+            else:
+                self.cellsDict[cell] = {oWidget: None}
+        self.widgetCellsDict[oWidget] = newCells
+
+    def getWidgetsAt(self, loc):
+        """Returns a list of the widgets whose rects contain a location (in the order they were added)."""
+        cell = (loc[0] // self.cellSize, loc[1] // self.cellSize)
+        candidates = self.cellsDict.get(cell)
+        if candidates is None:
+            return []
+        hitList = [oWidget for oWidget in candidates if oWidget.getRect().collidepoint(loc)]
+        if len(hitList) > 1:
+            hitList.sort(key=self.orderDict.__getitem__)
+        return hitList
+
+    def handleEvent(self, eventObj):
+        """This method should be called every time through the event loop (inside the main loop).
+
+        It calls the handleEvent method of only the widgets that could be interested in this event.
+
+        Parameters:
+            | eventObj - the event object obtained by calling pygame.event.get()
+
+        Returns:
+            | a list of the widgets whose handleEvent method returned True (typically an empty list)
+
+        """
+        if eventObj.type in PYGWIDGETS_MOUSE_EVENTS_DICT:
+            hitList = self.getWidgetsAt(eventObj.pos)
+            targetsDict = dict.fromkeys(self.capturedList)
+            targetsDict.update(dict.fromkeys(self.hoveredList))  # so widgets can see the mouse leave
+            targetsDict.update(dict.fromkeys(hitList))
+            if eventObj.type == MOUSEBUTTONDOWN:
+                targetsDict.update(self.keyListenersDict)
+                for oWidget in hitList:
+                    if oWidget not in self.capturedList:
+                        self.capturedList.append(oWidget)
+            elif eventObj.type == MOUSEBUTTONUP:
+                self.capturedList = []
+            if eventObj.type == MOUSEMOTION:
+                self.hoveredList = hitList
+            else:
+                # A button event can come at a new location without a motion event first.
+                # Widgets that were under the mouse must still get the next motion, to see the mouse leave
+                for oWidget in hitList:
+                    if oWidget not in self.hoveredList:
+                        self.hoveredList.append(oWidget)
+            targetsList = sorted(targetsDict, key=self.orderDict.__getitem__)
+
+        else:  # keyboard or other events only go to key listeners
+            targetsList = list(self.keyListenersDict)
+
+        triggeredList = []
+        for oWidget in targetsList:
+            if oWidget.handleEvent(eventObj):
+                triggeredList.append(oWidget)
+        return triggeredList
+
+    def _getCells(self, rect):
+        # Internal method, returns a tuple of all the (col, row) cells that a rect covers
+        if (rect.width <= 0) or (rect.height <= 0):
+            return ()
+        firstCol = rect.left // self.cellSize
+        lastCol = (rect.right - 1) // self.cellSize
+        firstRow = rect.top // self.cellSize
+        lastRow = (rect.bottom - 1) // self.cellSize
+        return tuple((col, row) for col in range(firstCol, lastCol + 1)
+                                for row in range(firstRow, lastRow + 1))
+
+    def _removeFromCell(self, oWidget, cell):
+        # Internal method, removes a widget from a cell (and removes the cell if it is now empty)
+        widgetsInCell = self.cellsDict[cell]
+        del widgetsInCell[oWidget]
+        if not widgetsInCell:
+            del self.cellsDict[cell]
+
+
+#
+#
+# WIDGET GROUP
+#
+#
+class WidgetGroup():
+    """WidgetGroup - draws a group of widgets, redrawing only the parts of the window that changed.
+
+    Every widget keeps track of whether it has changed since it was last drawn (it is "dirty").
+    For example, a button becomes dirty when the mouse rolls over it, and a DisplayText
+    becomes dirty when its value changes.  Calling drawDirty() erases the old and new areas
+    of every dirty widget using a cached background, redraws all widgets in those areas,
+    and returns the list of rects that changed.  Passing that list to pygame.display.update()
+    means that only the changed parts of the window are sent to the screen.
+
+    Typical use:
+
+    1) Create a WidgetGroup (after drawing your background), and add widgets to it:
+
+        | oGroup = pygwidgets.WidgetGroup(window, 'images/background.jpg')
+        | oGroup.add([oButton, oCheckBox, oDisplayText])
+
+    2) At the bottom of your big loop, instead of drawing each widget and updating the whole window:
+
+        | rectsList = oGroup.drawDirty()
+        | pygame.display.update(rectsList)
+
+    Alternatively, if you want to redraw the whole window every frame, you can call:
+
+        | oGroup.draw()
+
+    Widgets are drawn in the order in which they were added.
+
+    With batchBlits=True, the group asks each widget what it would draw (getBlitInfo), and draws
+    them all with a single call to window.blits().  This only saves the Python cost of calling each
+    widget's draw method, not the cost of copying pixels.  Measured with 500 mixed widgets it was
+    0.87x - 1.2x as fast as calling draw, and with 2000 tiny images usually 1.05x - 1.25x as fast.
+    So it is off by default (see pygwidgets_test/Benchmark_WidgetGroup.py to measure your own widgets).
+
+    Parameters:
+        | window - the window to draw into
+
+    Optional keyword parameters:
+        | background - what to show behind the widgets, can be:
+        |       a path to an image file, an already loaded image, an rgb color, or
+        |       None (default) to use a copy of whatever is in the window when the group is created
+        | batchBlits - draw widgets with window.blits() instead of calling their draw methods
+        |       (default False)
+
+    """
+    def __init__(self, window, background=None, batchBlits=False):
+        self.window = window
+        self.batchBlits = batchBlits
+        self.widgetsList = []
+        self.lastRectsDict = {}  # widget -> rect where it was last drawn (None if not drawn)
+        self.pendingRectsList = []  # areas that must be redrawn, e.g., where a removed widget was
+        self.redrawEverything = True
+        self.setBackground(background)
+
+    def setBackground(self, background):
+        """Sets what should be drawn behind the widgets, and forces the whole window to be redrawn.
+
+        Parameter:
+            | background - a path to an image file, an already loaded image, an rgb color,
+            |       or None to use a copy of whatever is currently in the window
+
+        """
+        if background is None:
+            self.backgroundImage = self.window.copy()
+        else:
+            self.backgroundImage = pygame.Surface(self.window.get_size())
+            if isinstance(background, str):
+                background = _loadImageAndConvert(background)
+            if isinstance(background, pygame.Surface):
+                self.backgroundImage.blit(background, (0, 0))
+            else:  # must be a color
+                self.backgroundImage.fill(background)
+            self.backgroundImage = self.backgroundImage.convert()  # optimizes blitting
+        self.redrawEverything = True
+
+    def add(self, oWidgetOrList):
+        """Adds a widget (or a list of widgets) to the group."""
+        if not isinstance(oWidgetOrList, (list, tuple)):
+            oWidgetOrList = [oWidgetOrList]
+        for oWidget in oWidgetOrList:
+            if oWidget in self.lastRectsDict:
+                continue  # already in the group
+            self.widgetsList.append(oWidget)
+            self.lastRectsDict[oWidget] = None
+            oWidget.setDirty(True)
+
+    def remove(self, oWidget):
+        """Removes a widget from the group (the area where it was drawn will be erased).
+
+        Raises:
+            | ValueError if the widget is not in the group
+
+        """
+        if oWidget not in self.lastRectsDict:
+            raise ValueError('WidgetGroup: Attempt to remove a widget that is not in the group')
+        self.widgetsList.remove(oWidget)
+        lastRect = self.lastRectsDict.pop(oWidget)
+        if lastRect is not None:
+            self.pendingRectsList.append(lastRect)
+
+    def removeAll(self):
+        """Removes all widgets from the group (for example, when leaving a scene)."""
+        self.widgetsList = []
+        self.lastRectsDict = {}
+        self.redrawEverything = True
+
+    def getWidgets(self):
+        """Returns the list of widgets in the group."""
+        return self.widgetsList
+
+    def redrawAll(self):
+        """Forces the next call to drawDirty to redraw the whole window."""
+        self.redrawEverything = True
+
+    def draw(self):
+        """Draws all visible widgets in the group (does not draw the background).
+
+        Should be called every time through the main loop (instead of drawing every widget).
+
+        """
+        self._drawWidgets(self.widgetsList)
+
+    def drawDirty(self):
+        """Redraws only the areas of the window that have changed.
+
+        Should be called every time through the main loop (instead of drawing every widget).
+
+        Returns:
+            | a list of rects that were redrawn, intended to be passed to pygame.display.update()
+
+        """
+        dirtyRectsList = self.pendingRectsList
+        self.pendingRectsList = []
+
+        # Collect the old and the new areas of every widget that has changed
+        for oWidget in self.widgetsList:
+            if not (oWidget.getDirty() or self.redrawEverything):
+                continue
+            oldRect = self.lastRectsDict[oWidget]
+            if oldRect is not None:
+                dirtyRectsList.append(oldRect)
+            if oWidget.getVisible():
+                newRect = pygame.Rect(oWidget._getDrawRect())  # make a copy
+                dirtyRectsList.append(newRect)
+            else:
+                newRect = None
+            self.lastRectsDict[oWidget] = newRect
+            oWidget.setDirty(False)
+
+        if self.redrawEverything:
+            self.redrawEverything = False
+            dirtyRectsList = [self.window.get_rect()]
+
+        dirtyRectsList = self._mergeRects(dirtyRectsList)
+
+        # Erase each dirty area, then redraw (in order) all widgets that overlap it.
+        # Clipping makes sure that widgets only draw inside the dirty area.
+        previousClip = self.window.get_clip()
+        for dirtyRect in dirtyRectsList:
+            self.window.set_clip(dirtyRect)
+            self.window.blit(self.backgroundImage, dirtyRect, dirtyRect)
+            overlappingList = []
+            for oWidget in self.widgetsList:
+                lastRect = self.lastRectsDict[oWidget]
+                if (lastRect is not None) and lastRect.colliderect(dirtyRect):
+                    overlappingList.append(oWidget)
+            self._drawWidgets(overlappingList)
+        self.window.set_clip(previousClip)
+
+        return dirtyRectsList
+
+    def _drawWidgets(self, oWidgetsList):
+        # Internal method, draws widgets in order.  With batchBlits, all blits are batched into as few
+        # blits() calls as possible, and widgets that cannot give a single (surface, location) pair
+        # are drawn by calling their draw method.
+        if not self.batchBlits:
+            for oWidget in oWidgetsList:
+                oWidget.draw()
+            return
+
+        blitsList = []
+        for oWidget in oWidgetsList:
+            if not oWidget.getVisible():
+                continue
+            blitInfo = oWidget.getBlitInfo()
+            if blitInfo is None:  # this widget draws itself
+                if blitsList:  # first draw everything that is below it
+                    self.window.blits(blitsList, doreturn=False)
+                    blitsList = []
+                oWidget.draw()
+            else:
+                blitsList.append(blitInfo)
+        if blitsList:
+            self.window.blits(blitsList, doreturn=False)
+
+    def _mergeRects(self, rectsList):
+        # Internal method, clips rects to the window, and combines any that overlap
+        windowRect = self.window.get_rect()
+        mergedList = []
+        for rect in rectsList:
+            rect = rect.clip(windowRect)
+            if (rect.width == 0) or (rect.height == 0):
+                continue
+            index = rect.collidelist(mergedList)
+            while index != -1:
+                rect.union_ip(mergedList.pop(index))
+                index = rect.collidelist(mergedList)
+            mergedList.append(rect)
+        return mergedList
+
+
+#
+#
+# WIDGET PROFILER
+#
+#
+
+# The WidgetProfiler or FrameTracer whose methods have replaced methods of the widget classes (or None).
+# Only one can be enabled at a time, so that each can put back the original methods.
+_PYGWIDGETS_ENABLED_INSTRUMENT = None
+
+def _getWidgetClasses():
+    # Internal function, returns PygWidget and all of its subclasses (including subclasses made by the program)
+    classesList = [PygWidget]
+    index = 0
+    while index < len(classesList):
+        for oSubclass in classesList[index].__subclasses__():
+            if oSubclass not in classesList:
+                classesList.append(oSubclass)
+        index = index + 1
+    return classesList
+
+def _enableInstrument(oInstrument):
+    # Internal function, records that a WidgetProfiler or FrameTracer is replacing methods
+    global _PYGWIDGETS_ENABLED_INSTRUMENT
+    if _PYGWIDGETS_ENABLED_INSTRUMENT is not None:
+        raise ValueError('A ' + type(_PYGWIDGETS_ENABLED_INSTRUMENT).__name__ +
+                         ' is already enabled, disable it first')
+    _PYGWIDGETS_ENABLED_INSTRUMENT = oInstrument
+
+def _disableInstrument():
+    # Internal function, records that the original methods have been put back
+    global _PYGWIDGETS_ENABLED_INSTRUMENT
+    _PYGWIDGETS_ENABLED_INSTRUMENT = None
+
+class WidgetProfiler():
+    """WidgetProfiler - finds out which widgets take the most time to draw and handle events.
+
+    While a WidgetProfiler is enabled, it times every call to the draw, handleEvent, render,
+    _updateImage, and _transmogrophy methods of every widget (and the draw, drawDirty, and
+    handleEvent methods of WidgetGroups and EventRouters).  For each widget, it records the number
+    of calls, and the total and longest time of each method.  It also counts how many times each
+    widget is blitted into the window, and the number of pixels blitted.  Blits are counted once for
+    each draw of a visible widget (or each time a WidgetGroup blits it), using the area that the
+    widget draws into.  Extra drawing, like the cursor of an InputText, is not counted.
+
+    The profiler works by replacing these methods in the widget classes while it is enabled, and
+    putting the original methods back when it is disabled.  So when no profiler is enabled, there is
+    no cost at all.  Only one WidgetProfiler (or FrameTracer) can be enabled at a time.
+
+    Typical use:
+
+        | oProfiler = pygwidgets.WidgetProfiler()
+        | with oProfiler:  # enables the profiler, disables it at the end
+        |     for frameNumber in range(300):
+        |         ...  # your normal event loop, drawing, etc.
+        |         oProfiler.markFrame()  # optional, at the end of each frame
+        | oProfiler.printReport()
+        | snapshot = oProfiler.getSnapshot()
+
+    Widgets are identified by their class name and nickname, so giving nicknames to the widgets
+    you care about makes the report easier to read.  Widgets without a nickname are shown by id.
+    The profiler does not keep widgets alive.  When a widget is deleted, its times and counts are
+    only kept in the totals for its class.
+
+    """
+    PROFILED_METHOD_NAMES = ('draw', 'drawDirty', 'handleEvent', 'render', '_updateImage', '_transmogrophy')
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.enabled = False
+        self.originalMethodsList = []  # (class, method name, original function)
+        self.reset()
+
+    def reset(self):
+        """Throws away all of the times and counts recorded so far."""
+        self.widgetStatsDict = {}  # id of widget -> statistics of the widget (see _getWidgetStats)
+        self.deletedClassesDict = {}  # class name -> totals of deleted widgets of the class (see _forgetWidget)
+        self.activeSet = set()  # (id of widget, method name) of calls in progress
+        self.nFrames = 0
+        self.frameSeconds = 0.0  # time in profiled calls since the last markFrame
+        self.maxFrameSeconds = 0.0
+
+    def enable(self):
+        """Starts profiling, by replacing the methods of the widget classes with timed versions.
+
+        Raises:
+            | ValueError if a different WidgetProfiler (or a FrameTracer) is already enabled
+
+        """
+        if self.enabled:
+            return
+        _enableInstrument(self)
+        for oClass in _getWidgetClasses() + [WidgetGroup, EventRouter]:
+            for methodName in WidgetProfiler.PROFILED_METHOD_NAMES:
+                function = oClass.__dict__.get(methodName)
+                if function is not None:
+                    self.originalMethodsList.append((oClass, methodName, function))
+                    setattr(oClass, methodName, self._makeTimedMethod(function, methodName))
+            function = oClass.__dict__.get('getBlitInfo')
+            if (function is not None) and issubclass(oClass, PygWidget):
+                self.originalMethodsList.append((oClass, 'getBlitInfo', function))
+                setattr(oClass, 'getBlitInfo', self._makeCountedGetBlitInfo(function))
+        self.enabled = True
+
+    def disable(self):
+        """Stops profiling, and puts back the original methods of the widget classes.  Recorded times are kept."""
+        if not self.enabled:
+            return
+        for oClass, methodName, function in reversed(self.originalMethodsList):
+            setattr(oClass, methodName, function)
+        self.originalMethodsList = []
+        self.activeSet = set()
+        _disableInstrument()
+        self.enabled = False
+
+    def getEnabled(self):
+        """Returns True if the profiler is enabled"""
+        return self.enabled
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.disable()
+        return False
+
+    def markFrame(self):
+        """Call at the end of each frame, to count frames and find the frame with the most time in widgets."""
+        self.nFrames = self.nFrames + 1
+        if self.frameSeconds > self.maxFrameSeconds:
+            self.maxFrameSeconds = self.frameSeconds
+        self.frameSeconds = 0.0
+
+    def _getWidgetStats(self, oWidget):
+        # Internal method, returns the dictionary of statistics of a widget, creating it the first time
+        widgetId = id(oWidget)
+        widgetStats = self.widgetStatsDict.get(widgetId)
+        if (widgetStats is None) or (widgetStats['widgetRef']() is not oWidget):
+            # The weak reference does not keep the widget alive, and tells us when it is deleted
+            widgetRef = weakref.ref(oWidget, lambda deadRef: self._forgetWidget(widgetId, deadRef))
+            widgetStats = {'className': type(oWidget).__name__,
+                           'nickname': getattr(oWidget, 'nickname', None),
+                           'widgetId': widgetId,
+                           'widgetRef': widgetRef,
+                           'methods': {},  # method name -> [number of calls, total seconds, max seconds]
+                           'nBlits': 0,
+                           'blitArea': 0}
+            self.widgetStatsDict[widgetId] = widgetStats
+        return widgetStats
+
+    def _forgetWidget(self, widgetId, widgetRef):
+        # Internal method, called when a profiled widget is deleted.  Adds its statistics to the
+        # totals of deleted widgets of its class, so its id can be reused by a new widget
+        widgetStats = self.widgetStatsDict.get(widgetId)
+        if (widgetStats is None) or (widgetStats['widgetRef'] is not widgetRef):
+            return  # already forgotten (after reset)
+        del self.widgetStatsDict[widgetId]
+        nCalls, seconds, maxSeconds = WidgetProfiler._sumMethods(widgetStats)
+        classTotals = self.deletedClassesDict.setdefault(widgetStats['className'],
+                                                         {'nWidgets': 0, 'calls': 0, 'seconds': 0.0,
+                                                          'maxSeconds': 0.0, 'nBlits': 0, 'blitArea': 0})
+        classTotals['nWidgets'] = classTotals['nWidgets'] + 1
+        classTotals['calls'] = classTotals['calls'] + nCalls
+        classTotals['seconds'] = classTotals['seconds'] + seconds
+        classTotals['maxSeconds'] = max(classTotals['maxSeconds'], maxSeconds)
+        classTotals['nBlits'] = classTotals['nBlits'] + widgetStats['nBlits']
+        classTotals['blitArea'] = classTotals['blitArea'] + widgetStats['blitArea']
+
+    @staticmethod
+    def _sumMethods(widgetStats):
+        # Internal method, returns the total calls, total seconds, and max seconds of all methods of a widget
+        nCalls = 0
+        seconds = 0.0
+        maxSeconds = 0.0
+        for nMethodCalls, methodSeconds, methodMaxSeconds in widgetStats['methods'].values():
+            nCalls = nCalls + nMethodCalls
+            seconds = seconds + methodSeconds
+            maxSeconds = max(maxSeconds, methodMaxSeconds)
+        return nCalls, seconds, maxSeconds
+
+    def _countBlit(self, oWidget, widgetStats):
+        # Internal method, counts one blit of a widget, and the area it covers
+        drawRect = oWidget._getDrawRect()
+        widgetStats['nBlits'] = widgetStats['nBlits'] + 1
+        widgetStats['blitArea'] = widgetStats['blitArea'] + (drawRect.width * drawRect.height)
+
+    def _makeTimedMethod(self, function, methodName):
+        # Internal method, builds a method that times calls to the original method
+        oProfiler = self
+        clock = self.clock
+
+        def timedMethod(oWidget, *args, **kwargs):
+            activeKey = (id(oWidget), methodName)
+            if activeKey in oProfiler.activeSet:  # called through super(), timed by the outer call
+                return function(oWidget, *args, **kwargs)
+            oProfiler.activeSet.add(activeKey)
+            startTime = clock()
+            try:
+                return function(oWidget, *args, **kwargs)
+            finally:
+                seconds = clock() - startTime
+                oProfiler.activeSet.discard(activeKey)
+                widgetStats = oProfiler._getWidgetStats(oWidget)
+                methodStats = widgetStats['methods'].get(methodName)
+                if methodStats is None:
+                    widgetStats['methods'][methodName] = [1, seconds, seconds]
+                else:
+                    methodStats[0] = methodStats[0] + 1
+                    methodStats[1] = methodStats[1] + seconds
+                    if seconds > methodStats[2]:
+                        methodStats[2] = seconds
+                if (methodName == 'draw') and isinstance(oWidget, PygWidget) and getattr(oWidget, 'visible', True):
+                    oProfiler._countBlit(oWidget, widgetStats)
+                if len(oProfiler.activeSet) == 0:  # only count the outermost call in the frame time
+                    oProfiler.frameSeconds = oProfiler.frameSeconds + seconds
+
+        timedMethod.__name__ = function.__name__
+        timedMethod.__doc__ = function.__doc__
+        timedMethod.__wrapped__ = function
+        return timedMethod
+
+    def _makeCountedGetBlitInfo(self, function):
+        # Internal method, builds a getBlitInfo method that counts blits made by a WidgetGroup
+        oProfiler = self
+
+        def countedGetBlitInfo(oWidget):
+            blitInfo = function(oWidget)
+            if (blitInfo is not None) and ((id(oWidget), 'draw') not in oProfiler.activeSet):
+                oProfiler._countBlit(oWidget, oProfiler._getWidgetStats(oWidget))
+            return blitInfo
+
+        countedGetBlitInfo.__name__ = function.__name__
+        countedGetBlitInfo.__doc__ = function.__doc__
+        countedGetBlitInfo.__wrapped__ = function
+        return countedGetBlitInfo
+
+    def getSnapshot(self):
+        """Returns a copy of everything recorded so far (times are in milliseconds).
+
+        Returns:
+            | a dictionary with these keys:
+            |     'nFrames' - number of calls to markFrame
+            |     'maxFrameMs' - the most time spent in widgets in any one frame (needs markFrame)
+            |     'widgets' - a list of dictionaries, one per widget, slowest first, each with the keys:
+            |         'className', 'nickname', 'widgetId', 'totalMs', 'nBlits', 'blitArea', and
+            |         'methods' - a dictionary of method name to {'calls', 'totalMs', 'maxMs'}
+            |     'classes' - a dictionary of class name to {'nWidgets', 'calls', 'totalMs', 'maxMs', 'nBlits', 'blitArea'}
+            |         (these totals include widgets that have been deleted)
+
+        """
+        widgetsList = []
+        classesDict = {}
+        for className, classTotals in list(self.deletedClassesDict.items()):
+            classesDict[className] = {'nWidgets': classTotals['nWidgets'], 'calls': classTotals['calls'],
+                                      'totalMs': classTotals['seconds'] * 1000,
+                                      'maxMs': classTotals['maxSeconds'] * 1000,
+                                      'nBlits': classTotals['nBlits'], 'blitArea': classTotals['blitArea']}
+
+        for widgetStats in list(self.widgetStatsDict.values()):
+            methodsDict = {}
+            for methodName, (nMethodCalls, seconds, maxSeconds) in widgetStats['methods'].items():
+                methodsDict[methodName] = {'calls': nMethodCalls, 'totalMs': seconds * 1000,
+                                           'maxMs': maxSeconds * 1000}
+            nCalls, seconds, maxSeconds = WidgetProfiler._sumMethods(widgetStats)
+            totalMs = seconds * 1000
+            maxMs = maxSeconds * 1000
+            widgetsList.append({'className': widgetStats['className'], 'nickname': widgetStats['nickname'],
+                                'widgetId': widgetStats['widgetId'], 'totalMs': totalMs,
+                                'nBlits': widgetStats['nBlits'], 'blitArea': widgetStats['blitArea'],
+                                'methods': methodsDict})
+
+            classStats = classesDict.setdefault(widgetStats['className'],
+                                                {'nWidgets': 0, 'calls': 0, 'totalMs': 0.0, 'maxMs': 0.0,
+                                                 'nBlits': 0, 'blitArea': 0})
+            classStats['nWidgets'] = classStats['nWidgets'] + 1
+            classStats['calls'] = classStats['calls'] + nCalls
+            classStats['totalMs'] = classStats['totalMs'] + totalMs
+            classStats['maxMs'] = max(classStats['maxMs'], maxMs)
+            classStats['nBlits'] = classStats['nBlits'] + widgetStats['nBlits']
+            classStats['blitArea'] = classStats['blitArea'] + widgetStats['blitArea']
+
+        widgetsList.sort(key=lambda widgetDict: widgetDict['totalMs'], reverse=True)
+        return {'nFrames': self.nFrames, 'maxFrameMs': self.maxFrameSeconds * 1000,
+                'widgets': widgetsList, 'classes': classesDict}
+
+    def printReport(self, nWidgets=10):
+        """Prints the slowest widgets, and the totals for each class of widget.
+
+        Optional keyword parameters:
+            | nWidgets - number of widgets to show (default 10)
+
+        """
+        snapshot = self.getSnapshot()
+        nFrames = snapshot['nFrames']
+        print('WidgetProfiler:', nFrames, 'frames, most time in widgets in one frame: %.3f ms' % snapshot['maxFrameMs'])
+        print('%-40s %9s %10s %9s %8s %11s' % ('widget', 'calls', 'total ms', 'max ms', 'blits', 'blit pixels'))
+        for widgetDict in snapshot['widgets'][:nWidgets]:
+            if widgetDict['nickname'] is None:
+                name = widgetDict['className'] + ' #' + hex(widgetDict['widgetId'])
+            else:
+                name = widgetDict['className'] + ' ' + str(widgetDict['nickname'])
+            nCalls = sum(methodDict['calls'] for methodDict in widgetDict['methods'].values())
+            maxMs = max([methodDict['maxMs'] for methodDict in widgetDict['methods'].values()], default=0.0)
+            print('%-40s %9d %10.3f %9.3f %8d %11d' % (name[:40], nCalls, widgetDict['totalMs'], maxMs,
+                                                       widgetDict['nBlits'], widgetDict['blitArea']))
+        print()
+        print('%-40s %9s %10s %9s %8s %11s' % ('class (number of widgets)', 'calls', 'total ms', 'max ms',
+                                               'blits', 'blit pixels'))
+        classesList = sorted(snapshot['classes'].items(), key=lambda item: item[1]['totalMs'], reverse=True)
+        for className, classStats in classesList:
+            name = className + ' (' + str(classStats['nWidgets']) + ')'
+            print('%-40s %9d %10.3f %9.3f %8d %11d' % (name, classStats['calls'], classStats['totalMs'],
+                                                       classStats['maxMs'], classStats['nBlits'],
+                                                       classStats['blitArea']))
+
+
+#
+#
+# FRAME TRACER
+#
+#
+
+class _FrameTracerSpan():
+    # Internal class, the context manager returned by FrameTracer.span
+    __slots__ = ('oTracer', 'name', 'category', 'argsDict', 'startTime')
+
+    def __init__(self, oTracer, name, category, argsDict):
+        self.oTracer = oTracer
+        self.name = name
+        self.category = category
+        self.argsDict = argsDict
+
+    def __enter__(self):
+        self.startTime = self.oTracer.clock()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        endTime = self.oTracer.clock()
+        self.oTracer.eventsDeque.append(('X', self.name, self.category, self.startTime,
+                                         endTime - self.startTime, threading.get_ident(), self.argsDict))
+        return False
+
+
+class FrameTracer():
+    """FrameTracer - records what happens in each frame, and saves it in a file you can open in a trace viewer.
+
+    While a FrameTracer is enabled, it records a span (a start time and a duration) for every call to:
+        - the handleEvent and draw methods of every widget
+        - the handleEvent method of EventRouters, and the draw and drawDirty methods of WidgetGroups
+        - the update method of animations, animation players, and AnimationSchedulers
+        - pygame.display.update and pygame.display.flip
+    It also records an instant event every time a font, image, sound, or text image is loaded
+    (or rendered) because it was not in a cache.  You add a span for each frame with beginFrame
+    and endFrame, and spans for parts of your own code (like your event loop) with span.
+
+    Events are kept in a ring buffer: once maxEvents events have been recorded, the oldest are thrown
+    away.  So the tracer can stay on for a long time, and you can save the last few seconds
+    when something goes wrong.  If you give a hitchMs, every frame that takes longer than that
+    (a "hitch") saves the last dumpSeconds seconds to a file (on a background thread).
+
+    Files are written in the Chrome Trace Event format (JSON).  Open them in a trace viewer such as
+    https://ui.perfetto.dev or chrome://tracing
+
+    Like a WidgetProfiler, the tracer works by replacing methods while it is enabled, and putting
+    the original methods back when it is disabled, so there is no cost when it is not enabled.
+    Only one FrameTracer (or WidgetProfiler) can be enabled at a time.
+
+    Typical use:
+
+        | oTracer = pygwidgets.FrameTracer(hitchMs=50, hitchPath='hitch{}.json')
+        | oTracer.enable()
+        | while True:
+        |     oTracer.beginFrame()
+        |     with oTracer.span('events'):
+        |         for event in pygame.event.get():
+        |             ...
+        |     ...  # draw everything
+        |     pygame.display.update()
+        |     oTracer.endFrame()
+        | ...
+        | oTracer.dump('trace.json')  # or dump the last 5 seconds with: oTracer.dump('trace.json', 5)
+
+    Optional keyword parameters:
+        | maxEvents - the most events to keep (default 100000)
+        | hitchMs - a frame that takes longer than this many milliseconds is a hitch (default None, no hitches)
+        | hitchPath - path of the file to save when there is a hitch, {} is replaced by the number of the hitch
+        |     (default None, do not save)
+        | dumpSeconds - number of seconds before a hitch to save (default 5)
+        | widgetSpans - record spans for every widget's handleEvent and draw (default True).  Set to False
+        |     to record only the larger parts of each frame when there are many widgets.
+        | clock - a function that returns the current time in seconds (defaults to time.perf_counter)
+
+    """
+    SPAN_METHODS_LIST = [  # (class, method name, category) of methods other than widget methods
+        ('EventRouter', 'handleEvent', 'events'),
+        ('WidgetGroup', 'draw', 'draw'),
+        ('WidgetGroup', 'drawDirty', 'draw'),
+        ('PygAnimationPlayback', 'update', 'animation'),
+        ('AnimationCollection', 'update', 'animation'),
+        ('AnimationScheduler', 'update', 'animation'),
+    ]
+    INSTANT_METHODS_LIST = [  # (class, method name, name of instant event) of loads that may miss a cache
+        ('PygwidgetsFontManager', 'loadFont', 'font load'),
+        ('PygwidgetsImageCache', 'loadImage', 'image load'),
+        ('PygwidgetsSoundCache', 'loadSound', 'sound load'),
+        ('PygwidgetsTextCache', 'render', 'text render'),
+    ]
+    DISPLAY_FUNCTION_NAMES = ('update', 'flip')
+
+    def __init__(self, maxEvents=100000, hitchMs=None, hitchPath=None, dumpSeconds=5.0,
+                 widgetSpans=True, clock=time.perf_counter):
+        self.clock = clock
+        self.hitchMs = hitchMs
+        self.hitchPath = hitchPath
+        self.dumpSeconds = dumpSeconds
+        self.widgetSpans = widgetSpans
+        self.eventsDeque = deque(maxlen=maxEvents)  # (phase, name, category, start, duration, thread id, args)
+        self.startTime = clock()  # times in the file are measured from here
+        self.enabled = False
+        self.originalMethodsList = []  # (class or module, name, original function)
+        self.activeSet = set()  # (id of object, method name) of spans in progress
+        self.frameStartTime = None
+        self.nFrames = 0
+        self.nHitches = 0
+        self.lastDumpTime = None
+
+    def enable(self):
+        """Starts recording, by replacing methods of the widget classes, caches, and pygame.display.
+
+        Raises:
+            | ValueError if a different FrameTracer (or a WidgetProfiler) is already enabled
+
+        """
+        if self.enabled:
+            return
+        _enableInstrument(self)
+        moduleDict = globals()
+        if self.widgetSpans:
+            for oClass in _getWidgetClasses():
+                for methodName in ('handleEvent', 'draw'):
+                    self._replace(oClass, methodName, 'widget', self._makeSpanMethod)
+        for className, methodName, category in FrameTracer.SPAN_METHODS_LIST:
+            self._replace(moduleDict[className], methodName, category, self._makeSpanMethod)
+        for className, methodName, eventName in FrameTracer.INSTANT_METHODS_LIST:
+            self._replace(moduleDict[className], methodName, eventName, self._makeInstantMethod)
+        for functionName in FrameTracer.DISPLAY_FUNCTION_NAMES:
+            function = getattr(pygame.display, functionName)
+            self.originalMethodsList.append((pygame.display, functionName, function))
+            setattr(pygame.display, functionName, self._makeDisplayFunction(function, 'display.' + functionName))
+        self.enabled = True
+
+    def disable(self):
+        """Stops recording, and puts back the original methods.  Recorded events are kept."""
+        if not self.enabled:
+            return
+        for oClassOrModule, name, function in reversed(self.originalMethodsList):
+            setattr(oClassOrModule, name, function)
+        self.originalMethodsList = []
+        self.activeSet = set()
+        self.frameStartTime = None
+        _disableInstrument()
+        self.enabled = False
+
+    def getEnabled(self):
+        """Returns True if the tracer is enabled"""
+        return self.enabled
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.disable()
+        return False
+
+    def _replace(self, oClass, methodName, categoryOrName, makeMethod):
+        # Internal method, replaces a method that is defined in a class (not inherited)
+        function = oClass.__dict__.get(methodName)
+        if function is not None:
+            self.originalMethodsList.append((oClass, methodName, function))
+            setattr(oClass, methodName, makeMethod(function, methodName, categoryOrName))
+
+    def _makeSpanMethod(self, function, methodName, category):
+        # Internal method, builds a method that records a span for each call to the original method
+        oTracer = self
+        clock = self.clock
+
+        def tracedMethod(oObject, *args, **kwargs):
+            activeKey = (id(oObject), methodName)
+            if activeKey in oTracer.activeSet:  # called through super(), recorded by the outer call
+                return function(oObject, *args, **kwargs)
+            oTracer.activeSet.add(activeKey)
+            startTime = clock()
+            try:
+                return function(oObject, *args, **kwargs)
+            finally:
+                endTime = clock()
+                oTracer.activeSet.discard(activeKey)
+                nickname = getattr(oObject, 'nickname', None)
+                oTracer.eventsDeque.append(('X', type(oObject).__name__ + '.' + methodName, category,
+                                            startTime, endTime - startTime, threading.get_ident(),
+                                            None if nickname is None else {'nickname': str(nickname)}))
+
+        tracedMethod.__name__ = function.__name__
+        tracedMethod.__doc__ = function.__doc__
+        tracedMethod.__wrapped__ = function
+        return tracedMethod
+
+    def _makeInstantMethod(self, function, methodName, eventName):
+        # Internal method, builds a method that records an instant event when a cache has to load something
+        oTracer = self
+        clock = self.clock
+
+        def tracedMethod(oCache, *args, **kwargs):
+            nMisses = oCache.nMisses
+            startTime = clock()
+            result = function(oCache, *args, **kwargs)
+            if oCache.nMisses != nMisses:  # not found in the cache
+                endTime = clock()
+                argsDict = {'ms': (endTime - startTime) * 1000}
+                if methodName == 'render':
+                    if len(args) > 1:
+                        argsDict['text'] = str(args[1])
+                elif args:
+                    argsDict['name'] = str(args[0])
+                    if (methodName == 'loadFont') and (len(args) > 1):
+                        argsDict['size'] = args[1]
+                oTracer.eventsDeque.append(('i', eventName, 'load', endTime, 0.0, threading.get_ident(), argsDict))
+            return result
+
+        tracedMethod.__name__ = function.__name__
+        tracedMethod.__doc__ = function.__doc__
+        tracedMethod.__wrapped__ = function
+        return tracedMethod
+
+    def _makeDisplayFunction(self, function, spanName):
+        # Internal method, builds a function that records a span for each call to a pygame.display function
+        oTracer = self
+        clock = self.clock
+
+        def tracedFunction(*args, **kwargs):
+            startTime = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                endTime = clock()
+                oTracer.eventsDeque.append(('X', spanName, 'display', startTime, endTime - startTime,
+                                            threading.get_ident(), None))
+
+        tracedFunction.__wrapped__ = function
+        return tracedFunction
+
+    def span(self, name, category='phase', argsDict=None):
+        """Returns a context manager that records a span for the code inside a with statement.
+
+        Parameters:
+            | name - name of the span (shown in the trace viewer)
+
+        Optional keyword parameters:
+            | category - category of the span (default 'phase')
+            | argsDict - a dictionary of extra information to show with the span (default None)
+
+        """
+        return _FrameTracerSpan(self, name, category, argsDict)
+
+    def instant(self, name, category='mark', argsDict=None):
+        """Records an instant event (a single point in time) with a given name."""
+        self.eventsDeque.append(('i', name, category, self.clock(), 0.0, threading.get_ident(), argsDict))
+
+    def beginFrame(self):
+        """Call at the start of each frame."""
+        self.frameStartTime = self.clock()
+
+    def endFrame(self):
+        """Call at the end of each frame.  Records a span for the frame, and checks for a hitch.
+
+        Returns:
+            | the time of the frame in milliseconds (or None if beginFrame was not called)
+
+        """
+        if self.frameStartTime is None:
+            return None
+        endTime = self.clock()
+        seconds = endTime - self.frameStartTime
+        self.eventsDeque.append(('X', 'frame', 'frame', self.frameStartTime, seconds,
+                                 threading.get_ident(), {'frame': self.nFrames}))
+        self.nFrames = self.nFrames + 1
+        self.frameStartTime = None
+        frameMs = seconds * 1000
+        if (self.hitchMs is not None) and (frameMs > self.hitchMs):
+            self.nHitches = self.nHitches + 1
+            self.instant('hitch', 'frame', {'ms': frameMs})
+            # Save at most one file for each dumpSeconds, because each file already covers that much time
+            if (self.hitchPath is not None) and \
+                    ((self.lastDumpTime is None) or ((endTime - self.lastDumpTime) >= self.dumpSeconds)):
+                self.lastDumpTime = endTime
+                self.dump(self.hitchPath.format(self.nHitches), self.dumpSeconds, background=True)
+        return frameMs
+
+    def getNHitches(self):
+        """Returns the number of frames that took longer than hitchMs"""
+        return self.nHitches
+
+    def clear(self):
+        """Throws away all recorded events."""
+        self.eventsDeque.clear()
+
+    def getTraceEvents(self, lastSeconds=None):
+        """Returns the recorded events as a list of dictionaries in the Chrome Trace Event format.
+
+        Optional keyword parameters:
+            | lastSeconds - only return events from this many seconds before now (default None, all events)
+
+        """
+        return self._buildTraceEvents(list(self.eventsDeque), lastSeconds, self.clock())
+
+    def _buildTraceEvents(self, eventsList, lastSeconds, now):
+        # Internal method, converts recorded tuples to trace event dictionaries (times in microseconds)
+        pid = os.getpid()
+        traceEventsList = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                            'args': {'name': 'pygwidgets'}}]
+        threadIdsSet = set()
+        for phase, name, category, eventTime, duration, threadId, argsDict in eventsList:
+            if (lastSeconds is not None) and ((eventTime + duration) < (now - lastSeconds)):
+                continue
+            traceEvent = {'name': name, 'cat': category, 'ph': phase, 'pid': pid, 'tid': threadId,
+                          'ts': (eventTime - self.startTime) * 1000000}
+            if phase == 'X':
+                traceEvent['dur'] = duration * 1000000
+            else:
+                traceEvent['s'] = 't'  # instant event for one thread
+            if argsDict is not None:
+                traceEvent['args'] = argsDict
+            traceEventsList.append(traceEvent)
+            threadIdsSet.add(threadId)
+        threadNamesDict = {oThread.ident: oThread.name for oThread in threading.enumerate()}
+        for threadId in threadIdsSet:
+            traceEventsList.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': threadId,
+                                    'args': {'name': threadNamesDict.get(threadId, str(threadId))}})
+        return traceEventsList
+
+    def dump(self, path, lastSeconds=None, background=False):
+        """Saves the recorded events to a JSON file in the Chrome Trace Event format.
+
+        Parameters:
+            | path - path of the file to write
+
+        Optional keyword parameters:
+            | lastSeconds - only save events from this many seconds before now (default None, all events)
+            | background - if True, write the file on a background thread and return right away (default False)
+
+        Returns:
+            |     the background thread (call its join method to wait for it), or None if background is False
+
+        """
+        eventsList = list(self.eventsDeque)  # copy on this thread, the rest can be done in the background
+        now = self.clock()
+        if background:
+            oThread = threading.Thread(target=self._writeTrace, args=(path, eventsList, lastSeconds, now),
+                                       name='pygwidgets trace dump', daemon=True)
+            oThread.start()
+            return oThread
+
+        self._writeTrace(path, eventsList, lastSeconds, now)
+        return None
+
+    def _writeTrace(self, path, eventsList, lastSeconds, now):
+        # Internal method, writes a trace file (may run on a background thread)
+        traceDict = {'traceEvents': self._buildTraceEvents(eventsList, lastSeconds, now),
+                     'displayTimeUnit': 'ms'}
+        with open(path, 'w') as traceFile:
+            json.dump(traceDict, traceFile)
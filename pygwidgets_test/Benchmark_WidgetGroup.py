@@ -0,0 +1,114 @@
+#  Benchmark of drawing many widgets one at a time vs. drawing them with a WidgetGroup that batches blits
+#
+#  Draws the same set of widgets both ways, using the per-widget draw loop
+#  from Main_Test_pygwidgets.py, and the single window.blits() call made by WidgetGroup.draw()
+#  for a group created with batchBlits=True.
+#  Runs without opening a visible window.
+#
+#  Two sets of widgets are timed:
+#    - a mix of 500 buttons, checkboxes, radio buttons, texts, and images (the per-widget loop
+#      of Main_Test_pygwidgets.py), where most of the time is spent copying pixels
+#    - 2000 tiny (8 x 8) images, where most of the time is the Python cost of each draw() call
+#  Each is timed several times, and the best time is kept, because timings are noisy.
+#
+#  Measured headless with pygame-ce 2.5.8 on one CPU, over a dozen runs, batching blits was
+#  0.87x - 1.20x as fast for the mix of widgets (within the noise), and 1.02x - 1.57x as fast
+#  for the tiny images (usually 1.05x - 1.25x).
+#  Batching only saves the Python cost per widget, it does not make copying pixels any faster.
+#  Because that is not a clear win, WidgetGroup only batches blits when created with batchBlits=True.
+
+# 1 - Import libraries
+import os
+import sys
+import time
+# The next lines are here just in case you are running from the command line
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+import pygwidgets
+
+
+# 2 - Define constants
+WINDOW_WIDTH = 640
+WINDOW_HEIGHT = 640
+N_WIDGETS = 500
+N_TINY_IMAGES = 2000
+N_FRAMES = 50
+N_REPEATS = 7
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([WINDOW_WIDTH, WINDOW_HEIGHT])
+
+
+# 4 - Load assets: build a mix of widgets, spread across the window
+widgetsList = []
+for widgetNumber in range(N_WIDGETS):
+    loc = ((widgetNumber * 37) % (WINDOW_WIDTH - 100), (widgetNumber * 53) % (WINDOW_HEIGHT - 40))
+    kind = widgetNumber % 5
+    if kind == 0:
+        oWidget = pygwidgets.TextButton(window, loc, 'Button ' + str(widgetNumber))
+    elif kind == 1:
+        oWidget = pygwidgets.CustomCheckBox(window, loc, on='images/checkBoxOn.png', off='images/checkBoxOff.png')
+    elif kind == 2:
+        oWidget = pygwidgets.TextRadioButton(window, loc, 'Benchmark Group', 'Radio ' + str(widgetNumber))
+    elif kind == 3:
+        oWidget = pygwidgets.DisplayText(window, loc, 'Text ' + str(widgetNumber))
+    else:
+        oWidget = pygwidgets.Image(window, loc, 'images/pythonIcon.png')
+    widgetsList.append(oWidget)
+
+# And many tiny images
+tinyImage = pygame.Surface((8, 8)).convert()
+tinyImage.fill((200, 50, 50))
+tinyImagesList = []
+for imageNumber in range(N_TINY_IMAGES):
+    loc = ((imageNumber * 37) % (WINDOW_WIDTH - 8), (imageNumber * 53) % (WINDOW_HEIGHT - 8))
+    tinyImagesList.append(pygwidgets.Image(window, loc, tinyImage))
+
+
+# 5 - Time both approaches
+def timeFrames(drawFunction):
+    # Returns the best average time per frame, of N_REPEATS runs of N_FRAMES frames
+    bestSeconds = None
+    for repeatNumber in range(N_REPEATS):
+        startTime = time.perf_counter()
+        for frameNumber in range(N_FRAMES):
+            window.fill((0, 0, 0))
+            drawFunction()
+        seconds = (time.perf_counter() - startTime) / N_FRAMES
+        if (bestSeconds is None) or (seconds < bestSeconds):
+            bestSeconds = seconds
+    return bestSeconds
+
+def compare(title, oneWidgetList):
+    oWidgetGroup = pygwidgets.WidgetGroup(window, batchBlits=True)
+    oWidgetGroup.add(oneWidgetList)
+
+    def drawOneAtATime():
+        for oWidget in oneWidgetList:
+            oWidget.draw()
+
+    # Make sure both approaches produce the same image
+    window.fill((0, 0, 0))
+    drawOneAtATime()
+    imageOneAtATime = pygame.image.tobytes(window, 'RGB')
+    window.fill((0, 0, 0))
+    oWidgetGroup.draw()
+    if imageOneAtATime != pygame.image.tobytes(window, 'RGB'):
+        print('Warning: WidgetGroup.draw() with batchBlits did not produce the same image as drawing one at a time')
+
+    secondsOneAtATime = timeFrames(drawOneAtATime)
+    secondsGroup = timeFrames(oWidgetGroup.draw)
+
+    print(title + ', best average of', N_REPEATS, 'runs of', N_FRAMES, 'frames:')
+    print('  One draw() call per widget:    %8.3f ms per frame' % (secondsOneAtATime * 1000))
+    print('  WidgetGroup.draw() (blits):    %8.3f ms per frame' % (secondsGroup * 1000))
+    print('  Speedup: %.2fx' % (secondsOneAtATime / secondsGroup))
+
+compare('Drawing a mix of ' + str(N_WIDGETS) + ' widgets', widgetsList)
+compare('Drawing ' + str(N_TINY_IMAGES) + ' tiny images', tinyImagesList)
+
+pygame.quit()
+sys.exit()
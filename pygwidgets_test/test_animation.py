@@ -0,0 +1,295 @@
+#  Tests of Animation timing (finding the image for a time, skipping images, jumpTo and jumpToTime),
+#  of animations sharing an AnimationClip, and of lazy animation collections
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_animation
+
+# 1 - Import libraries
+import os
+import tempfile
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+import pygwidgets
+
+
+# 2 - Define constants
+IMAGES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images')
+#  Images end at .1, .3, .4, and .7 seconds
+FRAMES_LIST = [(os.path.join(IMAGES_FOLDER, 'imageStart.jpg'), .1),
+               (os.path.join(IMAGES_FOLDER, 'imageUp.jpg'), .2),
+               (os.path.join(IMAGES_FOLDER, 'imageDown.jpg'), .1),
+               (os.path.join(IMAGES_FOLDER, 'imageLeft.jpg'), .3)]
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([200, 200])
+
+
+# 4 - Define helper classes and functions
+class ManualClock():
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def makeAnimation(**kwargs):
+    # Returns an animation and a clock that controls it
+    oClock = ManualClock()
+    oScheduler = pygwidgets.AnimationScheduler(clock=oClock)
+    oAnimation = pygwidgets.Animation(window, (0, 0), FRAMES_LIST, **kwargs)
+    oScheduler.add(oAnimation)
+    return oAnimation, oClock
+
+def isPlaying(oAnimation):
+    return oAnimation.state == pygwidgets.PYGWIDGETS_ANIMATION_PLAYING
+
+def getPixels(image):
+    return image.get_size(), pygame.image.tobytes(image, 'RGBA')
+
+def makeSpriteSheet(folder, nImages, width, height):
+    # Saves a sprite sheet with a different color for each image, and returns its path
+    sheet = pygame.Surface((width * nImages, height))
+    for imageIndex in range(nImages):
+        sheet.fill((imageIndex * 60, 100, 200), (imageIndex * width, 0, width, height))
+    sheetPath = os.path.join(folder, 'sheet.png')
+    pygame.image.save(sheet, sheetPath)
+    return sheetPath
+
+def makeImageFiles(folder, namesList):
+    # Saves a small image for each name, and returns a list of their paths
+    pathsList = []
+    for name in namesList:
+        imagePath = os.path.join(folder, name + '.png')
+        pygame.image.save(pygame.Surface((8, 8)), imagePath)
+        pathsList.append(imagePath)
+    return pathsList
+
+def getImageMisses():
+    return pygwidgets.getImageCache().getStats()['misses']
+
+def getIndexAt(oAnimation, oClock, now):
+    oClock.now = now
+    oAnimation.update()
+    return oAnimation.index
+
+
+# 5 - Define the tests
+def testSlowFramesSkipImages():
+    oAnimation, oClock = makeAnimation()
+    oAnimation.start()
+    assert getIndexAt(oAnimation, oClock, .05) == 0
+    assert getIndexAt(oAnimation, oClock, .35) == 2  # image 1 was never shown
+    assert getIndexAt(oAnimation, oClock, .4) == 2  # an image is shown until the end of its time
+    assert getIndexAt(oAnimation, oClock, .41) == 3
+    assert getIndexAt(oAnimation, oClock, .8) == 0  # finished, showing the first image
+    assert not isPlaying(oAnimation)
+
+def testLoopingStaysOnTime():
+    oAnimation, oClock = makeAnimation(loop=True)
+    oAnimation.start()
+    assert getIndexAt(oAnimation, oClock, .65) == 3
+    assert getIndexAt(oAnimation, oClock, .75) == 0  # .05 into the second pass
+    assert getIndexAt(oAnimation, oClock, 7.2) == 1  # 10 passes later, .2 into the pass
+    assert isPlaying(oAnimation)
+
+def testPassesInOneSlowFrameAreCounted():
+    callBackList = []
+    oAnimation, oClock = makeAnimation(nIterations=3, showFirstImageAtEnd=False, callBack=callBackList.append)
+    oAnimation.start()
+    assert getIndexAt(oAnimation, oClock, 1.45) == 0  # two passes done, .05 into the third
+    assert isPlaying(oAnimation)
+    assert getIndexAt(oAnimation, oClock, 2.2) == 3  # third pass finished, showing the last image
+    assert not isPlaying(oAnimation)
+    assert callBackList == [None]
+
+def testJumpTo():
+    oAnimation, oClock = makeAnimation()
+    oAnimation.jumpTo(2)  # a stopped animation is paused at the image
+    assert oAnimation.index == 2
+    assert not isPlaying(oAnimation)
+    oClock.now = 10
+    oAnimation.start()
+    assert getIndexAt(oAnimation, oClock, 10.09) == 2  # image 2 starts at .3 seconds
+    assert getIndexAt(oAnimation, oClock, 10.11) == 3
+
+    oAnimation.jumpTo(1)  # a playing animation keeps playing from the image
+    assert isPlaying(oAnimation)
+    assert getIndexAt(oAnimation, oClock, 10.3) == 1
+    assert getIndexAt(oAnimation, oClock, 10.32) == 2
+
+    for badIndex in (-1, 4):
+        try:
+            oAnimation.jumpTo(badIndex)
+        except IndexError:
+            pass
+        else:
+            assert False, 'IndexError not raised for ' + str(badIndex)
+
+def testJumpToTime():
+    oAnimation, oClock = makeAnimation()
+    for seconds, expectedIndex in ((0, 0), (.1, 0), (.15, 1), (.3, 1), (.35, 2), (.7, 3)):
+        oAnimation.jumpToTime(seconds)
+        assert oAnimation.index == expectedIndex, seconds
+    oAnimation.jumpToTime(.5)
+    oClock.now = 3
+    oAnimation.start()
+    assert getIndexAt(oAnimation, oClock, 3.15) == 3
+    assert getIndexAt(oAnimation, oClock, 3.25) == 0  # finished .7 seconds in
+    assert not isPlaying(oAnimation)
+
+    for badTime in (-.1, .71):
+        try:
+            oAnimation.jumpToTime(badTime)
+        except ValueError:
+            pass
+        else:
+            assert False, 'ValueError not raised for ' + str(badTime)
+
+
+def testAnimationsShareAClip():
+    oAnimation1, oClock = makeAnimation()
+    oClip = oAnimation1.getClip()
+    assert oClip.getNImages() == 4
+    assert abs(oClip.getDuration() - .7) < .000001
+    oAnimation2 = pygwidgets.Animation(window, (50, 50), oClip)
+    assert oAnimation2.getClip() is oClip
+    assert oAnimation2.imagesList[3] is oAnimation1.imagesList[3]
+
+    oAnimation1.start()  # each animation plays on its own
+    assert getIndexAt(oAnimation1, oClock, .35) == 2
+    assert oAnimation2.index == 0
+    assert not isPlaying(oAnimation2)
+
+def testSpriteSheetFrames():
+    with tempfile.TemporaryDirectory() as tempDir:
+        sheetPath = makeSpriteSheet(tempDir, 3, 20, 10)
+        oSheetAnimation1 = pygwidgets.SpriteSheetAnimation(window, (0, 0), sheetPath, 3, 20, 10, .1)
+        oSheetAnimation2 = pygwidgets.SpriteSheetAnimation(window, (0, 0), sheetPath, 3, 20, 10, [.1, .2, .3])
+        oClip = pygwidgets.AnimationClip.fromSpriteSheet(sheetPath, 3, 20, 10, .1)
+    for imageIndex in range(3):
+        image = oClip.imagesTuple[imageIndex]
+        assert image.get_size() == (20, 10)
+        assert image.get_at((5, 5))[:3] == (imageIndex * 60, 100, 200)
+        assert oSheetAnimation1.getClip().imagesTuple[imageIndex] is image  # the sheet was cut up once
+        assert oSheetAnimation2.getClip().imagesTuple[imageIndex] is image
+    assert oSheetAnimation2.getClip().endTimesTuple[-1] == oSheetAnimation2.getClip().getDuration()
+
+def testClipErrors():
+    image = pygame.Surface((10, 10))
+    for imagesList, durationsList, offsetsList in (([], [], None),
+                                                  ([image, image], [.1], None),
+                                                  ([image], [.1], [(0, 0), (1, 1)])):
+        try:
+            pygwidgets.AnimationClip(imagesList, durationsList, offsetsList)
+        except ValueError:
+            pass
+        else:
+            assert False, 'ValueError not raised'
+
+def testAnimationPlayers():
+    oAnimation, oClock = makeAnimation()
+    oClip = oAnimation.getClip()
+    oScheduler = oAnimation.oScheduler
+    finishedList = []
+    playersList = []
+    for playerIndex in range(3):
+        oPlayer = pygwidgets.AnimationPlayer(window, (playerIndex * 10, 0), oClip, nickname=playerIndex,
+                                             callBack=finishedList.append)
+        playersList.append(oPlayer)
+    oScheduler.add(playersList)
+    assert not hasattr(playersList[0], '__dict__')  # only the playback state is stored
+    playersList[0].start()
+    oClock.now = .1
+    playersList[1].start()
+    oClock.now = .35
+    oScheduler.update()
+    assert [oPlayer.index for oPlayer in playersList] == [2, 1, 0]
+    oPlayer = playersList[0]
+    assert oPlayer.getBlitInfo() == (oClip.imagesTuple[2], (0, 0))
+    assert oPlayer.getRect() == oClip.imagesTuple[2].get_rect()
+    oPlayer.setLoc((5, 6))
+    assert oPlayer.getRect().topleft == (5, 6)
+
+    oClock.now = .75
+    assert oScheduler.update() == [playersList[0]]
+    assert finishedList == [0]
+    oClock.now = .85
+    assert oScheduler.update() == [playersList[1]]
+    assert finishedList == [0, 1]
+
+
+def testLazyCollectionBuildsAnimationsWhenShown():
+    with tempfile.TemporaryDirectory() as tempDir:
+        pathsList = makeImageFiles(tempDir, ['lazy1', 'lazy2', 'lazy3', 'lazy4'])
+        animationsDict = {'walk': [(pathsList[0], .1), (pathsList[1], .1)],
+                          'jump': [(pathsList[2], .1)],
+                          'fall': [(pathsList[3], .1)]}
+        nMisses = getImageMisses()
+        oCollection = pygwidgets.AnimationCollection(window, (0, 0), animationsDict, 'walk', lazy=True)
+        assert getImageMisses() == nMisses + 2  # only the starting animation was loaded
+        assert [oCollection.isLoaded(key) for key in ('walk', 'jump', 'fall')] == [True, False, False]
+
+        oCollection.setLoc((30, 40))
+        oCollection.replace('jump')
+        assert oCollection.isLoaded('jump')
+        assert getImageMisses() == nMisses + 3
+        assert oCollection.animationsDict['jump'].getLoc() == (30, 40)  # built at the current location
+
+        oEagerCollection = pygwidgets.AnimationCollection(window, (0, 0), animationsDict, 'walk')
+        assert getImageMisses() == nMisses + 4  # everything built, 'fall' is the only new image
+        assert oEagerCollection.isLoaded('fall')
+
+def testPrefetch():
+    with tempfile.TemporaryDirectory() as tempDir:
+        pathsList = makeImageFiles(tempDir, ['prefetch1', 'prefetch2', 'prefetch3'])
+        animationsDict = {'a': [(pathsList[0], .1)], 'b': [(pathsList[1], .1)], 'c': [(pathsList[2], .1)]}
+        oCollection = pygwidgets.AnimationCollection(window, (0, 0), animationsDict, 'a', lazy=True)
+        assert oCollection.prefetch(['b']) is None
+        assert oCollection.isLoaded('b')
+
+        nMisses = getImageMisses()
+        oThread = oCollection.prefetch(['a', 'c'], background=True)
+        oThread.join()
+        assert getImageMisses() == nMisses + 1  # only the images of 'c' were loaded
+        assert not oCollection.isLoaded('c')  # built on the main thread, when it is first shown
+        oCollection.replace('c')
+        assert getImageMisses() == nMisses + 1
+
+    try:
+        oCollection.prefetch(['b', 'noSuchKey'])
+    except KeyError:
+        pass
+    else:
+        assert False, 'KeyError not raised'
+
+def testLazySpriteSheetCollection():
+    with tempfile.TemporaryDirectory() as tempDir:
+        sheetPath = makeSpriteSheet(tempDir, 3, 20, 10)
+        sheetsDict = {'first': (sheetPath, 3, 20, 10, .1), 'second': (sheetPath, 2, 20, 10, .1)}
+        oCollection = pygwidgets.SpriteSheetAnimationCollection(window, (0, 0), sheetsDict, 'first', lazy=True)
+        assert not oCollection.isLoaded('second')
+        oCollection.prefetch(['second'], background=True).join()
+        oCollection.replace('second')
+    assert oCollection.animationsDict['second'].getClip().getNImages() == 2
+
+def testSchedulerGetsAnimationsBuiltLater():
+    oClock = ManualClock()
+    oScheduler = pygwidgets.AnimationScheduler(clock=oClock)
+    oCollection = pygwidgets.AnimationCollection(window, (0, 0), {'a': FRAMES_LIST, 'b': FRAMES_LIST}, 'a',
+                                                 lazy=True)
+    oScheduler.add(oCollection)
+    assert oScheduler.getAnimations() == [oCollection.animationsDict['a']]
+    oCollection.replace('b')
+    oAnimationB = oCollection.animationsDict['b']
+    assert oScheduler.getAnimations() == [oCollection.animationsDict['a'], oAnimationB]
+    oCollection.start()
+    assert getIndexAt(oAnimationB, oClock, .15) == 1
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
@@ -0,0 +1,130 @@
+#  Tests of AnimationScheduler, using a clock that the tests control
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_animationScheduler
+
+# 1 - Import libraries
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+import pygwidgets
+
+
+# 2 - Define constants
+IMAGES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images')
+FRAMES_LIST = [(os.path.join(IMAGES_FOLDER, 'imageUp.jpg'), .1),
+               (os.path.join(IMAGES_FOLDER, 'imageDown.jpg'), .1)]
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([200, 200])
+
+
+# 4 - Define helper classes
+class ManualClock():
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# 5 - Define the tests
+def testReturnsFinishedAnimations():
+    oClock = ManualClock()
+    oScheduler = pygwidgets.AnimationScheduler(clock=oClock)
+    callBackNicknamesList = []
+    oAnimation = pygwidgets.Animation(window, (0, 0), FRAMES_LIST, nickname='single',
+                                      callBack=callBackNicknamesList.append)
+    oLoopingAnimation = pygwidgets.Animation(window, (0, 0), FRAMES_LIST, loop=True)
+    oScheduler.add([oAnimation, oLoopingAnimation])
+    oAnimation.start()
+    oLoopingAnimation.start()
+    oClock.now = .15
+    assert oScheduler.update() == []
+    oClock.now = .25
+    assert oScheduler.update() == [oAnimation]
+    assert callBackNicknamesList == ['single']
+    oClock.now = .5
+    assert oScheduler.update() == []
+
+def testReturnsCollectionNotMemberAnimation():
+    oClock = ManualClock()
+    oScheduler = pygwidgets.AnimationScheduler(clock=oClock)
+    callBackNicknamesList = []
+    oAnimationCollection = pygwidgets.AnimationCollection(window, (0, 0), {'a': FRAMES_LIST, 'b': FRAMES_LIST}, 'a',
+                                                          nickname='collection', callBack=callBackNicknamesList.append)
+    oScheduler.add(oAnimationCollection)
+    oAnimationCollection.start()
+    oClock.now = .25
+    assert oScheduler.update() == [oAnimationCollection]
+    assert callBackNicknamesList == ['collection']
+
+    # A member animation added by itself is reported as itself
+    oScheduler.remove(oAnimationCollection)
+    oMemberAnimation = oAnimationCollection.animationsDict['b']
+    oScheduler.add(oMemberAnimation)
+    oAnimationCollection.replace('b')
+    oAnimationCollection.start()
+    oClock.now = .5
+    assert oScheduler.update() == [oMemberAnimation]
+
+
+def testOnlyPlayingAnimationsAreUpdated():
+    oClock = ManualClock()
+    oScheduler = pygwidgets.AnimationScheduler(clock=oClock)
+    oPlaying = pygwidgets.Animation(window, (0, 0), FRAMES_LIST, loop=True)
+    oPaused = pygwidgets.Animation(window, (0, 0), FRAMES_LIST, loop=True)
+    oStopped = pygwidgets.Animation(window, (0, 0), FRAMES_LIST, loop=True)
+    oScheduler.add([oPlaying, oPaused, oStopped])
+    oPlaying.start()
+    oPaused.start()
+    oClock.now = .05
+    oScheduler.update()
+    oPaused.pause()
+    assert list(oScheduler.playingDict) == [oPlaying]
+    oClock.now = .15
+    oScheduler.update()
+    assert oPlaying.index == 1
+    assert oPaused.index == 0
+    assert oStopped.index == 0
+    oPaused.start()  # continues from where it was paused
+    oClock.now = .19
+    oScheduler.update()
+    assert oPaused.index == 0
+    oClock.now = .26
+    oScheduler.update()
+    assert oPaused.index == 1
+
+def testAddAndRemove():
+    oClock = ManualClock()
+    oScheduler = pygwidgets.AnimationScheduler(clock=oClock)
+    oAnimation = pygwidgets.Animation(window, (0, 0), FRAMES_LIST, loop=True)
+    oScheduler.add(oAnimation)
+    oScheduler.add(oAnimation)  # already added, nothing changes
+    assert oScheduler.getAnimations() == [oAnimation]
+    oScheduler.update(now=7)
+    assert oScheduler.getTime() == 7
+    oScheduler.remove(oAnimation)
+    assert oScheduler.getAnimations() == []
+    assert oAnimation.oScheduler is None
+    try:
+        oScheduler.remove(oAnimation)
+    except ValueError:
+        pass
+    else:
+        assert False, 'ValueError not raised'
+
+    oAnimationCollection = pygwidgets.AnimationCollection(window, (0, 0), {'a': FRAMES_LIST, 'b': FRAMES_LIST}, 'a')
+    oScheduler.add(oAnimationCollection)
+    assert len(oScheduler.getAnimations()) == 2
+    oScheduler.removeAll()
+    assert oScheduler.getAnimations() == []
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
@@ -0,0 +1,91 @@
+#  Tests of BackgroundPlaylist, which checks and reads its music files on background threads
+#
+#  Runs without opening a visible window or playing sound:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_backgroundPlaylist
+
+# 1 - Import libraries
+import os
+import time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+import pygame
+import pygwidgets
+
+
+# 2 - Define constants
+SOUNDS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sounds')
+MISSING_PATH = os.path.join(SOUNDS_FOLDER, 'noSuchSong.wav')
+PATHS_LIST = [MISSING_PATH, os.path.join(SOUNDS_FOLDER, 'Coin.wav'), os.path.join(SOUNDS_FOLDER, 'Jump.wav')]
+
+
+# 3 - Initialize the world
+pygame.init()
+
+
+# 4 - Define helper functions
+def buildPlaylist():
+    # Returns a playlist, and a list of the tracks that it started reading
+    oPlaylist = pygwidgets.BackgroundPlaylist()
+    prefetchedList = []
+    originalPrefetchTrack = oPlaylist._prefetchTrack
+    def recordingPrefetchTrack(index):
+        prefetchedList.append(index)
+        originalPrefetchTrack(index)
+    oPlaylist._prefetchTrack = recordingPrefetchTrack
+    return oPlaylist, prefetchedList
+
+def waitForReads(oPlaylist):
+    endTime = time.perf_counter() + 5
+    while oPlaylist.loadingSet and (time.perf_counter() < endTime):
+        time.sleep(0.01)
+    assert not oPlaylist.loadingSet
+
+def waitForTrack(oPlaylist, index):
+    endTime = time.perf_counter() + 5
+    while (oPlaylist.getCurrentIndex() != index) and (time.perf_counter() < endTime):
+        oPlaylist.update()
+        time.sleep(0.01)
+    assert oPlaylist.getCurrentIndex() == index
+
+
+# 5 - Define the tests
+def testFirstTrackIsReadThroughPrefetch():
+    oPlaylist, prefetchedList = buildPlaylist()
+    oPlaylist.add(PATHS_LIST).join()
+    assert prefetchedList == [1]  # the missing file is skipped
+    waitForReads(oPlaylist)
+    assert list(oPlaylist.dataDict) == [1]
+    assert oPlaylist.getInvalidPaths() == [MISSING_PATH]
+
+def testNothingReadWhenATrackIsPlaying():
+    oPlaylist, prefetchedList = buildPlaylist()
+    oPlaylist.add(PATHS_LIST).join()
+    oPlaylist.playTrack(2)
+    waitForTrack(oPlaylist, 2)
+    del prefetchedList[:]
+    oPlaylist.add(PATHS_LIST[1]).join()  # checking new files does not read the first track again
+    assert prefetchedList == []
+    oPlaylist.stop()
+
+def testPlayNextAndPrevious():
+    oPlaylist, prefetchedList = buildPlaylist()
+    oPlaylist.add(PATHS_LIST).join()
+    oPlaylist.play()
+    waitForTrack(oPlaylist, 1)
+    assert oPlaylist.getCurrentPath() == PATHS_LIST[1]
+    oPlaylist.next()
+    waitForTrack(oPlaylist, 2)
+    oPlaylist.next()  # loops around, skipping the missing file
+    waitForTrack(oPlaylist, 1)
+    oPlaylist.previous()
+    waitForTrack(oPlaylist, 2)
+    oPlaylist.stop()
+    assert not oPlaylist.getPlaying()
+    assert oPlaylist.dataDict == {}
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
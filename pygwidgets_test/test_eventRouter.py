@@ -0,0 +1,220 @@
+#  Tests of EventRouter, comparing routed events with calling handleEvent of every widget
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_eventRouter
+
+# 1 - Import libraries
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame.locals import *
+import pygwidgets
+
+
+# 2 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([640, 480])
+
+
+# 3 - Define helper functions
+def buildWidgets(groupName):
+    # Overlapping buttons, widgets spread over several cells, and two key listeners
+    return [pygwidgets.TextButton(window, (20, 20), 'Button 1', width=100),
+            pygwidgets.TextButton(window, (100, 40), 'Button 2', width=100),  # overlaps Button 1
+            pygwidgets.TextButton(window, (400, 20), 'Keyed', width=100, activationKeysList=[K_k]),
+            pygwidgets.TextCheckBox(window, (20, 200), 'Check', value=False),
+            pygwidgets.TextRadioButton(window, (20, 250), groupName, 'Radio 1', value=True),
+            pygwidgets.TextRadioButton(window, (150, 250), groupName, 'Radio 2'),
+            pygwidgets.InputText(window, (300, 300), width=250),
+            pygwidgets.TextButton(window, (500, 400), 'Far away', width=100)]
+
+def getState(oWidget):
+    if isinstance(oWidget, pygwidgets.InputText):
+        return oWidget.getValue(), oWidget.focus
+    if isinstance(oWidget, pygwidgets.PygWidgetsButton):
+        return oWidget.state
+    return oWidget.getValue()
+
+def moveTo(pos, buttons=(0, 0, 0)):
+    return pygame.event.Event(MOUSEMOTION, pos=pos, rel=(0, 0), buttons=buttons)
+
+def getEvents():
+    # A new list each time, because InputText may change the key of an event.
+    # As with a real mouse, a motion event comes before any button event at a new location.
+    return [moveTo((30, 30)),
+            moveTo((110, 50)),  # on both buttons
+            pygame.event.Event(MOUSEBUTTONDOWN, pos=(110, 50), button=1),
+            moveTo((300, 150), (1, 0, 0)),  # leave while down
+            moveTo((110, 50), (1, 0, 0)),  # come back
+            pygame.event.Event(MOUSEBUTTONUP, pos=(110, 50), button=1),  # click on both buttons
+            moveTo((30, 30)),
+            pygame.event.Event(MOUSEBUTTONDOWN, pos=(30, 30), button=1),
+            moveTo((600, 10), (1, 0, 0)),
+            pygame.event.Event(MOUSEBUTTONUP, pos=(600, 10), button=1),  # released outside, no click
+            moveTo((25, 205)),
+            pygame.event.Event(MOUSEBUTTONDOWN, pos=(25, 205), button=1),
+            pygame.event.Event(MOUSEBUTTONUP, pos=(25, 205), button=1),  # check box
+            moveTo((155, 255)),
+            pygame.event.Event(MOUSEBUTTONDOWN, pos=(155, 255), button=1),
+            pygame.event.Event(MOUSEBUTTONUP, pos=(155, 255), button=1),  # second radio button
+            pygame.event.Event(KEYDOWN, key=K_a, unicode='a', mod=0),  # no field has focus yet
+            moveTo((310, 310)),
+            pygame.event.Event(MOUSEBUTTONDOWN, pos=(310, 310), button=1),  # give focus to the InputText
+            pygame.event.Event(MOUSEBUTTONUP, pos=(310, 310), button=1),
+            pygame.event.Event(KEYDOWN, key=K_h, unicode='h', mod=0),
+            pygame.event.Event(KEYDOWN, key=K_i, unicode='i', mod=0),
+            pygame.event.Event(KEYDOWN, key=K_LEFT, unicode='', mod=0),
+            pygame.event.Event(KEYDOWN, key=K_BACKSPACE, unicode='', mod=0),
+            pygame.event.Event(KEYDOWN, key=K_RETURN, unicode='\r', mod=0),
+            pygame.event.Event(MOUSEBUTTONDOWN, pos=(310, 310), button=1),
+            pygame.event.Event(MOUSEBUTTONUP, pos=(310, 310), button=1),
+            moveTo((600, 200)),
+            pygame.event.Event(MOUSEBUTTONDOWN, pos=(600, 200), button=1),  # click elsewhere, focus is lost
+            pygame.event.Event(MOUSEBUTTONUP, pos=(600, 200), button=1),
+            pygame.event.Event(KEYDOWN, key=K_k, unicode='k', mod=0),
+            pygame.event.Event(KEYUP, key=K_k, unicode='k', mod=0)]
+
+def runScript(oWidgetsList, handleEvent):
+    # Returns, for each event, the indexes of the widgets that returned True, and all widget states
+    resultsList = []
+    for event in getEvents():
+        triggeredList = handleEvent(event)
+        indexesList = [oWidgetsList.index(oWidget) for oWidget in triggeredList]
+        resultsList.append((event.type, indexesList, [getState(oWidget) for oWidget in oWidgetsList]))
+    return resultsList
+
+def recordCalls(oWidgetsList):
+    # Replaces handleEvent of each widget with one that records which widgets were called
+    calledList = []
+    for oWidget in oWidgetsList:
+        def recordingHandleEvent(event, oWidget=oWidget, originalHandleEvent=oWidget.handleEvent):
+            calledList.append(oWidget)
+            return originalHandleEvent(event)
+        oWidget.handleEvent = recordingHandleEvent
+    return calledList
+
+
+# 4 - Define the tests
+def testRoutedMatchesEveryWidget():
+    oPlainWidgetsList = buildWidgets('Plain group')
+    def handleEventOfEveryWidget(event):
+        return [oWidget for oWidget in oPlainWidgetsList if oWidget.handleEvent(event)]
+    plainResultsList = runScript(oPlainWidgetsList, handleEventOfEveryWidget)
+
+    oRoutedWidgetsList = buildWidgets('Routed group')
+    oRouter = pygwidgets.EventRouter()
+    oRouter.add(oRoutedWidgetsList)
+    routedResultsList = runScript(oRoutedWidgetsList, oRouter.handleEvent)
+
+    assert routedResultsList == plainResultsList
+    triggeredIndexesList = [indexesList for eventType, indexesList, statesList in routedResultsList if indexesList]
+    # The script does click both buttons, the check box and a radio button, and Return reaches both key listeners
+    assert triggeredIndexesList == [[0, 1], [3], [5], [2, 6]]
+
+def testEventsOnlyReachInterestedWidgets():
+    oWidgetsList = buildWidgets('Calls group')
+    oButton1, oButton2, oKeyedButton, oCheckBox, oRadio1, oRadio2, oInputText, oFarButton = oWidgetsList
+    oRouter = pygwidgets.EventRouter()
+    oRouter.add(oWidgetsList)
+    calledList = recordCalls(oWidgetsList)
+
+    oRouter.handleEvent(moveTo((30, 30)))
+    assert calledList == [oButton1]
+    del calledList[:]
+    oRouter.handleEvent(moveTo((300, 150)))
+    assert calledList == [oButton1]  # only to see the mouse leave
+    del calledList[:]
+    oRouter.handleEvent(moveTo((310, 150)))
+    assert calledList == []
+
+    # A widget clicked down on gets every mouse event until the mouse button comes up
+    oRouter.handleEvent(pygame.event.Event(MOUSEBUTTONDOWN, pos=(30, 30), button=1))
+    assert calledList == [oButton1, oKeyedButton, oInputText]  # key listeners see every mouse down
+    del calledList[:]
+    for pos in ((550, 410), (300, 150)):  # over the far away button, and off it again
+        oRouter.handleEvent(moveTo(pos, (1, 0, 0)))
+    assert calledList == [oButton1, oFarButton, oButton1, oFarButton]
+    del calledList[:]
+    oRouter.handleEvent(pygame.event.Event(MOUSEBUTTONUP, pos=(300, 150), button=1))
+    assert calledList == [oButton1]
+    del calledList[:]
+    oRouter.handleEvent(moveTo((310, 150)))
+    assert calledList == []
+
+    # Other events only go to the key listeners
+    for eventType in (KEYDOWN, KEYUP):
+        oRouter.handleEvent(pygame.event.Event(eventType, key=K_k, unicode='k', mod=0))
+    oRouter.handleEvent(pygame.event.Event(USEREVENT))
+    assert calledList == [oKeyedButton, oInputText] * 3
+
+    oRouter.remove(oInputText)
+    del calledList[:]
+    oRouter.handleEvent(pygame.event.Event(KEYDOWN, key=K_k, unicode='k', mod=0))
+    assert calledList == [oKeyedButton]
+
+def testButtonEventAtNewLocation():
+    # Events can be posted without a motion event first, so the mouse seems to jump
+    def getJumpEvents():
+        return [moveTo((110, 50)),  # over both buttons
+                pygame.event.Event(MOUSEBUTTONDOWN, pos=(30, 30), button=1),  # only on Button 1
+                pygame.event.Event(MOUSEBUTTONUP, pos=(30, 30), button=1),
+                moveTo((300, 150))]  # Button 2 must see the mouse leave
+
+    oPlainWidgetsList = buildWidgets('Plain jump group')
+    plainStatesList = []
+    for event in getJumpEvents():
+        for oWidget in oPlainWidgetsList:
+            oWidget.handleEvent(event)
+        plainStatesList.append([getState(oWidget) for oWidget in oPlainWidgetsList])
+
+    oRoutedWidgetsList = buildWidgets('Routed jump group')
+    oRouter = pygwidgets.EventRouter()
+    oRouter.add(oRoutedWidgetsList)
+    routedStatesList = []
+    for event in getJumpEvents():
+        oRouter.handleEvent(event)
+        routedStatesList.append([getState(oWidget) for oWidget in oRoutedWidgetsList])
+
+    assert routedStatesList == plainStatesList
+    assert routedStatesList[-1][1] == pygwidgets.PygWidgetsButton.STATE_IDLE
+    assert oRouter.hoveredList == []
+
+def testMovedWidgetsAreReindexed():
+    oWidgetsList = buildWidgets('Moved group')
+    oButton1 = oWidgetsList[0]
+    oRouter = pygwidgets.EventRouter(cellSize=32)
+    oRouter.add(oWidgetsList)
+
+    oButton1.setLoc((300, 400))
+    assert oRouter.getWidgetsAt((30, 30)) == []
+    assert oRouter.getWidgetsAt((310, 410)) == [oButton1]
+    oButton1.moveXY(-250, 0)
+    assert oRouter.getWidgetsAt((60, 410)) == [oButton1]
+    assert oRouter.getWidgetsAt((310, 410)) == []
+
+    # Clicking at the new location triggers the moved button, and nothing is left at the old one
+    clickList = [moveTo((60, 410)),
+                 pygame.event.Event(MOUSEBUTTONDOWN, pos=(60, 410), button=1),
+                 pygame.event.Event(MOUSEBUTTONUP, pos=(60, 410), button=1)]
+    assert [oRouter.handleEvent(event) for event in clickList] == [[], [], [oButton1]]
+
+    # A rect changed some other way is picked up by updateWidget
+    oButton1.rect.topleft = (500, 10)
+    oButton1.loc = (500, 10)
+    oRouter.updateWidget(oButton1)
+    assert oRouter.getWidgetsAt((510, 20)) == [oButton1]
+    assert oRouter.getWidgetsAt((60, 410)) == []
+
+    # Every widget is found in exactly the cells its rect covers
+    for oWidget in oWidgetsList:
+        for cell in oRouter.widgetCellsDict[oWidget]:
+            assert oWidget in oRouter.cellsDict[cell]
+    nEntries = sum(len(widgetsInCell) for widgetsInCell in oRouter.cellsDict.values())
+    assert nEntries == sum(len(cells) for cells in oRouter.widgetCellsDict.values())
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
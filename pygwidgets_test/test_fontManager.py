@@ -0,0 +1,141 @@
+#  Tests of the font manager (PygwidgetsFontManager)
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_fontManager
+
+# 1 - Import libraries
+import json
+import os
+import tempfile
+import threading
+import warnings
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+import pygwidgets
+from pygwidgets.pygwidgets import PygwidgetsFontManager
+
+
+# 2 - Define constants
+BLACK = (0, 0, 0)
+FONT_FILE_PATH = os.path.join(os.path.dirname(pygame.__file__), pygame.font.get_default_font())
+SYS_FONT_NAME = 'freesansbold'  # pygame's own font, always found as a system font
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([200, 200])
+
+
+# 4 - Define the tests
+def testLoadedFontMatchesPygameFont():
+    oFontManager = PygwidgetsFontManager()
+    for fontName in (None, FONT_FILE_PATH):
+        oFont = oFontManager.loadFont(fontName, 24)
+        oUncachedFont = pygame.font.Font(fontName, 24)
+        assert oFont.size('Hello') == oUncachedFont.size('Hello')
+        assert pygame.image.tobytes(oFont.render('Hello', True, BLACK), 'RGBA') == \
+               pygame.image.tobytes(oUncachedFont.render('Hello', True, BLACK), 'RGBA')
+
+def testFontNamesIgnoreCase():
+    oFontManager = pygwidgets.getFontManager()
+    oFont = oFontManager.loadFont('NoSuchFontAnywhere', 24)  # not found, so the default font is used
+    assert oFontManager.loadFont('nosuchfontanywhere', 24) is oFont
+    assert oFontManager.loadFont('NoSuchFontAnywhere', 25) is not oFont
+    loadSecondsDict = oFontManager.getStats()['loadSeconds']
+    assert 'nosuchfontanywhere_24' in loadSecondsDict
+    assert loadSecondsDict['nosuchfontanywhere_24'] >= 0
+
+def testWidgetsKeepFontsThatAreDiscarded():
+    oFontManager = PygwidgetsFontManager(maxFonts=2)
+    oFont20 = oFontManager.loadFont(None, 20)
+    for fontSize in range(21, 30):
+        oFontManager.loadFont(None, fontSize)
+        assert oFontManager.getStats()['loaded'] <= 2
+    assert oFont20.size('still usable')[0] > 0
+    assert oFontManager.loadFont(None, 20) is not oFont20  # loaded again
+    oFontManager.setMaxFonts(0)
+    assert oFontManager.getStats()['loaded'] == 0
+
+def testFontKeys():
+    oFontManager = PygwidgetsFontManager()
+    oFont = oFontManager.loadFont(None, 24)
+    assert oFontManager.getFontKey(oFont) == ('None_24', False, False, False)
+    oFont.set_italic(True)
+    assert oFontManager.getFontKey(oFont) == ('None_24', False, True, False)
+    oFont.set_italic(False)
+    oOtherFont = pygame.font.Font(None, 24)  # not loaded by the font manager
+    assert oFontManager.getFontKey(oOtherFont) is oOtherFont
+
+def testPreload():
+    oFontManager = PygwidgetsFontManager()
+    assert oFontManager.preload([(None, 30), (FONT_FILE_PATH, 31)]) is None
+    statsDict = oFontManager.getStats()
+    assert statsDict['loaded'] == 2
+    oFontManager.loadFont(None, 30)
+    assert oFontManager.getStats()['hits'] == statsDict['hits'] + 1
+
+def testBackgroundPreloadOnlyFindsSysFonts():
+    oFontManager = PygwidgetsFontManager()
+    oThread = oFontManager.preload([('NoSuchFontAnywhere', 20), (None, 20)], background=True)
+    oThread.join()
+    assert 'nosuchfontanywhere' in oFontManager._sysFontPathsDict
+    assert oFontManager.getStats()['loaded'] == 0  # fonts are loaded when they are first used
+
+def testSysFontNamesMatchSysFont():
+    oFontManager = PygwidgetsFontManager()
+    for fontName in (SYS_FONT_NAME, 'NoSuchFontAnywhere, ' + SYS_FONT_NAME):  # a list is tried in order
+        oFont = oFontManager.loadFont(fontName, 24)
+        oSysFont = pygame.font.SysFont(fontName, 24)
+        assert pygame.image.tobytes(oFont.render('Hello', True, BLACK), 'RGBA') == \
+               pygame.image.tobytes(oSysFont.render('Hello', True, BLACK), 'RGBA')
+    assert oFontManager._getSysFontPath('NoSuchFontAnywhere, ' + SYS_FONT_NAME) == \
+           pygame.font.match_font(SYS_FONT_NAME)
+
+def testMissingSysFontWarns():
+    oFontManager = PygwidgetsFontManager()
+    with warnings.catch_warnings(record=True) as warningsList:
+        warnings.simplefilter('always')
+        oFont = oFontManager.loadFont('NoSuchFontAnywhere', 20)
+        oFontManager.loadFont('NoSuchFontAnywhere', 21)  # already searched for, no second warning
+    assert len(warningsList) == 1
+    assert 'nosuchfontanywhere' in str(warningsList[0].message)
+    assert oFont.size('Hello') == pygame.font.Font(None, 20).size('Hello')
+
+def testLoadingDoesNotWaitForSysFontSearch():
+    oFontManager = PygwidgetsFontManager()
+    with oFontManager._sysFontLock:  # as if another thread were searching for system fonts
+        oSysFontThread = threading.Thread(target=oFontManager.loadFont, args=(SYS_FONT_NAME, 20))
+        oSysFontThread.start()
+        oSysFontThread.join(0.1)
+        assert oSysFontThread.is_alive()  # waiting for the search
+
+        # Fonts that are not system fonts are still loaded
+        oFileFontThread = threading.Thread(target=oFontManager.loadFont, args=(FONT_FILE_PATH, 20))
+        oFileFontThread.start()
+        oFileFontThread.join(5)
+        assert not oFileFontThread.is_alive()
+    oSysFontThread.join(5)
+    assert oFontManager.getStats()['loaded'] == 2
+
+def testSysFontCacheFile():
+    with tempfile.TemporaryDirectory() as tempDir:
+        cacheFilePath = os.path.join(tempDir, 'fontCache.json')
+        fontPath = os.path.join(tempDir, 'myfont.ttf')  # only needs to exist, it is not loaded
+        open(fontPath, 'w').close()
+        with open(cacheFilePath, 'w') as cacheFile:
+            json.dump({'myfont': fontPath, 'movedfont': os.path.join(tempDir, 'moved.ttf')}, cacheFile)
+        oFontManager = PygwidgetsFontManager()
+        oFontManager.setSysFontCacheFile(cacheFilePath)
+        assert oFontManager._getSysFontPath('MyFont') == fontPath  # found without searching
+
+        # A font file that is gone is searched for again, and fonts that are not found are not saved
+        assert oFontManager._getSysFontPath('MovedFont') is None
+        with open(cacheFilePath) as cacheFile:
+            assert json.load(cacheFile) == {'myfont': fontPath}
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
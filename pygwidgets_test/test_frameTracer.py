@@ -0,0 +1,138 @@
+#  Tests of FrameTracer, and the Chrome Trace Event files that it writes
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_frameTracer
+
+# 1 - Import libraries
+import json
+import os
+import tempfile
+import threading
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+import pygwidgets
+from pygwidgets.pygwidgets import PygwidgetsFontManager
+
+
+# 2 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([400, 200])
+
+
+# 3 - Define helper classes and functions
+class ManualClock():
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+def loadTrace(oTracer, lastSeconds=None):
+    with tempfile.TemporaryDirectory() as tempDir:
+        tracePath = os.path.join(tempDir, 'trace.json')
+        oTracer.dump(tracePath, lastSeconds)
+        with open(tracePath) as traceFile:
+            return json.load(traceFile)
+
+def getEventsNamed(traceDict, name):
+    return [traceEvent for traceEvent in traceDict['traceEvents'] if traceEvent['name'] == name]
+
+def waitForDumps():
+    for oThread in threading.enumerate():
+        if oThread.name == 'pygwidgets trace dump':
+            oThread.join()
+
+
+# 4 - Define the tests
+def testTraceFileFormat():
+    oClock = ManualClock()
+    oTextButton = pygwidgets.TextButton(window, (20, 20), 'Traced', nickname='traced')
+    oTracer = pygwidgets.FrameTracer(clock=oClock)
+    with oTracer:
+        oTracer.beginFrame()
+        oClock.now = 100.001
+        with oTracer.span('events'):
+            oTextButton.handleEvent(pygame.event.Event(pygame.USEREVENT))
+            oClock.now = 100.002
+        oTextButton.draw()
+        PygwidgetsFontManager().loadFont(None, 37)  # not in this new font manager, so it is loaded
+        oTracer.instant('checkpoint')
+        oClock.now = 100.010
+        oTracer.endFrame()
+    traceDict = loadTrace(oTracer)
+    assert traceDict['displayTimeUnit'] == 'ms'
+    traceEventsList = traceDict['traceEvents']
+    assert traceEventsList[0]['ph'] == 'M'
+    assert traceEventsList[0]['args'] == {'name': 'pygwidgets'}
+    for traceEvent in traceEventsList:
+        assert traceEvent['pid'] == os.getpid()
+
+    # Times are in microseconds, from when the tracer was created
+    [frameEvent] = getEventsNamed(traceDict, 'frame')
+    assert (frameEvent['ph'], frameEvent['cat']) == ('X', 'frame')
+    assert frameEvent['ts'] == 0
+    assert round(frameEvent['dur']) == 10000
+    [eventsSpan] = getEventsNamed(traceDict, 'events')
+    assert (round(eventsSpan['ts']), round(eventsSpan['dur'])) == (1000, 1000)
+    [handleEventSpan] = getEventsNamed(traceDict, 'TextButton.handleEvent')
+    assert handleEventSpan['cat'] == 'widget'
+    assert handleEventSpan['args'] == {'nickname': 'traced'}
+    assert len(getEventsNamed(traceDict, 'TextButton.draw')) == 1
+
+    [fontLoadEvent] = getEventsNamed(traceDict, 'font load')
+    assert (fontLoadEvent['ph'], fontLoadEvent['s']) == ('i', 't')
+    assert fontLoadEvent['args']['size'] == 37
+    assert len(getEventsNamed(traceDict, 'checkpoint')) == 1
+    threadNameEventsList = getEventsNamed(traceDict, 'thread_name')
+    assert [traceEvent['tid'] for traceEvent in threadNameEventsList] == [threading.get_ident()]
+
+    # Disabling the tracer puts back the original methods
+    assert not hasattr(pygwidgets.TextButton.draw, '__wrapped__')
+    assert not hasattr(pygame.display.update, '__wrapped__')
+
+def testRingBufferAndLastSeconds():
+    oClock = ManualClock()
+    oTracer = pygwidgets.FrameTracer(maxEvents=5, clock=oClock)
+    for markNumber in range(8):
+        oClock.now = 100 + markNumber
+        oTracer.instant('mark', argsDict={'number': markNumber})
+    traceDict = loadTrace(oTracer)
+    assert [traceEvent['args']['number'] for traceEvent in getEventsNamed(traceDict, 'mark')] == [3, 4, 5, 6, 7]
+    traceDict = loadTrace(oTracer, lastSeconds=1.5)
+    assert [traceEvent['args']['number'] for traceEvent in getEventsNamed(traceDict, 'mark')] == [6, 7]
+
+def testHitchesAreSaved():
+    oClock = ManualClock()
+    with tempfile.TemporaryDirectory() as tempDir:
+        hitchPath = os.path.join(tempDir, 'hitch{}.json')
+        oTracer = pygwidgets.FrameTracer(hitchMs=20, hitchPath=hitchPath, dumpSeconds=5, clock=oClock)
+        for frameMs in (10, 30, 10, 40, 10):
+            oTracer.beginFrame()
+            oClock.now = oClock.now + (frameMs / 1000)
+            assert round(oTracer.endFrame()) == frameMs
+            oClock.now = oClock.now + 1
+        waitForDumps()
+        assert oTracer.getNHitches() == 2
+        assert sorted(os.listdir(tempDir)) == ['hitch1.json']  # only one file for each dumpSeconds
+        with open(hitchPath.format(1)) as hitchFile:
+            traceDict = json.load(hitchFile)
+    assert len(getEventsNamed(traceDict, 'frame')) == 2
+    assert getEventsNamed(traceDict, 'hitch')[0]['args']['ms'] > 20
+
+def testOnlyOneEnabled():
+    with pygwidgets.FrameTracer():
+        try:
+            pygwidgets.WidgetProfiler().enable()
+        except ValueError:
+            pass
+        else:
+            assert False, 'ValueError not raised'
+    with pygwidgets.WidgetProfiler():
+        pass  # can be enabled once the tracer is disabled
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
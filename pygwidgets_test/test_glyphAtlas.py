@@ -0,0 +1,119 @@
+#  Tests of glyph atlases (PygwidgetsGlyphAtlas), and DisplayText with renderMode='atlas'
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_glyphAtlas
+
+# 1 - Import libraries
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+import pygwidgets
+from pygwidgets.pygwidgets import PygwidgetsFontManager, _PYGWIDGETS_FONT_MANAGER
+
+
+# 2 - Define constants
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+TEXTS_LIST = ['12345', 'Score: 1,234', 'AVAWAY To', 'fij ilj 00:59.99', 'x']
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([400, 200])
+
+
+# 4 - Define helper functions
+def getPixels(surface):
+    return surface.get_size(), pygame.image.tobytes(surface, 'RGBA')
+
+
+# 5 - Define the tests
+def testGlyphsMatchFontRender():
+    oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(None, 20)
+    oGlyphAtlas = _PYGWIDGETS_FONT_MANAGER.getGlyphAtlas(oFont, RED)
+    for character in '0A%g ':
+        assert getPixels(oGlyphAtlas.glyphsDict[character]) == getPixels(oFont.render(character, True, RED))
+
+def testLayoutMatchesFontSize():
+    for fontSize in (14, 20, 30, 41):
+        oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(None, fontSize)
+        oGlyphAtlas = _PYGWIDGETS_FONT_MANAGER.getGlyphAtlas(oFont, BLACK)
+        for text in TEXTS_LIST:
+            width, layoutList = oGlyphAtlas.getLayout(text)
+            assert width == oFont.size(text)[0]
+            assert len(layoutList) == len(text)
+            for index, (glyph, (x, y)) in enumerate(layoutList):
+                assert x == oFont.size(text[:index])[0]
+                assert y == 0
+
+def testCharactersAddedWhenFirstUsed():
+    oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(None, 20)
+    oGlyphAtlas = _PYGWIDGETS_FONT_MANAGER.getGlyphAtlas(oFont, BLACK)
+    assert 'é' not in oGlyphAtlas.glyphsDict
+    width, layoutList = oGlyphAtlas.getLayout('été')
+    assert width == oFont.size('été')[0]
+    assert len(layoutList) == 3
+    assert 'é' in oGlyphAtlas.glyphsDict
+    assert getPixels(oGlyphAtlas.glyphsDict['A']) == getPixels(oFont.render('A', True, BLACK))  # still there
+
+def testDisplayTextSameSizeAsSurfaceMode():
+    for justified in ('left', 'center', 'right'):
+        for text in TEXTS_LIST + ['two\nlines']:
+            oAtlasText = pygwidgets.DisplayText(window, (0, 0), text, fontSize=30,
+                                                justified=justified, renderMode='atlas')
+            oSurfaceText = pygwidgets.DisplayText(window, (0, 0), text, fontSize=30, justified=justified)
+            assert oAtlasText.getRect().size == oSurfaceText.getRect().size
+
+def testAtlasSharedByDisplayTexts():
+    oDisplayText1 = pygwidgets.DisplayText(window, (0, 0), '100', fontSize=26, renderMode='atlas')
+    oDisplayText2 = pygwidgets.DisplayText(window, (0, 50), '200', fontSize=26, renderMode='atlas')
+    oDisplayText3 = pygwidgets.DisplayText(window, (0, 100), '300', fontSize=26, textColor=RED, renderMode='atlas')
+    assert oDisplayText2.oGlyphAtlas is oDisplayText1.oGlyphAtlas
+    assert oDisplayText3.oGlyphAtlas is not oDisplayText1.oGlyphAtlas
+
+def testTextImagesReusedBySize():
+    oDisplayText = pygwidgets.DisplayText(window, (0, 0), '00:00', fontSize=26, renderMode='atlas',
+                                          width=100, backgroundColor=(255, 255, 255))
+    firstImage = oDisplayText.getTextImage()
+    for value in ('00:01', '59:59', '1:00:00'):
+        oDisplayText.setValue(value)
+        assert oDisplayText.getTextImage() is firstImage  # fixed width, so always the same size
+    assert firstImage.get_width() == 100
+
+    oAtlasText = pygwidgets.DisplayText(window, (0, 0), 'X', fontSize=26, renderMode='atlas')
+    for nCharacters in range(1, 20):
+        oAtlasText.setValue('X' * nCharacters)
+    assert len(oAtlasText.atlasImagesDict) <= pygwidgets.DisplayText.MAX_ATLAS_IMAGES
+
+def testBadRenderMode():
+    try:
+        pygwidgets.DisplayText(window, (0, 0), 'text', renderMode='glyphs')
+    except ValueError:
+        pass
+    else:
+        assert False, 'ValueError not raised'
+
+
+def testAtlasesAreLimitedAndKeyedByFontKey():
+    oFontManager = PygwidgetsFontManager(maxGlyphAtlases=2)
+    oFont = oFontManager.loadFont(None, 22)
+    oGlyphAtlas = oFontManager.getGlyphAtlas(oFont, BLACK)
+    assert oFontManager.getGlyphAtlas(oFont, list(BLACK)) is oGlyphAtlas
+
+    # The same font loaded again (a different font object) shares the atlas
+    oFontManager.setMaxFonts(0)
+    oFontManager.setMaxFonts(PygwidgetsFontManager.DEFAULT_MAX_FONTS)
+    oFontAgain = oFontManager.loadFont(None, 22)
+    assert oFontAgain is not oFont
+    assert oFontManager.getGlyphAtlas(oFontAgain, BLACK) is oGlyphAtlas
+
+    oFontManager.getGlyphAtlas(oFont, RED)
+    oFontManager.getGlyphAtlas(oFontManager.loadFont(None, 23), BLACK)  # discards the least recently used
+    assert len(oFontManager._glyphAtlasesLRU) == 2
+    assert oFontManager.getGlyphAtlas(oFont, BLACK) is not oGlyphAtlas
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
@@ -0,0 +1,133 @@
+#  Tests of the cache of images loaded from files (PygwidgetsImageCache)
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_imageCache
+
+# 1 - Import libraries
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+import pygwidgets
+from pygwidgets.pygwidgets import PygwidgetsImageCache
+
+
+# 2 - Define constants
+IMAGES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images')
+PNG_PATH = os.path.join(IMAGES_FOLDER, 'pythonIcon.png')
+JPG_PATH = os.path.join(IMAGES_FOLDER, 'imageUp.jpg')
+OTHER_JPG_PATH = os.path.join(IMAGES_FOLDER, 'imageDown.jpg')
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([200, 200])
+
+
+# 4 - Define helper functions
+def getPixels(image):
+    return image.get_size(), pygame.image.tobytes(image, 'RGBA')
+
+def getNBytes(path):
+    image = pygame.image.load(path).convert()
+    return image.get_pitch() * image.get_height()
+
+
+# 5 - Define the tests
+def testConvertModes():
+    oImageCache = PygwidgetsImageCache()
+    assert getPixels(oImageCache.loadImage(PNG_PATH)) == getPixels(pygame.image.load(PNG_PATH).convert_alpha())
+    assert getPixels(oImageCache.loadImage(JPG_PATH)) == getPixels(pygame.image.load(JPG_PATH).convert())
+    assert getPixels(oImageCache.loadImage(JPG_PATH, 'alpha')) == \
+           getPixels(pygame.image.load(JPG_PATH).convert_alpha())
+    assert oImageCache.loadImage(PNG_PATH, 'opaque').get_alpha() is None
+    assert oImageCache.loadImage(PNG_PATH, 'opaque') is not oImageCache.loadImage(PNG_PATH)
+    assert oImageCache.getStats()['entries'] == 4  # each convert mode is kept separately
+
+def testWidgetsShareImages():
+    oImage1 = pygwidgets.Image(window, (0, 0), PNG_PATH)
+    oImage2 = pygwidgets.Image(window, (50, 0), PNG_PATH)
+    assert oImage2.originalImage is oImage1.originalImage
+    oCustomButton = pygwidgets.CustomButton(window, (0, 50), PNG_PATH)
+    assert oCustomButton.surfaceUp is oImage1.originalImage
+    assert pygwidgets.getImageCache().loadImage(PNG_PATH) is oImage1.originalImage
+
+def testLoadImageReturnsACopy():
+    sharedImage = pygwidgets.getImageCache().loadImage(PNG_PATH)
+    sharedPixels = getPixels(sharedImage)
+    myImage = pygwidgets.loadImage(PNG_PATH)
+    assert myImage is not sharedImage
+    assert getPixels(myImage) == sharedPixels
+    myImage.fill((255, 0, 0))  # drawing into the copy does not change widgets that use the image
+    assert getPixels(sharedImage) == sharedPixels
+    assert pygwidgets.loadImage(PNG_PATH) is not myImage
+
+def testImageBiggerThanCacheIsKept():
+    oImageCache = PygwidgetsImageCache(maxBytes=16)
+    image = oImageCache.loadImage(PNG_PATH)
+    assert oImageCache.loadImage(PNG_PATH) is image  # the image just loaded is never discarded
+    jpgImage = oImageCache.loadImage(JPG_PATH)  # discards the first image
+    statsDict = oImageCache.getStats()
+    assert statsDict['entries'] == 1
+    assert statsDict['bytes'] == jpgImage.get_pitch() * jpgImage.get_height()
+
+def testScenes():
+    oImageCache = PygwidgetsImageCache()
+    oImageCache.setCurrentScene('level1')
+    oImageCache.loadImage(PNG_PATH)
+    oImageCache.loadImage(JPG_PATH)
+    oImageCache.setCurrentScene('level2')
+    oImageCache.loadImage(JPG_PATH)  # used by both scenes
+    oImageCache.setCurrentScene(None)
+    oImageCache.loadImage(JPG_PATH, 'alpha')  # not part of any scene
+    assert oImageCache.releaseScene('level1') == 1
+    assert oImageCache.getStats()['entries'] == 2
+    assert oImageCache.releaseScene('level2') == 1
+    assert oImageCache.getStats()['entries'] == 1
+    assert oImageCache.releaseScene('level2') == 0
+
+def testDiscardedImagesLeaveTheirScenes():
+    nBytes = getNBytes(JPG_PATH)
+    assert getNBytes(OTHER_JPG_PATH) == nBytes
+    oImageCache = PygwidgetsImageCache(maxBytes=nBytes)
+    oImageCache.setCurrentScene('level1')
+    oImageCache.loadImage(JPG_PATH)
+    oImageCache.setCurrentScene('level2')
+    oImageCache.loadImage(OTHER_JPG_PATH)  # discards the image of level1
+    assert oImageCache.getStats()['evictions'] == 1
+    assert oImageCache.releaseScene('level1') == 0
+    assert oImageCache.releaseScene('level2') == 1
+    assert oImageCache.scenesDict == {}
+    assert oImageCache.getStats()['bytes'] == 0
+
+def testSpriteSheetFrames():
+    oImageCache = PygwidgetsImageCache()
+    spriteSheetImage = oImageCache.loadImage(JPG_PATH)
+    width = spriteSheetImage.get_width() // 2
+    height = spriteSheetImage.get_height()
+    framesTuple = oImageCache.getSpriteSheetFrames(JPG_PATH, width, height, 2)
+    assert oImageCache.getSpriteSheetFrames(JPG_PATH, width, height, 2) is framesTuple
+    assert getPixels(framesTuple[1]) == getPixels(spriteSheetImage.subsurface((width, 0, width, height)))
+    assert oImageCache.getStats()['frameLists'] == 1
+
+    # Frames are discarded with their sprite sheet
+    oImageCache.setMaxBytes(0)
+    statsDict = oImageCache.getStats()
+    assert statsDict['entries'] == 0
+    assert statsDict['frameLists'] == 0
+
+def testMissingFile():
+    oImageCache = PygwidgetsImageCache()
+    try:
+        oImageCache.loadImage(os.path.join(IMAGES_FOLDER, 'noSuchImage.png'))
+    except FileNotFoundError:
+        pass
+    else:
+        assert False, 'FileNotFoundError not raised'
+    assert oImageCache.getStats()['entries'] == 0
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
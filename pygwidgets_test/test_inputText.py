@@ -0,0 +1,171 @@
+#  Tests of InputText cursor placement, using its table of prefix widths, and of scrolling InputText fields
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_inputText
+
+# 1 - Import libraries
+import os
+import random
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame.locals import *
+import pygwidgets
+
+
+# 2 - Define constants
+FIELD_LOC = (10, 10)
+FIELD_WIDTH = 200
+LONG_TEXT = 'A long line of text, WAVE To... ' * 10
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([640, 100])
+
+
+# 4 - Define helper functions
+def pressKey(oInputText, key, unicode=''):
+    oInputText.handleEvent(pygame.event.Event(KEYDOWN, key=key, unicode=unicode, mod=0))
+
+def typeText(oInputText, text):
+    for character in text:
+        pressKey(oInputText, ord(character), character)
+
+def click(oInputText, x):
+    oInputText.handleEvent(pygame.event.Event(MOUSEBUTTONDOWN, pos=(x, FIELD_LOC[1] + 5), button=1))
+
+def getExpectedCursorPosition(oFont, text, nPixelsFromLeft):
+    # The first character boundary at or after the click, found by measuring the text for every character
+    for charNum in range(0, len(text)):
+        if oFont.size(text[:charNum])[0] >= nPixelsFromLeft:
+            return charNum
+    return len(text)
+
+def checkScrollingField(oInputText):
+    # Checks that the chunks hold the text as shown, and that the cursor is in view
+    shownText = oInputText._getShownText(oInputText.getValue())
+    chunksList = oInputText.chunksList
+    assert ''.join(chunksList) == shownText
+    assert (chunksList == ['']) or ('' not in chunksList)
+    for chunkIndex, chunk in enumerate(chunksList):
+        assert len(chunk) <= (2 * pygwidgets.InputText.SCROLLING_CHUNK_SIZE)
+        assert oInputText.chunkWidthsList[chunkIndex] == oInputText.font.size(chunk)[0]
+        assert oInputText.chunkCharStartsList[chunkIndex] == len(''.join(chunksList[:chunkIndex]))
+    # Widths are measured one chunk at a time, so may be off by a pixel at each chunk boundary
+    for nChars in list(range(0, len(shownText) + 1, 13)) + [oInputText.cursorPosition]:
+        chunkIndex, offset = oInputText._locateChunk(nChars)
+        error = oInputText._getPrefixWidth(nChars) - oInputText.font.size(shownText[:nChars])[0]
+        assert abs(error) <= chunkIndex
+    cursorX = oInputText._getPrefixWidth(oInputText.cursorPosition) - oInputText.scrollOffset
+    assert 0 <= cursorX <= FIELD_WIDTH
+
+def checkPrefixWidths(oInputText, shownText):
+    for nChars in range(0, len(shownText) + 1):
+        assert oInputText._getPrefixWidth(nChars) == oInputText.font.size(shownText[:nChars])[0]
+
+
+# 5 - Define the tests
+def testPrefixWidthsFollowEdits():
+    oInputText = pygwidgets.InputText(window, FIELD_LOC, 'Hello', width=600)
+    oInputText.giveFocus()
+    checkPrefixWidths(oInputText, 'Hello')
+    typeText(oInputText, ' world')
+    checkPrefixWidths(oInputText, 'Hello world')
+    for key in (K_HOME, K_RIGHT, K_RIGHT):
+        pressKey(oInputText, key)
+    pressKey(oInputText, K_BACKSPACE)  # removes the 'e'
+    pressKey(oInputText, K_DELETE)  # removes the first 'l'
+    typeText(oInputText, 'WW')
+    assert oInputText.getValue() == 'HWWlo world'
+    checkPrefixWidths(oInputText, 'HWWlo world')
+    pressKey(oInputText, K_HOME)
+    pressKey(oInputText, K_BACKSPACE)  # nothing to remove
+    pressKey(oInputText, K_END)
+    pressKey(oInputText, K_DELETE)  # nothing to remove
+    assert oInputText.getValue() == 'HWWlo world'
+    oInputText.setValue('Replaced')
+    checkPrefixWidths(oInputText, 'Replaced')
+    oInputText.clearText(keepFocus=True)
+    checkPrefixWidths(oInputText, '')
+    typeText(oInputText, 'again')
+    checkPrefixWidths(oInputText, 'again')
+
+def testMaskedPrefixWidths():
+    oInputText = pygwidgets.InputText(window, FIELD_LOC, 'secret', width=600, mask='*')
+    checkPrefixWidths(oInputText, '******')
+
+def testClickPlacesCursor():
+    text = 'The quick brown fox, WWW iii'
+    oInputText = pygwidgets.InputText(window, FIELD_LOC, text, width=600)
+    click(oInputText, FIELD_LOC[0] + 1)  # the first click gives the field focus
+    assert oInputText.focus
+    textWidth = oInputText.font.size(text)[0]
+    for nPixelsFromLeft in range(0, textWidth + 20):
+        click(oInputText, FIELD_LOC[0] + nPixelsFromLeft)
+        expectedPosition = getExpectedCursorPosition(oInputText.font, text, nPixelsFromLeft)
+        assert oInputText.cursorPosition == expectedPosition, nPixelsFromLeft
+
+def testScrollingChunksFollowEdits():
+    random.seed(7)
+    for mask in (None, '*'):
+        oInputText = pygwidgets.InputText(window, FIELD_LOC, width=FIELD_WIDTH, scrolling=True, mask=mask)
+        oInputText.giveFocus()
+        typeText(oInputText, LONG_TEXT)
+        checkScrollingField(oInputText)
+        for editNumber in range(100):
+            key = random.choice([K_HOME, K_END, K_LEFT, K_RIGHT, K_RIGHT, K_BACKSPACE, K_DELETE, K_x])
+            if key == K_x:
+                typeText(oInputText, random.choice(['x', 'WW', 'y' * 150]))  # long pastes split chunks
+            elif key in (K_LEFT, K_RIGHT):
+                for keyNumber in range(random.randrange(1, 80)):
+                    pressKey(oInputText, key)
+            else:
+                pressKey(oInputText, key)
+            checkScrollingField(oInputText)
+        oInputText.setValue('short')
+        checkScrollingField(oInputText)
+        oInputText.clearText(keepFocus=True)
+        checkScrollingField(oInputText)
+
+def testScrollingShowsTextAroundCursor():
+    oInputText = pygwidgets.InputText(window, FIELD_LOC, width=FIELD_WIDTH, scrolling=True)
+    oInputText.giveFocus()
+    typeText(oInputText, LONG_TEXT)
+    textWidth = oInputText.font.size(LONG_TEXT)[0]
+    assert textWidth - FIELD_WIDTH - 2 <= oInputText.scrollOffset <= textWidth - FIELD_WIDTH + 2  # end in view
+    pressKey(oInputText, K_HOME)
+    assert oInputText.scrollOffset == 0
+
+    # Showing the start of the text looks the same as rendering all of the text
+    expectedImage = pygame.Surface(oInputText.textImage.get_size())
+    expectedImage.fill(pygwidgets.PYGWIDGETS_WHITE)
+    expectedImage.blit(oInputText.font.render(LONG_TEXT, True, pygwidgets.PYGWIDGETS_BLACK), (0, 0))
+    shownImage = pygame.Surface(oInputText.textImage.get_size())
+    shownImage.blit(oInputText.textImage, (0, 0))
+    assert pygame.image.tobytes(shownImage, 'RGB') == pygame.image.tobytes(expectedImage, 'RGB')
+
+def testClickInScrolledField():
+    oInputText = pygwidgets.InputText(window, FIELD_LOC, width=FIELD_WIDTH, scrolling=True)
+    oInputText.giveFocus()
+    typeText(oInputText, LONG_TEXT)
+    scrollOffset = oInputText.scrollOffset
+    for nPixelsFromLeft in range(0, FIELD_WIDTH, 7):
+        click(oInputText, FIELD_LOC[0] + nPixelsFromLeft)
+        assert oInputText.scrollOffset == scrollOffset  # the clicked position is already in view
+        cursorPosition = oInputText.cursorPosition
+        assert oInputText._getPrefixWidth(cursorPosition) >= nPixelsFromLeft + scrollOffset
+        assert oInputText._getPrefixWidth(cursorPosition - 1) < nPixelsFromLeft + scrollOffset
+
+def testNotScrolling():
+    oInputText = pygwidgets.InputText(window, FIELD_LOC, width=FIELD_WIDTH)
+    oInputText.giveFocus()
+    typeText(oInputText, LONG_TEXT)
+    assert oInputText.scrollOffset == 0
+    assert oInputText.getValue() == LONG_TEXT
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
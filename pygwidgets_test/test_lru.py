@@ -0,0 +1,63 @@
+#  Tests of _PygwidgetsLRU, the least recently used store that the caches are built on
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_lru
+
+# 1 - Import libraries
+from pygwidgets.pygwidgets import _PygwidgetsLRU
+
+
+# 2 - Define the tests
+def testEvictsLeastRecentlyUsed():
+    oLRU = _PygwidgetsLRU(maxEntries=2)
+    assert oLRU.add('a', 'value a') == []
+    oLRU.add('b', 'value b')
+    assert oLRU.get('a') == 'value a'  # 'b' is now the least recently used
+    assert oLRU.add('c', 'value c') == [('b', 'value b')]
+    assert oLRU.get('b') is None
+    assert ('a' in oLRU) and ('c' in oLRU)
+    assert len(oLRU) == 2
+    assert oLRU.getStats() == {'hits': 1, 'misses': 1, 'evictions': 1, 'entries': 2}
+
+    oLRU.add('a', 'new value a')  # replacing a value makes it the most recently used
+    assert oLRU.add('d', 'value d') == [('c', 'value c')]
+    assert oLRU.peek('a') == 'new value a'
+
+def testByteLimit():
+    oLRU = _PygwidgetsLRU(maxBytes=100)
+    oLRU.add('a', 'value a', 40)
+    oLRU.add('b', 'value b', 40)
+    assert oLRU.add('c', 'value c', 40) == [('a', 'value a')]
+    assert oLRU.nBytes == 80
+
+    # The value just added is kept, even if it is bigger than the whole cache
+    assert oLRU.add('big', 'big value', 500) == [('b', 'value b'), ('c', 'value c')]
+    assert oLRU.peek('big') == 'big value'
+    assert oLRU.nBytes == 500
+    assert oLRU.evict() == [('big', 'big value')]  # without a key to keep, it does not fit
+    assert oLRU.nBytes == 0
+
+def testPeekRemoveAndClear():
+    oLRU = _PygwidgetsLRU()
+    for key in range(10):
+        oLRU.add(key, str(key), 1)
+    assert len(oLRU) == 10  # no limits
+    assert oLRU.peek(3) == '3'
+    assert oLRU.peek(99) is None
+    assert oLRU.getStats()['hits'] == 0  # peek does not count
+    assert oLRU.getStats()['misses'] == 0
+    assert oLRU.remove(3) == '3'
+    assert 3 not in oLRU
+    assert oLRU.nBytes == 9
+    oLRU.get(4)
+    oLRU.clear()
+    assert len(oLRU) == 0
+    assert oLRU.nBytes == 0
+    assert oLRU.getStats()['hits'] == 1  # counts are kept
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
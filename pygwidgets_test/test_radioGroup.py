@@ -0,0 +1,134 @@
+#  Tests of groups of radio buttons (RadioGroup)
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_radioGroup
+
+# 1 - Import libraries
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame.locals import *
+import pygwidgets
+from pygwidgets.pygwidgets import PygWidgetsRadioButton
+
+
+# 2 - Define constants
+GROUPS_DICT = PygWidgetsRadioButton.__PygWidgets__Radio__Buttons__Groups__Dicts__
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([640, 200])
+
+
+# 4 - Define helper functions
+def makeRadioButtons(group, nButtons, selectedIndex=0):
+    radioButtonsList = []
+    for buttonIndex in range(nButtons):
+        oRadioButton = pygwidgets.TextRadioButton(window, (20 + buttonIndex * 100, 20), group,
+                                                  'Choice ' + str(buttonIndex), value=(buttonIndex == selectedIndex),
+                                                  nickname=buttonIndex)
+        radioButtonsList.append(oRadioButton)
+    return radioButtonsList
+
+def click(oRadioButton):
+    pos = oRadioButton.getRect().center
+    for eventType in (MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP):
+        oRadioButton.handleEvent(pygame.event.Event(eventType, pos=pos, button=1, buttons=(0, 0, 0), rel=(0, 0)))
+
+def getValues(radioButtonsList):
+    return [oRadioButton.getValue() for oRadioButton in radioButtonsList]
+
+
+# 5 - Define the tests
+def testOnlyOneButtonIsSelected():
+    radioButtonsList = makeRadioButtons('size', 4)
+    assert radioButtonsList[3].getSelectedRadioButton() == 0
+    click(radioButtonsList[2])
+    assert getValues(radioButtonsList) == [False, False, True, False]
+    assert radioButtonsList[0].getSelectedRadioButton() == 2
+    radioButtonsList[1].setSelectedRadioButton()
+    assert getValues(radioButtonsList) == [False, True, False, False]
+    radioButtonsList[3].setValue(True)
+    assert getValues(radioButtonsList) == [False, False, False, True]
+    assert radioButtonsList[0].getRadioGroup().getSelected() is radioButtonsList[3]
+
+    radioButtonsList[3].setValue(False)
+    try:
+        radioButtonsList[0].getSelectedRadioButton()
+    except RuntimeError:
+        pass
+    else:
+        assert False, 'RuntimeError not raised'
+
+def testNewSelectedButtonTurnsOffTheSelectedOne():
+    # On purpose: a radio button created with value=True becomes the selected one in its group
+    radioButtonsList = makeRadioButtons('speed', 3, selectedIndex=0)
+    oNewRadioButton = pygwidgets.TextRadioButton(window, (20, 100), 'speed', 'Fastest', value=True, nickname=3)
+    assert getValues(radioButtonsList) == [False, False, False]
+    assert oNewRadioButton.getValue()
+    assert radioButtonsList[0].getSelectedRadioButton() == 3
+
+def testGroupsAreSeparate():
+    colorsList = makeRadioButtons('color', 2)
+    shapesList = makeRadioButtons('shape', 2)
+    oColorGroup = colorsList[0].getRadioGroup()
+    assert colorsList[1].getRadioGroup() is oColorGroup
+    assert shapesList[0].getRadioGroup() is not oColorGroup
+    assert oColorGroup.getName() == 'color'
+    assert len(oColorGroup) == 2
+    click(colorsList[1])
+    assert getValues(shapesList) == [True, False]
+
+def testEnableAndDisableGroup():
+    radioButtonsList = makeRadioButtons('speed', 3)
+    radioButtonsList[0].disableGroup()
+    assert [oRadioButton.isEnabled for oRadioButton in radioButtonsList] == [False, False, False]
+    click(radioButtonsList[1])
+    assert getValues(radioButtonsList) == [True, False, False]
+    radioButtonsList[2].enableGroup()
+    assert [oRadioButton.isEnabled for oRadioButton in radioButtonsList] == [True, True, True]
+
+def testGroupGivenAsRadioGroup():
+    oRadioGroup = pygwidgets.RadioGroup('level')
+    radioButtonsList = makeRadioButtons(oRadioGroup, 3, selectedIndex=1)
+    assert radioButtonsList[0].getRadioGroup() is oRadioGroup
+    assert oRadioGroup.getSelected() is radioButtonsList[1]
+    assert set(oRadioGroup.getMembers()) == set(radioButtonsList)
+    oOtherRadioButton = pygwidgets.TextRadioButton(window, (20, 100), 'level', 'More')  # found by name
+    assert oOtherRadioButton.getRadioGroup() is oRadioGroup
+
+def testRadioGroupNameInUse():
+    radioButtonsList = makeRadioButtons('difficulty', 2)
+    try:
+        makeRadioButtons(pygwidgets.RadioGroup('difficulty'), 2)
+    except ValueError:
+        pass
+    else:
+        assert False, 'ValueError not raised'
+    assert GROUPS_DICT['difficulty'] is radioButtonsList[0].getRadioGroup()
+
+    # A group whose radio buttons are gone is replaced
+    oEmptyRadioGroup = pygwidgets.RadioGroup('mode')
+    GROUPS_DICT['mode'] = oEmptyRadioGroup
+    oRadioGroup = pygwidgets.RadioGroup('mode')
+    makeRadioButtons(oRadioGroup, 2)
+    assert GROUPS_DICT['mode'] is oRadioGroup
+
+def testGroupsGoAwayWithTheirButtons():
+    for sceneNumber in range(50):  # like building a new scene over and over
+        makeRadioButtons('scene', 5)
+    assert 'scene' not in GROUPS_DICT  # no radio buttons are left, so neither is the group
+
+    radioButtonsList = makeRadioButtons('kept', 3)
+    del radioButtonsList[2]
+    assert len(radioButtonsList[0].getRadioGroup()) == 2
+    radioButtonsList[0].removeGroup('kept')
+    assert 'kept' not in GROUPS_DICT
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
@@ -0,0 +1,151 @@
+#  Tests of widgets sharing their drawn surfaces (PygwidgetsSkinCache), and buildTextButtons
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_skinCache
+
+# 1 - Import libraries
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame.locals import *
+import pygwidgets
+
+
+# 2 - Define constants
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+UP_COLOR = (200, 0, 0)
+OVER_COLOR = (0, 200, 0)
+DOWN_COLOR = (0, 0, 200)
+BUTTON_OPTIONS_DICT = {'width': 120, 'height': 40, 'textColor': BLACK, 'upColor': UP_COLOR,
+                       'overColor': OVER_COLOR, 'downColor': DOWN_COLOR, 'fontSize': 20}
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([400, 200])
+
+
+# 4 - Define helper functions
+def getButtonSurfaces(oTextButton):
+    return (oTextButton.surfaceUp, oTextButton.surfaceOver, oTextButton.surfaceDown, oTextButton.surfaceDisabled)
+
+def getPixels(surface, rect=None):
+    if rect is not None:
+        surface = surface.subsurface(rect)
+    return surface.get_size(), pygame.image.tobytes(surface, 'RGBA')
+
+def sendMouseEvent(oTextButton, eventType, pos):
+    oTextButton.handleEvent(pygame.event.Event(eventType, pos=pos, button=1, buttons=(0, 0, 0), rel=(0, 0)))
+
+
+# 5 - Define the tests
+def testEachStateHasItsOwnSurface():
+    oTextButton = pygwidgets.TextButton(window, (20, 20), 'States', **BUTTON_OPTIONS_DICT)
+    surfaceUp, surfaceOver, surfaceDown, surfaceDisabled = getButtonSurfaces(oTextButton)
+    assert surfaceUp.get_at((4, 4))[:3] == UP_COLOR
+    assert surfaceOver.get_at((4, 4))[:3] == OVER_COLOR
+    assert surfaceDown.get_at((4, 4))[:3] == DOWN_COLOR
+    assert surfaceDisabled.get_at((4, 4))[:3] == pygwidgets.PYGWIDGETS_DISABLED_GRAY
+
+    # The button shows the shared surface for its state
+    assert oTextButton.getBlitInfo()[0] is surfaceUp
+    sendMouseEvent(oTextButton, MOUSEMOTION, (30, 30))
+    assert oTextButton.getBlitInfo()[0] is surfaceOver
+    sendMouseEvent(oTextButton, MOUSEBUTTONDOWN, (30, 30))
+    assert oTextButton.getBlitInfo()[0] is surfaceDown
+    sendMouseEvent(oTextButton, MOUSEBUTTONUP, (30, 30))
+    oTextButton.disable()
+    assert oTextButton.getBlitInfo()[0] is surfaceDisabled
+
+def testIdenticalButtonsShareSurfaces():
+    oTextButton1 = pygwidgets.TextButton(window, (20, 20), 'Same', **BUTTON_OPTIONS_DICT)
+    oTextButton2 = pygwidgets.TextButton(window, (20, 70), 'Same', **BUTTON_OPTIONS_DICT)
+    assert getButtonSurfaces(oTextButton2) == getButtonSurfaces(oTextButton1)
+    assert oTextButton2.font is oTextButton1.font
+
+    colorsAsListsDict = dict(BUTTON_OPTIONS_DICT, upColor=list(UP_COLOR), textColor=list(BLACK))
+    oTextButton3 = pygwidgets.TextButton(window, (20, 120), 'Same', **colorsAsListsDict)
+    assert oTextButton3.surfaceUp is oTextButton1.surfaceUp  # the same colors, given as lists
+
+    # Each button still has its own location and state
+    sendMouseEvent(oTextButton2, MOUSEMOTION, (30, 80))
+    assert oTextButton2.getBlitInfo()[0] is oTextButton1.surfaceOver
+    assert oTextButton2.getBlitInfo()[1] == (20, 70)
+    assert oTextButton1.getBlitInfo()[0] is oTextButton1.surfaceUp
+
+def testEveryOptionChangesTheSkin():
+    oTextButton = pygwidgets.TextButton(window, (0, 0), 'Options', **BUTTON_OPTIONS_DICT)
+    for optionName, value in (('width', 121), ('height', 41), ('textColor', WHITE), ('upColor', WHITE),
+                              ('overColor', WHITE), ('downColor', WHITE), ('fontSize', 21),
+                              ('enterToActivate', True)):
+        optionsDict = dict(BUTTON_OPTIONS_DICT)
+        optionsDict[optionName] = value
+        oOtherTextButton = pygwidgets.TextButton(window, (0, 0), 'Options', **optionsDict)
+        assert oOtherTextButton.surfaceUp is not oTextButton.surfaceUp, optionName
+    oOtherTextButton = pygwidgets.TextButton(window, (0, 0), 'Other text', **BUTTON_OPTIONS_DICT)
+    assert oOtherTextButton.surfaceUp is not oTextButton.surfaceUp
+
+    oEnterButton = pygwidgets.TextButton(window, (0, 0), 'Options', enterToActivate=True, **BUTTON_OPTIONS_DICT)
+    assert oEnterButton.surfaceUp.get_at((1, 1))[:3] == BLACK  # thicker border
+    assert oTextButton.surfaceUp.get_at((1, 1))[:3] == WHITE
+
+def testBuildTextButtons():
+    buttonsList = [((0, 0), '7'), ((50, 0), '8'), ((100, 0), '7', 'another7')]
+    textButtonsList = pygwidgets.buildTextButtons(window, buttonsList, width=40, fontSize=22)
+    assert [oTextButton.getRect().topleft for oTextButton in textButtonsList] == [(0, 0), (50, 0), (100, 0)]
+    assert textButtonsList[2].surfaceUp is textButtonsList[0].surfaceUp
+    assert textButtonsList[1].surfaceUp is not textButtonsList[0].surfaceUp
+    assert textButtonsList[2].nickname == 'another7'
+
+    # Buttons built one at a time find the same surfaces
+    oTextButton = pygwidgets.TextButton(window, (0, 50), '8', width=40, fontSize=22)
+    assert getButtonSurfaces(oTextButton) == getButtonSurfaces(textButtonsList[1])
+
+def testBuildTextButtonsCountsEachButtonOnce():
+    oSkinCache = pygwidgets.getSkinCache()
+    previousStatsDict = oSkinCache.getStats()
+    buttonsList = [((0, 0), '1'), ((50, 0), '2'), ((100, 0), '1', 'another1')]
+    textButtonsList = pygwidgets.buildTextButtons(window, buttonsList, width=40, fontSize=23,
+                                                  activationKeysList=[K_1, K_2])
+    statsDict = oSkinCache.getStats()
+    assert statsDict['misses'] == previousStatsDict['misses'] + 2
+    assert statsDict['hits'] == previousStatsDict['hits'] + 1
+    for oTextButton in textButtonsList:
+        assert oTextButton.activationKeysList == [K_1, K_2]
+
+def testBuildTextButtonsSameWidth():
+    textButtonsList = pygwidgets.buildTextButtons(window, [((0, 0), 'OK'), ((0, 50), 'A much longer label')],
+                                                  sameWidth=True)
+    oLongButton = pygwidgets.TextButton(window, (0, 100), 'A much longer label')
+    assert textButtonsList[0].getRect().width == oLongButton.getRect().width
+    assert textButtonsList[1].getRect().width == oLongButton.getRect().width
+
+
+def testCheckBoxesAndRadioButtonsShareSurfaces():
+    oTextCheckBox1 = pygwidgets.TextCheckBox(window, (20, 150), 'Check')
+    oTextCheckBox2 = pygwidgets.TextCheckBox(window, (120, 150), 'Check', value=False)
+    assert oTextCheckBox2.surfaceOn is oTextCheckBox1.surfaceOn
+    assert oTextCheckBox2.surfaceOffDisabled is oTextCheckBox1.surfaceOffDisabled
+    assert oTextCheckBox2.getValue() != oTextCheckBox1.getValue()  # the state is not shared
+
+    oOtherTextCheckBox = pygwidgets.TextCheckBox(window, (20, 150), 'Other label')
+    assert oOtherTextCheckBox.surfaceOn is not oTextCheckBox1.surfaceOn
+    boxRect = pygame.Rect(0, 0, 16, 16)  # the box is drawn from the same part, next to a different label
+    assert getPixels(oOtherTextCheckBox.surfaceOn, boxRect) == getPixels(oTextCheckBox1.surfaceOn, boxRect)
+
+    oTextRadioButton1 = pygwidgets.TextRadioButton(window, (20, 150), 'skinGroup1', 'Radio')
+    oTextRadioButton2 = pygwidgets.TextRadioButton(window, (20, 150), 'skinGroup2', 'Radio')
+    assert oTextRadioButton2.surfaceOff is oTextRadioButton1.surfaceOff
+
+def testCheckBoxWithoutText():
+    oTextCheckBox = pygwidgets.TextCheckBox(window, (20, 150), '', nickname='no label')
+    oTextCheckBox.disable()
+    oTextCheckBox.draw()
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
@@ -0,0 +1,82 @@
+#  Tests of the cache of sounds loaded from files (PygwidgetsSoundCache)
+#
+#  Runs without opening a visible window, or playing any sound:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_soundCache
+
+# 1 - Import libraries
+import json
+import os
+import tempfile
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+import pygame
+import pygwidgets
+from pygwidgets.pygwidgets import PygwidgetsSoundCache, _PYGWIDGETS_SOUND_CACHE
+
+
+# 2 - Define constants
+SOUNDS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sounds')
+BLIP_PATH = os.path.join(SOUNDS_FOLDER, 'blip.wav')
+COIN_PATH = os.path.join(SOUNDS_FOLDER, 'Coin.wav')
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([200, 200])
+
+
+# 4 - Define the tests
+def testWidgetsShareSounds():
+    _PYGWIDGETS_SOUND_CACHE.clear()
+    oTextButton1 = pygwidgets.TextButton(window, (0, 0), 'One', soundOnClick=BLIP_PATH)
+    oTextButton2 = pygwidgets.TextButton(window, (0, 50), 'Two', soundOnClick=BLIP_PATH)
+    oTextCheckBox = pygwidgets.TextCheckBox(window, (0, 100), 'Three', soundOnClick=BLIP_PATH)
+    oTextRadioButton = pygwidgets.TextRadioButton(window, (0, 150), 'soundGroup', 'Four', soundOnClick=BLIP_PATH)
+    oSoundEffect = pygwidgets.SoundEffect(BLIP_PATH)
+    oSound = oTextButton1.soundOnClick
+    for oSharingSound in (oTextButton2.soundOnClick, oTextCheckBox.soundOnClick,
+                          oTextRadioButton.soundOnClick, oSoundEffect.oSound):
+        assert oSharingSound is oSound
+    assert _PYGWIDGETS_SOUND_CACHE.getStats()['misses'] == 1  # decoded only once
+    assert oSound.get_raw() == pygame.mixer.Sound(BLIP_PATH).get_raw()
+
+    # The same file, reached by a different path, is the same sound
+    otherPath = os.path.join(SOUNDS_FOLDER, '..', 'sounds', 'blip.wav')
+    assert pygwidgets.TextButton(window, (0, 0), 'Five', soundOnClick=otherPath).soundOnClick is oSound
+    assert pygwidgets.TextButton(window, (0, 0), 'Six', soundOnClick=COIN_PATH).soundOnClick is not oSound
+
+    # Clearing the cache does not take the sound away from the widgets that use it
+    _PYGWIDGETS_SOUND_CACHE.clear()
+    assert oTextButton1.soundOnClick is oSound
+    assert pygwidgets.SoundEffect(BLIP_PATH).oSound is not oSound
+
+def testPreloadManifest():
+    with tempfile.TemporaryDirectory() as tempDir:
+        manifestPath = os.path.join(tempDir, 'manifest.json')
+        with open(manifestPath, 'w') as manifestFile:
+            json.dump([BLIP_PATH, COIN_PATH], manifestFile)
+        oSoundCache = PygwidgetsSoundCache()
+        assert oSoundCache.preload(manifestPath) is None
+        assert oSoundCache.getStats() == {'hits': 0, 'misses': 2, 'entries': 2}
+
+    oSoundCache = PygwidgetsSoundCache()
+    oThread = oSoundCache.preload([BLIP_PATH, COIN_PATH, BLIP_PATH], background=True)
+    oThread.join()
+    assert oSoundCache.getStats() == {'hits': 1, 'misses': 2, 'entries': 2}
+
+def testMissingFile():
+    oSoundCache = PygwidgetsSoundCache()
+    try:
+        oSoundCache.loadSound(os.path.join(SOUNDS_FOLDER, 'noSuchSound.wav'))
+    except FileNotFoundError:
+        pass
+    else:
+        assert False, 'FileNotFoundError not raised'
+    assert oSoundCache.getStats()['entries'] == 0
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
@@ -0,0 +1,120 @@
+#  Tests of SoundManager: limits on copies of a sound, minimum time between starts, and priorities
+#
+#  Runs without opening a visible window, or playing any sound:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_soundManager
+
+# 1 - Import libraries
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+import pygame
+import pygwidgets
+
+
+# 2 - Define constants
+SOUNDS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sounds')
+BLIP_PATH = os.path.join(SOUNDS_FOLDER, 'blip.wav')
+FOREVER = -1  # sounds are looped, so they are still playing when the test checks the channels
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([200, 200])
+
+
+# 4 - Define helper classes and functions
+class ManualClock():
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def makeSoundManager(nChannels, **kwargs):
+    oClock = ManualClock()
+    oSoundManager = pygwidgets.SoundManager(nChannels=nChannels, clock=oClock, **kwargs)
+    return oSoundManager, oClock
+
+def makeSounds(nSounds):
+    return [pygame.mixer.Sound(BLIP_PATH) for soundNumber in range(nSounds)]
+
+
+# 5 - Define the tests
+def testMaxInstancesRestartsTheOldestCopy():
+    oSoundManager, oClock = makeSoundManager(4, maxInstances=2)
+    oSound = makeSounds(1)[0]
+    channelsList = []
+    for startTime in (0, 1, 2):
+        oClock.now = startTime
+        channelsList.append(oSoundManager.play(oSound, loops=FOREVER))
+    assert channelsList[0] is not channelsList[1]
+    assert channelsList[2] is channelsList[0]  # the oldest copy was started again
+    assert oSoundManager.getNChannelsBusy() == 2
+    assert oSoundManager.play(oSound, loops=FOREVER, maxInstances=3) not in channelsList
+    assert oSoundManager.getStats()['stolen'] == 1
+    oSoundManager.stopAll()
+
+def testMinInterval():
+    oSoundManager, oClock = makeSoundManager(4, minInterval=.05)
+    oSound, oOtherSound = makeSounds(2)
+    assert oSoundManager.play(oSound, loops=FOREVER) is not None
+    oClock.now = .04
+    assert oSoundManager.play(oSound, loops=FOREVER) is None  # too soon
+    assert oSoundManager.play(oOtherSound, loops=FOREVER) is not None  # a different sound is fine
+    assert oSoundManager.play(oSound, loops=FOREVER, minInterval=.01) is not None
+    oClock.now = .1
+    assert oSoundManager.play(oSound, loops=FOREVER) is not None
+    statsDict = oSoundManager.getStats()
+    assert statsDict['rateLimited'] == 1
+    assert statsDict['played'] == 4
+    oSoundManager.stopAll()
+
+def testLowestPriorityIsStolen():
+    oSoundManager, oClock = makeSoundManager(2, minInterval=0)
+    oHighSound, oLowSound, oMiddleSound, oQuietSound, oLoudSound = makeSounds(5)
+    oHighChannel = oSoundManager.play(oHighSound, priority=5, loops=FOREVER)
+    oClock.now = 1
+    oLowChannel = oSoundManager.play(oLowSound, priority=1, loops=FOREVER)
+    oClock.now = 2
+    assert oSoundManager.play(oMiddleSound, priority=3, loops=FOREVER) is oLowChannel
+    assert oSoundManager.play(oQuietSound, priority=0, loops=FOREVER) is None  # nothing lower to stop
+    assert oSoundManager.play(oLoudSound, priority=5, loops=FOREVER) is oLowChannel  # priority 3 goes first
+    assert oHighChannel.get_sound() is oHighSound
+    assert oLowChannel.get_sound() is oLoudSound
+
+    oClock.now = 3
+    assert oSoundManager.play(oMiddleSound, priority=5, loops=FOREVER) is oHighChannel  # same priority, oldest
+    statsDict = oSoundManager.getStats()
+    assert statsDict['stolen'] == 3
+    assert statsDict['dropped'] == 1
+    assert statsDict['nChannels'] == 2
+    oSoundManager.stopAll()
+    assert oSoundManager.getNChannelsBusy() == 0
+
+def testSoundEffectsGoThroughTheManager():
+    oSoundManager, oClock = makeSoundManager(4, minInterval=.05)
+    oSoundEffect = pygwidgets.SoundEffect(BLIP_PATH, minInterval=0)
+    oTextButton = pygwidgets.TextButton(window, (20, 20), 'Click', soundOnClick=BLIP_PATH)
+    pygwidgets.setSoundManager(oSoundManager)
+    try:
+        assert pygwidgets.getSoundManager() is oSoundManager
+        oSoundEffect.play()
+        oSoundEffect.play()  # the sound effect has no minimum interval
+        for eventType in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            oTextButton.handleEvent(pygame.event.Event(eventType, pos=(30, 30), button=1,
+                                                       buttons=(0, 0, 0), rel=(0, 0)))
+        statsDict = oSoundManager.getStats()
+        assert statsDict['played'] == 2
+        assert statsDict['rateLimited'] == 1  # the click sound is the same sound as the effect
+    finally:
+        pygwidgets.setSoundManager(None)
+        oSoundManager.stopAll()
+    oSoundEffect.play()
+    assert oSoundManager.getStats()['played'] == 2
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
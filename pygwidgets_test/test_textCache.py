@@ -0,0 +1,114 @@
+#  Tests of the cache of rendered text (PygwidgetsTextCache)
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_textCache
+
+# 1 - Import libraries
+import gc
+import os
+import weakref
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+import pygwidgets
+from pygwidgets.pygwidgets import PygwidgetsTextCache, _PYGWIDGETS_FONT_MANAGER
+
+
+# 2 - Define constants
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+FONT_SIZE = 24
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([200, 200])
+
+
+# 4 - Define helper functions
+def getPixels(surface):
+    return surface.get_size(), pygame.image.tobytes(surface, 'RGBA')
+
+
+# 5 - Define the tests
+def testOutputMatchesFontRender():
+    oTextCache = PygwidgetsTextCache()
+    oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(None, FONT_SIZE)
+    for backgroundColor in (None, WHITE):
+        for antialias in (True, False):
+            cachedSurface = oTextCache.render(oFont, 'Hello 123', antialias, BLACK, backgroundColor)
+            if backgroundColor is None:
+                uncachedSurface = oFont.render('Hello 123', antialias, BLACK)
+            else:
+                uncachedSurface = oFont.render('Hello 123', antialias, BLACK, backgroundColor)
+            assert getPixels(cachedSurface) == getPixels(uncachedSurface)
+    assert oTextCache.getStats()['entries'] == 4  # antialias and background are part of the key
+
+def testColorsGivenDifferentWays():
+    oTextCache = PygwidgetsTextCache()
+    oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(None, FONT_SIZE)
+    surface = oTextCache.render(oFont, 'abc', True, BLACK)
+    assert oTextCache.render(oFont, 'abc', True, list(BLACK)) is surface  # same color, as a list
+    assert oTextCache.render(oFont, 'abc', True, BLACK, None) is surface
+    assert oTextCache.render(oFont, 'abc', True, BLACK, BLACK) is not surface
+    assert oTextCache.render(oFont, 'abc', True, WHITE) is not surface
+
+def testBytesAreCountedAndLimited():
+    oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(None, FONT_SIZE)
+    surface = oFont.render('A', True, BLACK)
+    nBytes = surface.get_pitch() * surface.get_height()
+    oTextCache = PygwidgetsTextCache(maxBytes=nBytes * 2)
+    oTextCache.render(oFont, 'A', True, BLACK)
+    assert oTextCache.getStats()['bytes'] == nBytes
+    for character in 'BCDEF':
+        oTextCache.render(oFont, character, True, BLACK)
+        statsDict = oTextCache.getStats()
+        assert statsDict['bytes'] <= statsDict['maxBytes']
+    oTextCache.setMaxBytes(0)
+    assert oTextCache.getStats()['entries'] == 0
+    assert oTextCache.getStats()['bytes'] == 0
+
+def testSurfaceBiggerThanCacheIsNotKept():
+    oTextCache = PygwidgetsTextCache(maxBytes=16)
+    oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(None, FONT_SIZE)
+    surface = oTextCache.render(oFont, 'Too big to keep', True, BLACK)
+    assert surface.get_width() > 0
+    statsDict = oTextCache.getStats()
+    assert statsDict['entries'] == 0
+    assert statsDict['bytes'] == 0
+
+def testWidgetsShareRenderedLines():
+    oTextCache = pygwidgets.getTextCache()
+    oDisplayText1 = pygwidgets.DisplayText(window, (0, 0), 'First line\nSecond line', fontSize=FONT_SIZE + 3)
+    nHits = oTextCache.getStats()['hits']
+    oDisplayText2 = pygwidgets.DisplayText(window, (0, 100), 'Second line\nFirst line', fontSize=FONT_SIZE + 3)
+    assert oTextCache.getStats()['hits'] == nHits + 2  # both lines were already rendered
+    assert oDisplayText2.getRect().size == oDisplayText1.getRect().size
+
+
+def testKeyedByFontKeyNotFontObject():
+    oTextCache = PygwidgetsTextCache()
+    oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(None, FONT_SIZE + 1)
+    firstSurface = oTextCache.render(oFont, 'key', True, BLACK)
+    fontRef = weakref.ref(oFont)
+
+    # Have the font manager discard the font, the text cache must not keep it alive
+    maxFonts = _PYGWIDGETS_FONT_MANAGER.maxFonts
+    _PYGWIDGETS_FONT_MANAGER.setMaxFonts(0)
+    _PYGWIDGETS_FONT_MANAGER.setMaxFonts(maxFonts)
+    del oFont
+    gc.collect()
+    assert fontRef() is None
+
+    # The same font loaded again finds the text rendered with the first font object
+    oFont = _PYGWIDGETS_FONT_MANAGER.loadFont(None, FONT_SIZE + 1)
+    assert oTextCache.render(oFont, 'key', True, BLACK) is firstSurface
+    oFont.set_bold(True)
+    assert oTextCache.render(oFont, 'key', True, BLACK) is not firstSurface
+    oFont.set_bold(False)
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
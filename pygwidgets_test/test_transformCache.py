@@ -0,0 +1,116 @@
+#  Tests of rotating, scaling, and flipping Image objects through a PygwidgetsTransformCache
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_transformCache
+
+# 1 - Import libraries
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+import pygwidgets
+
+
+# 2 - Define constants
+IMAGES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images')
+IMAGE_PATH = os.path.join(IMAGES_FOLDER, 'pythonIcon.png')
+OTHER_IMAGE_PATH = os.path.join(IMAGES_FOLDER, 'imageUp.jpg')
+
+
+# 3 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([200, 200])
+
+
+# 4 - Define helper functions
+def getPixels(image):
+    return image.get_size(), pygame.image.tobytes(image, 'RGBA')
+
+def getRotatedPixels(image, angle):
+    return getPixels(pygame.transform.rotate(image, -angle))
+
+
+# 5 - Define the tests
+def testGoingBackToAnAngleReusesTheImage():
+    oImage = pygwidgets.Image(window, (0, 0), IMAGE_PATH)
+    oImage.rotateTo(30)
+    image30 = oImage.image
+    assert getPixels(image30) == getRotatedPixels(oImage.originalImage, 30)
+    oImage.rotateTo(60)
+    oImage.rotate(-30)
+    assert oImage.image is image30
+    oImage.rotateTo(390)  # the same as 30 degrees
+    assert oImage.image is image30
+    oImage.rotateTo(360)
+    assert oImage.image is oImage.originalImage  # nothing to transform
+
+def testAngleStepRoundsToTheNearestStep():
+    oImage = pygwidgets.Image(window, (0, 0), IMAGE_PATH, angleStep=15)
+    oImage.rotateTo(7)
+    assert oImage.image is oImage.originalImage
+    oImage.rotateTo(8)
+    assert oImage.getAngle() == 8  # the angle asked for is remembered, only the drawing is rounded
+    assert getPixels(oImage.image) == getRotatedPixels(oImage.originalImage, 15)
+    image15 = oImage.image
+    for angle in (10, 12, 20, 22):
+        oImage.rotateTo(angle)
+        assert oImage.image is image15
+    oImage.rotateTo(353)
+    assert oImage.image is oImage.originalImage  # 360 is the same as 0
+    assert oImage.oTransformCache.getStats()['misses'] == 1  # only 15 degrees was made
+
+def testPrebakeRotations():
+    oImage = pygwidgets.Image(window, (0, 0), IMAGE_PATH, transformCacheSize=4)
+    oImage.prebakeRotations(36)
+    assert oImage.angleStep == 10
+    oTransformCache = oImage.oTransformCache
+    statsDict = oTransformCache.getStats()
+    assert statsDict['maxEntries'] == 37  # grown so that no prebaked rotation is discarded
+    assert statsDict['entries'] == 35  # 0 degrees is the original image
+    for angle in range(0, 720, 7):
+        oImage.rotateTo(angle)
+    assert oTransformCache.getStats()['misses'] == statsDict['misses']
+
+def testScaleAndFlipAreSeparateImages():
+    oImage = pygwidgets.Image(window, (0, 0), IMAGE_PATH)
+    oImage.rotateTo(90)
+    image90 = oImage.image
+    oImage.flipHorizontal()
+    flippedImage = oImage.image
+    assert flippedImage is not image90
+    assert getPixels(flippedImage) == getPixels(pygame.transform.flip(image90, True, False))
+    oImage.scale(50)
+    assert oImage.image.get_size() == (image90.get_width() // 2, image90.get_height() // 2)
+    oImage.scale(100)
+    assert oImage.image is flippedImage
+    oImage.flipHorizontal()
+    assert oImage.image is image90
+
+def testCacheCreatedWhenFirstNeeded():
+    oImage = pygwidgets.Image(window, (0, 0), IMAGE_PATH, transformCacheSize=3)
+    oImage.rotateTo(360)
+    oImage.scale(100)
+    assert oImage.oTransformCache is None  # nothing was transformed yet
+    oImage.rotateTo(30)
+    assert oImage.oTransformCache.getStats()['maxEntries'] == 3
+
+def testImagesShareACache():
+    oTransformCache = pygwidgets.PygwidgetsTransformCache(16)
+    oImage1 = pygwidgets.Image(window, (0, 0), IMAGE_PATH, oTransformCache=oTransformCache)
+    oImage2 = pygwidgets.Image(window, (50, 0), IMAGE_PATH, oTransformCache=oTransformCache)
+    oOtherImage = pygwidgets.Image(window, (100, 0), OTHER_IMAGE_PATH, oTransformCache=oTransformCache)
+    oImage1.rotateTo(45)
+    oImage2.rotateTo(45)
+    oOtherImage.rotateTo(45)
+    assert oImage2.image is oImage1.image  # made once for both
+    assert getPixels(oOtherImage.image) == getRotatedPixels(oOtherImage.originalImage, 45)
+
+    oUnsharedImage = pygwidgets.Image(window, (0, 0), IMAGE_PATH)
+    oUnsharedImage.rotateTo(45)
+    assert oUnsharedImage.image is not oImage1.image
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
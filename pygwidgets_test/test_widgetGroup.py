@@ -0,0 +1,206 @@
+#  Tests of WidgetGroup, comparing partial redraws with redrawing the whole window
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_widgetGroup
+
+# 1 - Import libraries
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame.locals import *
+import pygwidgets
+
+
+# 2 - Define constants
+WINDOW_WIDTH = 400
+WINDOW_HEIGHT = 300
+BACKGROUND_COLOR = (0, 90, 120)
+IMAGES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images')
+IMAGE_PATH = os.path.join(IMAGES_FOLDER, 'pythonIcon.png')
+
+
+# 3 - Initialize the world
+pygame.init()
+pygame.display.set_mode([WINDOW_WIDTH, WINDOW_HEIGHT])
+# Draw into a surface of our own, because other tests can change the size of the display
+window = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+
+# 4 - Define helper functions
+def buildWidgets():
+    return [pygwidgets.TextButton(window, (20, 20), 'Button'),
+            pygwidgets.TextCheckBox(window, (20, 100), 'Check'),
+            pygwidgets.DisplayText(window, (200, 20), 'Score: 0', fontSize=30),
+            pygwidgets.Image(window, (150, 150), IMAGE_PATH),
+            pygwidgets.DisplayText(window, (160, 160), 'On top', fontSize=24)]  # overlaps the image
+
+def drawEverything(oWidgetsList):
+    # What the window should look like: the background, then every widget
+    surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    surface.fill(BACKGROUND_COLOR)
+    window.blit(surface, (0, 0))
+    for oWidget in oWidgetsList:
+        oWidget.draw()
+    return window.copy()
+
+def getChangedPoints(surface1, surface2):
+    # Returns a list of all points whose color differs between two surfaces
+    bytes1 = pygame.image.tobytes(surface1, 'RGB')
+    bytes2 = pygame.image.tobytes(surface2, 'RGB')
+    rowLength = WINDOW_WIDTH * 3
+    changedList = []
+    for y in range(0, WINDOW_HEIGHT):
+        start = y * rowLength
+        if bytes1[start:start + rowLength] == bytes2[start:start + rowLength]:
+            continue
+        for x in range(0, WINDOW_WIDTH):
+            if bytes1[start + (x * 3):start + (x * 3) + 3] != bytes2[start + (x * 3):start + (x * 3) + 3]:
+                changedList.append((x, y))
+    return changedList
+
+def getChanges():
+    # Each function makes one change to the widgets, like a frame of a program would
+    def rollOver(oWidgetsList):
+        oWidgetsList[0].handleEvent(pygame.event.Event(MOUSEMOTION, pos=(30, 30), rel=(0, 0), buttons=(0, 0, 0)))
+    def rollOff(oWidgetsList):
+        oWidgetsList[0].handleEvent(pygame.event.Event(MOUSEMOTION, pos=(390, 290), rel=(0, 0), buttons=(0, 0, 0)))
+    def setValue(oWidgetsList):
+        oWidgetsList[2].setValue('Score: 1000000')  # wider than before
+    def setShorterValue(oWidgetsList):
+        oWidgetsList[2].setValue('Score: 5')
+    def toggleCheckBox(oWidgetsList):
+        oWidgetsList[1].toggleValue()
+    def moveImage(oWidgetsList):
+        oWidgetsList[3].moveXY(30, -40)  # under the text, and away from its old area
+    def hideText(oWidgetsList):
+        oWidgetsList[4].hide()
+    def showText(oWidgetsList):
+        oWidgetsList[4].show()
+    def nothing(oWidgetsList):
+        pass
+    return [rollOver, rollOff, setValue, setShorterValue, toggleCheckBox, moveImage, hideText, nothing, showText]
+
+
+# 5 - Define the tests
+def testDrawDirtyMatchesFullRedraw():
+    oWidgetsList = buildWidgets()
+    window.fill(BACKGROUND_COLOR)
+    oWidgetGroup = pygwidgets.WidgetGroup(window)
+    oWidgetGroup.add(oWidgetsList)
+    assert oWidgetGroup.drawDirty() == [window.get_rect()]  # everything is drawn the first time
+
+    for change in getChanges():
+        previousWindow = window.copy()
+        change(oWidgetsList)
+        rectsList = oWidgetGroup.drawDirty()
+        drawnWindow = window.copy()
+
+        # The window looks the same as if everything had been drawn
+        assert getChangedPoints(drawnWindow, drawEverything(oWidgetsList)) == [], change.__name__
+
+        # Every changed point is inside one of the returned rects
+        for point in getChangedPoints(previousWindow, drawnWindow):
+            assert any(rect.collidepoint(point) for rect in rectsList), change.__name__
+        window.blit(drawnWindow, (0, 0))
+        if change.__name__ == 'nothing':
+            assert rectsList == []
+
+def testRemovedWidgetIsErased():
+    oWidgetsList = buildWidgets()
+    window.fill(BACKGROUND_COLOR)
+    oWidgetGroup = pygwidgets.WidgetGroup(window, BACKGROUND_COLOR)
+    oWidgetGroup.add(oWidgetsList)
+    oWidgetGroup.drawDirty()
+
+    oRemovedWidget = oWidgetsList.pop(3)
+    oWidgetGroup.remove(oRemovedWidget)
+    rectsList = oWidgetGroup.drawDirty()
+    assert rectsList == [oRemovedWidget.getRect()]
+    assert getChangedPoints(window.copy(), drawEverything(oWidgetsList)) == []
+
+def testReturnedRectsAreMergedAndClipped():
+    window.fill(BACKGROUND_COLOR)
+    oDisplayText = pygwidgets.DisplayText(window, (WINDOW_WIDTH - 20, 10), 'Partly off the window')
+    oWidgetGroup = pygwidgets.WidgetGroup(window)
+    oWidgetGroup.add(oDisplayText)
+    oWidgetGroup.drawDirty()
+
+    oDisplayText.moveX(5)  # the old and new areas overlap, so they become one rect
+    rectsList = oWidgetGroup.drawDirty()
+    assert len(rectsList) == 1
+    assert window.get_rect().contains(rectsList[0])
+    assert rectsList[0].right == WINDOW_WIDTH
+
+
+def buildEveryKindOfWidget():
+    def imagePath(fileName):
+        return os.path.join(IMAGES_FOLDER, fileName)
+    oDisabledButton = pygwidgets.TextButton(window, (120, 10), 'Disabled')
+    oDisabledButton.disable()
+    oHiddenText = pygwidgets.DisplayText(window, (10, 10), 'Hidden')
+    oHiddenText.hide()
+    oArmedButton = pygwidgets.TextButton(window, (10, 240), 'Armed')
+    for event in (pygame.event.Event(MOUSEMOTION, pos=(15, 245), rel=(0, 0), buttons=(0, 0, 0)),
+                  pygame.event.Event(MOUSEBUTTONDOWN, pos=(15, 245), button=1)):
+        oArmedButton.handleEvent(event)
+    return [pygwidgets.TextButton(window, (10, 10), 'Button'),
+            oDisabledButton,
+            oHiddenText,
+            pygwidgets.CustomButton(window, (230, 10), imagePath('restartButtonUp.png')),
+            pygwidgets.TextCheckBox(window, (10, 60), 'Check'),
+            pygwidgets.CustomCheckBox(window, (150, 60), on=imagePath('checkBoxOn.png'), off=imagePath('checkBoxOff.png')),
+            pygwidgets.TextRadioButton(window, (10, 90), 'Blits group', 'Radio', value=True),
+            pygwidgets.DisplayText(window, (10, 120), 'Some text', backgroundColor=(255, 255, 0)),
+            pygwidgets.InputText(window, (10, 150), 'Typed text'),  # draws itself
+            pygwidgets.Dragger(window, (200, 150), imagePath('dragMeUp.png')),
+            pygwidgets.Image(window, (250, 100), IMAGE_PATH),
+            pygwidgets.Animation(window, (300, 200), [(imagePath('imageUp.jpg'), .1), (imagePath('imageDown.jpg'), .1)]),
+            oArmedButton]
+
+def testGetBlitInfoMatchesDraw():
+    for oWidget in buildEveryKindOfWidget():
+        blitInfo = oWidget.getBlitInfo()
+        if blitInfo is None:
+            assert isinstance(oWidget, pygwidgets.InputText)
+            continue
+        window.fill(BACKGROUND_COLOR)
+        oWidget.draw()
+        drawnWindow = window.copy()
+        window.fill(BACKGROUND_COLOR)
+        if oWidget.getVisible():
+            window.blits([blitInfo])
+        assert getChangedPoints(window, drawnWindow) == [], type(oWidget).__name__
+
+def testDrawMatchesDrawingEachWidget():
+    for batchBlits in (False, True):
+        oWidgetsList = buildEveryKindOfWidget()
+        oWidgetGroup = pygwidgets.WidgetGroup(window, batchBlits=batchBlits)
+        oWidgetGroup.add(oWidgetsList)
+        window.fill(BACKGROUND_COLOR)
+        oWidgetGroup.draw()
+        groupWindow = window.copy()
+        assert getChangedPoints(groupWindow, drawEverything(oWidgetsList)) == [], batchBlits
+
+def testBlitsAreOnlyBatchedWhenAskedFor():
+    oWidgetsList = buildEveryKindOfWidget()
+    askedList = []
+    for oWidget in oWidgetsList:
+        def recordingGetBlitInfo(oWidget=oWidget, originalGetBlitInfo=oWidget.getBlitInfo):
+            askedList.append(oWidget)
+            return originalGetBlitInfo()
+        oWidget.getBlitInfo = recordingGetBlitInfo
+    oWidgetGroup = pygwidgets.WidgetGroup(window, BACKGROUND_COLOR)
+    oWidgetGroup.add(oWidgetsList)
+    oWidgetGroup.draw()
+    oWidgetGroup.drawDirty()
+    assert askedList == []
+    oBatchedGroup = pygwidgets.WidgetGroup(window, BACKGROUND_COLOR, batchBlits=True)
+    oBatchedGroup.add(oWidgetsList)
+    oBatchedGroup.draw()
+    assert askedList == [oWidget for oWidget in oWidgetsList if oWidget.getVisible()]
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')
@@ -0,0 +1,64 @@
+#  Tests of WidgetProfiler
+#
+#  Runs without opening a visible window:   python -m pytest pygwidgets_test
+#  or:   python -m pygwidgets_test.test_widgetProfiler
+
+# 1 - Import libraries
+import gc
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+import pygwidgets
+
+
+# 2 - Initialize the world
+pygame.init()
+window = pygame.display.set_mode([400, 200])
+
+
+# 3 - Define the tests
+def testRecordsCallsAndBlits():
+    oTextButton = pygwidgets.TextButton(window, (0, 0), 'Profiled', nickname='profiled')
+    with pygwidgets.WidgetProfiler() as oProfiler:
+        for frameNumber in range(3):
+            oTextButton.draw()
+            oProfiler.markFrame()
+    snapshot = oProfiler.getSnapshot()
+    assert snapshot['nFrames'] == 3
+    widgetDict = snapshot['widgets'][0]
+    assert (widgetDict['className'], widgetDict['nickname']) == ('TextButton', 'profiled')
+    assert widgetDict['methods']['draw']['calls'] == 3
+    assert widgetDict['nBlits'] == 3
+    assert widgetDict['blitArea'] == 3 * oTextButton.getRect().width * oTextButton.getRect().height
+    assert pygwidgets.TextButton.draw.__name__ == 'draw'
+    assert not hasattr(pygwidgets.TextButton.draw, '__wrapped__')  # original method put back
+
+def testDeletedWidgetsAreNotKeptOrReused():
+    with pygwidgets.WidgetProfiler() as oProfiler:
+        for widgetNumber in range(50):
+            oDisplayText = pygwidgets.DisplayText(window, (0, 0), 'text', nickname='old')
+            oDisplayText.draw()
+            del oDisplayText
+        gc.collect()
+        assert len(oProfiler.widgetStatsDict) == 0  # the profiler keeps no statistics of deleted widgets
+
+        # A new widget (which may get the id of a deleted one) starts with its own statistics
+        oDisplayText = pygwidgets.DisplayText(window, (0, 0), 'text', nickname='new')
+        oDisplayText.draw()
+    snapshot = oProfiler.getSnapshot()
+    assert len(snapshot['widgets']) == 1
+    widgetDict = snapshot['widgets'][0]
+    assert widgetDict['nickname'] == 'new'
+    assert widgetDict['methods']['draw']['calls'] == 1
+
+    # Deleted widgets are still counted in the totals for their class
+    classStats = snapshot['classes']['DisplayText']
+    assert classStats['nWidgets'] == 51
+    assert classStats['nBlits'] == 51
+
+
+if __name__ == '__main__':
+    for testName, testFunction in list(globals().items()):
+        if testName.startswith('test') and callable(testFunction):
+            testFunction()
+            print(testName, 'passed')